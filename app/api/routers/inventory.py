@@ -1,42 +1,207 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import hashlib
+from datetime import date, datetime
 
-from app.db.models import InventoryItem
-from app.db.session import get_db
-from app.schemas.inventory import InventoryCreateRequest, InventoryItemOut
-from app.services.inventory_service import InventoryService
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import fast_json_response
+from app.db.session import get_async_db, get_async_write_db
+from app.db.shards import HOUSEHOLD_HEADER
+from app.schemas.inventory import (
+    ExpiringInventoryResponse,
+    InventoryCreateRequest,
+    InventoryImportSummary,
+    InventoryItemOut,
+)
+from app.services.inventory_import import (
+    MAX_IMPORT_CHUNK_SIZE,
+    InventoryImportError,
+    get_import_chunk_size,
+    import_format_for,
+    import_records,
+    parse_records,
+)
+from app.services.inventory_service import (
+    AsyncInventoryService,
+    InvalidCursorError,
+    InventoryFilters,
+)
+from app.services.inventory_version import database_key
+from app.services.scoring import URGENCY_BUCKETS, urgency_points
 
 
 router = APIRouter(prefix="/api/v1/inventory", tags=["inventory"])
 
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_ITEMS_ADAPTER = TypeAdapter(list[InventoryItemOut])
+_EXPIRING_ADAPTER = TypeAdapter(ExpiringInventoryResponse)
+
+
+def inventory_etag(version: int, database: str, request: Request) -> str:
+    """
+    Strong ETag for one listing: the inventory version, the database it
+    counts in (each household database starts its own count at 1) and the
+    query, since each filter/page combination is a different representation.
+    """
+    query = sorted(request.query_params.multi_items())
+    digest = hashlib.sha1(repr((database, query)).encode("utf-8")).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix still matches.
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
 
 @router.post("", response_model=list[InventoryItemOut])
-def create_inventory_items(
+async def create_inventory_items(
     payload: InventoryCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_write_db),
 ) -> list[InventoryItemOut]:
-    service = InventoryService(db)
-    items = service.add_items(
+    service = AsyncInventoryService(db)
+    items = await service.add_items(
         [{"name": item.name, "quantity": item.quantity} for item in payload.items]
     )
     return items
 
 
+@router.post("/import", response_model=InventoryImportSummary)
+async def import_inventory_items(
+    request: Request,
+    chunk_size: int | None = Query(None, ge=1, le=MAX_IMPORT_CHUNK_SIZE),
+    db: AsyncSession = Depends(get_async_write_db),
+) -> InventoryImportSummary:
+    """
+    Stream NDJSON or CSV rows into inventory, committing every `chunk_size` rows.
+    Chunks committed before a bad row are kept; the error reports how many.
+    """
+    import_format = import_format_for(request.headers.get("content-type"))
+    if import_format is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Expected application/x-ndjson or text/csv",
+        )
+
+    service = AsyncInventoryService(db)
+
+    try:
+        return await import_records(
+            parse_records(request.stream(), import_format),
+            service.add_items,
+            chunk_size or get_import_chunk_size(),
+        )
+    except InventoryImportError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": e.message,
+                "line": e.line,
+                "rows_committed": e.rows_committed,
+            },
+        ) from e
+
+
 @router.get("", response_model=list[InventoryItemOut])
-def list_inventory_items(
-    db: Session = Depends(get_db),
-) -> list[InventoryItemOut]:
-    items = db.query(InventoryItem).all()
-    return items
+async def list_inventory_items(
+    request: Request,
+    location: str | None = None,
+    category: str | None = None,
+    expired_flag: bool | None = None,
+    is_staple: bool | None = None,
+    expires_before: date | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    List inventory in insertion order. With `limit`, the response is
+    one page and `X-Next-Cursor` carries the cursor for the next one.
+    Rows are encoded directly; `response_model` still documents the shape.
+
+    The ETag changes whenever the inventory version does, so a matching
+    If-None-Match is answered with 304 before any row is read. The version
+    is read first: a write landing before the rows are read only makes the
+    ETag older than the body, which costs the client one extra 200 later.
+    """
+    filters = InventoryFilters(
+        location=location,
+        category=category,
+        expired_flag=expired_flag,
+        is_staple=is_staple,
+        expires_before=expires_before,
+    )
+    service = AsyncInventoryService(db)
+    etag = inventory_etag(await service.inventory_version(), database_key(db), request)
+    # The household header picks the database, so caches must key on it.
+    headers = {"ETag": etag, "Vary": HOUSEHOLD_HEADER}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        rows, next_cursor = await service.list_item_rows(filters, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if next_cursor is not None:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return fast_json_response(
+        rows,
+        _ITEMS_ADAPTER,
+        floats=(row["quantity"] for row in rows),
+        headers=headers,
+    )
+
+
+@router.get("/expiring", response_model=ExpiringInventoryResponse)
+async def list_expiring_inventory_items(
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Items that earn urgency points in scoring, bucketed by the
+    `urgency_points` day ranges. Days are counted from the same UTC date
+    mealplan generation uses, so the buckets agree with scoring.
+    """
+    today = datetime.utcnow().date()
+    service = AsyncInventoryService(db)
+    expiring = await service.list_expiring(today, within_days=URGENCY_BUCKETS[-1][1])
+
+    buckets = [
+        {
+            "urgency_points": urgency_points(min_days),
+            "min_days": min_days,
+            "max_days": max_days,
+            "items": [],
+        }
+        for min_days, max_days in URGENCY_BUCKETS
+    ]
+    for days, row in expiring:
+        # Rows arrive soonest first, so each bucket stays in expiry order.
+        for bucket in buckets:
+            if days <= bucket["max_days"]:
+                bucket["items"].append(row)
+                break
+
+    return fast_json_response(
+        {"today": today, "buckets": buckets},
+        _EXPIRING_ADAPTER,
+        floats=(row["quantity"] for _, row in expiring),
+    )
 
 
 @router.delete("/{item_id}", status_code=204)
-def delete_inventory_item(
+async def delete_inventory_item(
     item_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
-    service = InventoryService(db)
-    service.delete_item(item_id)
+    service = AsyncInventoryService(db)
+    await service.delete_item(item_id)
 
@@ -2,37 +2,82 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Body, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.api.responses import fast_json_response
+from app.db.session import get_async_db
+from app.db.shards import get_shard_router
 from app.schemas.mealplan import (
+    MealplanBatchRequest,
     MealplanGenerateRequest,
     MealplanGenerateResponse,
 )
-from app.services.mealplan_service import generate_mealplan
-from app.services.recipe_provider import StubRecipeProvider
+from app.services.mealplan_batch import fetch_recipe_pool, generate_mealplan_batch
+from app.services.mealplan_cache import get_mealplan_cache
+from app.services.mealplan_service import generate_mealplan_async
+from app.services.provider_factory import get_recipe_provider
+from app.services.recipe_provider import RecipeProvider
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/mealplan", tags=["mealplan"])
 
+_RESPONSE_ADAPTER = TypeAdapter(MealplanGenerateResponse)
+
 
 @router.post("/generate", response_model=MealplanGenerateResponse)
-def post_generate_mealplan(
+async def post_generate_mealplan(
     payload: MealplanGenerateRequest | None = Body(None),
-    db: Session = Depends(get_db),
-) -> MealplanGenerateResponse | JSONResponse:
-    provider = StubRecipeProvider()
+    db: AsyncSession = Depends(get_async_db),
+    provider: RecipeProvider = Depends(get_recipe_provider),
+) -> Response:
     try:
-        visible, candidate_pool_size = generate_mealplan(db, provider)
+        visible, candidate_pool_size = await generate_mealplan_async(
+            db,
+            provider,
+            preferences=payload.preferences if payload is not None else None,
+            cache=get_mealplan_cache(),
+        )
     except Exception as e:
         logger.warning("Recipe provider failed: %s", e, exc_info=True)
         return JSONResponse(
             status_code=503,
             content={"error": "recipe_provider_unavailable"},
         )
-    return MealplanGenerateResponse(
-        visible_candidates=visible,
-        candidate_pool_size=candidate_pool_size,
+    return fast_json_response(
+        {
+            "visible_candidates": [recipe.model_dump() for recipe in visible],
+            "candidate_pool_size": candidate_pool_size,
+        },
+        _RESPONSE_ADAPTER,
+        floats=(i.amount for recipe in visible for i in recipe.ingredients),
     )
+
+
+@router.post("/batch")
+async def post_generate_mealplan_batch(
+    payload: MealplanBatchRequest,
+    provider: RecipeProvider = Depends(get_recipe_provider),
+) -> Response:
+    """
+    Generate many (household, week) plans against one recipe pool. Streams
+    one MealplanBatchResult per line (NDJSON) as each job completes.
+    """
+    if get_shard_router() is not None and any(job.household_id is None for job in payload.jobs):
+        raise HTTPException(status_code=400, detail="Every job needs a household_id")
+    try:
+        pool = await fetch_recipe_pool(provider, payload.preferences)
+    except Exception as e:
+        logger.warning("Recipe provider failed: %s", e, exc_info=True)
+        return JSONResponse(
+            status_code=503,
+            content={"error": "recipe_provider_unavailable"},
+        )
+
+    async def lines():
+        async for result in generate_mealplan_batch(payload.jobs, pool):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Iterator, Sequence
+
+from app.db.models import init_db
+from app.db.session import SessionLocal, configure_session, household_session_factories
+from app.schemas.mealplan import MealplanBatchJob
+from app.schemas.recipe import RecipeCandidate
+from app.services.expiry_maintenance import refresh_expired_flags
+from app.services.mealplan_batch import fetch_recipe_pool, generate_mealplan_batch
+from app.services.provider_factory import get_recipe_provider
+from app.services.recipe_catalog import DEFAULT_LOAD_BATCH_SIZE, load_recipes
+
+
+def _sweep_expired(args: argparse.Namespace) -> int:
+    changed = 0
+    for session_factory in household_session_factories():
+        with session_factory() as session:
+            changed += refresh_expired_flags(session)
+    print(f"updated {changed} item(s)")
+    return 0
+
+
+def _read_recipes(path: str) -> Iterator[RecipeCandidate]:
+    with (sys.stdin if path == "-" else open(path, encoding="utf-8")) as fh:
+        for line in fh:
+            if line.strip():
+                yield RecipeCandidate.model_validate_json(line)
+
+
+def _load_recipes(args: argparse.Namespace) -> int:
+    with SessionLocal() as session:
+        loaded = load_recipes(
+            session,
+            _read_recipes(args.path),
+            source=args.source,
+            batch_size=args.batch_size,
+        )
+    print(f"loaded {loaded} recipe(s)")
+    return 0
+
+
+def _read_jobs(path: str) -> list[MealplanBatchJob]:
+    with (sys.stdin if path == "-" else open(path, encoding="utf-8")) as fh:
+        return [MealplanBatchJob.model_validate_json(line) for line in fh if line.strip()]
+
+
+async def _stream_batch(jobs: list[MealplanBatchJob], preferences: dict | None, concurrency: int | None) -> int:
+    pool = await fetch_recipe_pool(get_recipe_provider(), preferences)
+    failed = 0
+    async for result in generate_mealplan_batch(jobs, pool, concurrency=concurrency):
+        failed += result.error is not None
+        sys.stdout.write(result.model_dump_json() + "\n")
+        sys.stdout.flush()
+    return failed
+
+
+def _batch_mealplan(args: argparse.Namespace) -> int:
+    jobs = _read_jobs(args.path)
+    preferences = json.loads(args.preferences) if args.preferences else None
+    failed = asyncio.run(_stream_batch(jobs, preferences, args.concurrency))
+    print(f"generated {len(jobs) - failed} of {len(jobs)} mealplan(s)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kitchen-support")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sweep = commands.add_parser(
+        "sweep-expired",
+        help="Recompute expired_flag for all inventory items.",
+    )
+    sweep.set_defaults(handler=_sweep_expired)
+
+    recipes = commands.add_parser(
+        "load-recipes",
+        help="Bulk load recipes (NDJSON, one RecipeCandidate per line) into the catalog.",
+    )
+    recipes.add_argument("path", help="NDJSON file, or - for stdin")
+    recipes.add_argument("--source", default="catalog")
+    recipes.add_argument("--batch-size", type=int, default=DEFAULT_LOAD_BATCH_SIZE)
+    recipes.set_defaults(handler=_load_recipes)
+
+    batch = commands.add_parser(
+        "batch-mealplan",
+        help="Generate mealplans for many jobs (NDJSON, one {household_id, week_start} per line); "
+        "results are written to stdout as NDJSON as each completes.",
+    )
+    batch.add_argument("path", help="NDJSON file, or - for stdin")
+    batch.add_argument("--preferences", help="JSON object passed to the recipe provider")
+    batch.add_argument("--concurrency", type=int, help="Households scored at a time")
+    batch.set_defaults(handler=_batch_mealplan)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_session()
+    init_db()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,22 +1,152 @@
 import os
+from dataclasses import dataclass, field
 from functools import lru_cache
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 
 DEFAULT_DB_URL = "sqlite:///./dev.db"
+DEFAULT_PROFILE = "dev"
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    Connection-time SQLite PRAGMAs plus pool sizing for one deployment mode.
+    Pool settings only apply to file-backed databases; in-memory SQLite keeps
+    SQLAlchemy's single-connection pool.
+    """
+
+    name: str
+    pragmas: tuple[tuple[str, str | int], ...] = ()
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = False
+    connect_args: dict = field(default_factory=dict)
+
+
+ENGINE_PROFILES: dict[str, EngineProfile] = {
+    "dev": EngineProfile(
+        name="dev",
+        pragmas=(
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+            ("busy_timeout", 5000),
+            ("foreign_keys", "ON"),
+        ),
+    ),
+    "test": EngineProfile(
+        name="test",
+        # Throwaway databases: durability is irrelevant, speed is not.
+        pragmas=(
+            ("journal_mode", "MEMORY"),
+            ("synchronous", "OFF"),
+            ("busy_timeout", 5000),
+            ("foreign_keys", "ON"),
+            ("temp_store", "MEMORY"),
+        ),
+    ),
+    "production": EngineProfile(
+        name="production",
+        # WAL lets readers proceed while one writer commits; NORMAL is
+        # durable across application crashes in WAL mode.
+        pragmas=(
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+            ("busy_timeout", 10000),
+            ("foreign_keys", "ON"),
+            ("temp_store", "MEMORY"),
+            ("cache_size", -64000),
+            ("mmap_size", 268435456),
+        ),
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+    ),
+}
 
 
 def get_database_url() -> str:
     return os.getenv("DATABASE_URL", DEFAULT_DB_URL)
 
 
+def get_engine_profile() -> EngineProfile:
+    name = os.getenv("DB_PROFILE", DEFAULT_PROFILE)
+    try:
+        return ENGINE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown DB_PROFILE: {name!r}") from None
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url in {"sqlite://", "sqlite:///:memory:"} or "mode=memory" in url
+
+
+def _install_pragmas(engine: Engine, pragmas: tuple[tuple[str, str | int], ...]) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def to_async_url(url: str) -> str:
+    """
+    Swap a sync SQLite URL onto the aiosqlite driver; URLs that already name
+    a driver are returned unchanged.
+    """
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return url
+
+
+def _engine_kwargs(url: str, profile: EngineProfile) -> tuple[dict, dict]:
+    connect_args = dict(profile.connect_args)
+    kwargs: dict = {"pool_pre_ping": profile.pool_pre_ping}
+
+    is_sqlite = url.startswith("sqlite")
+    if is_sqlite:
+        connect_args.setdefault("check_same_thread", False)
+
+    if not (is_sqlite and _is_memory_sqlite(url)):
+        kwargs.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+        )
+
+    return connect_args, kwargs
+
+
+def build_engine(url: str, profile: EngineProfile) -> Engine:
+    connect_args, kwargs = _engine_kwargs(url, profile)
+    engine = create_engine(url, connect_args=connect_args, **kwargs)
+    if url.startswith("sqlite") and profile.pragmas:
+        _install_pragmas(engine, profile.pragmas)
+    return engine
+
+
+def build_async_engine(url: str, profile: EngineProfile) -> AsyncEngine:
+    connect_args, kwargs = _engine_kwargs(url, profile)
+    connect_args.pop("check_same_thread", None)
+    engine = create_async_engine(to_async_url(url), connect_args=connect_args, **kwargs)
+    if url.startswith("sqlite") and profile.pragmas:
+        _install_pragmas(engine.sync_engine, profile.pragmas)
+    return engine
+
+
 @lru_cache(maxsize=1)
 def get_engine() -> Engine:
-    url = get_database_url()
-    connect_args: dict | None = None
-    if url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False}
-    return create_engine(url, connect_args=connect_args or {})
+    return build_engine(get_database_url(), get_engine_profile())
+
 
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    return build_async_engine(get_database_url(), get_engine_profile())
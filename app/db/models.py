@@ -2,7 +2,22 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    inspect,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn, CreateTable
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -13,7 +28,7 @@ class Base(DeclarativeBase):
 class InventoryItem(Base):
     __tablename__ = "inventory_items"
 
-    item_id = Column(String, primary_key=True, index=True)
+    item_id = Column(String, nullable=False, unique=True, index=True)
     name = Column(String, nullable=False)
     quantity = Column(Float, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -25,11 +40,164 @@ class InventoryItem(Base):
     expiration_date_estimated = Column(Date, nullable=False)
     expiration_date_user_override = Column(Date, nullable=True)
     expired_flag = Column(Boolean, nullable=False, default=False)
+    # expiration_service.effective_expiration as a generated column: the
+    # override when set, else the estimate. VIRTUAL, so it costs no storage
+    # and only its index is materialized.
+    expiration_date_effective = Column(
+        Date,
+        Computed(
+            "coalesce(expiration_date_user_override, expiration_date_estimated)",
+            persisted=False,
+        ),
+    )
+
+    # Insertion order: the listing order and the keyset for pagination. Items
+    # added in one call share created_at and have random ids; only seq keeps
+    # them in the order they were given. As the INTEGER PRIMARY KEY it is the
+    # table's rowid, which VACUUM never renumbers, and AUTOINCREMENT never
+    # hands a deleted row's number out again. Items are still identified by
+    # item_id.
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+
+    __mapper_args__ = {"primary_key": [item_id]}
+
+    # Every SQLite index entry ends with the rowid (seq), so a single-column
+    # index per filter already serves filtered pages in seq order from one
+    # range.
+    __table_args__ = (
+        Index("ix_inventory_items_location", "location"),
+        Index("ix_inventory_items_category", "category"),
+        Index("ix_inventory_items_expired_flag", "expired_flag"),
+        Index("ix_inventory_items_is_staple", "is_staple"),
+        # Expiring-soon lookups: one range scan, already in response order.
+        Index("ix_inventory_items_expiration_date_effective", "expiration_date_effective"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class InventoryState(Base):
+    """
+    Single-row table (id = 1) holding the inventory version, bumped in the
+    same transaction as every inventory write.
+    """
+
+    __tablename__ = "inventory_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class Recipe(Base):
+    __tablename__ = "recipes"
+
+    recipe_id = Column(String, primary_key=True)
+    title = Column(String, nullable=False)
+    servings = Column(Integer, nullable=False)
+    instructions_json = Column(Text, nullable=False)
+    source = Column(String, nullable=False, default="catalog")
+
+
+class RecipeIngredient(Base):
+    __tablename__ = "recipe_ingredients"
+
+    recipe_id = Column(
+        String,
+        ForeignKey("recipes.recipe_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    position = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    amount = Column(Float, nullable=False)
+    unit = Column(String, nullable=False)
+
+
+class RecipeIngredientToken(Base):
+    """
+    Inverted index from ingredient-name token to the recipe ingredients that
+    contain it. The primary key leads with the token and the table is stored
+    WITHOUT ROWID, so a token lookup is one clustered range scan.
+    """
+
+    __tablename__ = "recipe_ingredient_tokens"
+
+    token = Column(String, primary_key=True)
+    recipe_id = Column(
+        String,
+        ForeignKey("recipes.recipe_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    position = Column(Integer, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_recipe_ingredient_tokens_recipe_id", "recipe_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+
+# Indexes from earlier schema versions, superseded by the ones above.
+OBSOLETE_INDEXES = (
+    "ix_inventory_items_created_at_item_id",
+    "ix_inventory_items_location_page",
+    "ix_inventory_items_category_page",
+    "ix_inventory_items_expired_flag_page",
+    "ix_inventory_items_is_staple_page",
+    "ix_inventory_items_expiration_effective",
+)
+
+
+def _add_inventory_seq(engine: Engine) -> None:
+    """
+    Rebuild an inventory_items table from before `seq`, numbering the rows in
+    their rowid order. SQLite cannot add a primary key in place, so this is
+    its documented copy-and-rename, run as one transaction.
+    """
+    table = InventoryItem.__table__
+    with engine.connect() as conn:
+        inspector = inspect(conn)
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        if "seq" in existing:
+            return
+        old = f"{table.name}_before_seq"
+        copied = ", ".join(
+            c.name for c in table.columns if c.computed is None and c.name != "seq" and c.name in existing
+        )
+        statements = [f"DROP INDEX {index['name']}" for index in inspector.get_indexes(table.name)]
+        statements += [
+            f"ALTER TABLE {table.name} RENAME TO {old}",
+            str(CreateTable(table).compile(dialect=conn.dialect)).strip(),
+            f"INSERT INTO {table.name} ({copied}) SELECT {copied} FROM {old} ORDER BY rowid",
+            f"DROP TABLE {old}",
+        ]
+        script = ";\n".join(["BEGIN", *statements, "COMMIT"]) + ";"
+        conn.connection.dbapi_connection.executescript(script)
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Create missing tables, then bring an existing inventory_items table up
+    to date: create_all only adds columns and indexes together with a new
+    table. Generated columns are added in place, since they need no backfill
+    and SQLite can add them (VIRTUAL only) with ALTER TABLE; the seq primary
+    key needs a rebuild.
+    """
+    Base.metadata.create_all(bind=engine)
+    table = InventoryItem.__table__
+    if engine.dialect.name == "sqlite":
+        _add_inventory_seq(engine)
+    with engine.begin() as conn:
+        existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+        for column in table.columns:
+            if column.computed is not None and column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+        for name in OBSOLETE_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 
 def init_db() -> None:
     from .engine import get_engine
 
-    engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+    create_schema(get_engine())
 
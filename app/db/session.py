@@ -1,22 +1,130 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from functools import partial
+from typing import Annotated
 
+from fastapi import Header, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
-from .engine import get_engine
+from .engine import get_async_engine, get_engine
+from .shards import (
+    HOUSEHOLD_HEADER,
+    HOUSEHOLD_ID_PATTERN,
+    Shard,
+    ShardRouter,
+    UnknownHouseholdError,
+    get_shard_router,
+)
 
 
 SessionLocal = sessionmaker(autoflush=False, autocommit=False)
 
+# expire_on_commit=False: an expired attribute would need an implicit lazy
+# load, which AsyncSession cannot do outside of an awaited call.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+# Only read when sharding is configured; None (or a direct call) otherwise.
+HouseholdId = Annotated[
+    str | None,
+    Header(alias=HOUSEHOLD_HEADER, pattern=HOUSEHOLD_ID_PATTERN),
+]
+
 
 def configure_session() -> None:
     SessionLocal.configure(bind=get_engine())
 
 
-def get_db() -> Generator[Session, None, None]:
-    configure_session()
-    db: Session = SessionLocal()
+def configure_async_session() -> None:
+    AsyncSessionLocal.configure(bind=get_async_engine())
+
+
+def _household_router(household_id: str | None) -> ShardRouter | None:
+    """
+    The router for this household's database, or None when the deployment
+    uses one shared database.
+    """
+    router = get_shard_router()
+    if router is not None and household_id is None:
+        raise HTTPException(status_code=400, detail=f"{HOUSEHOLD_HEADER} header is required")
+    return router
+
+
+def _open_shard(router: ShardRouter, household_id: str, create: bool) -> Shard:
+    try:
+        return router.shard(household_id, create=create)
+    except UnknownHouseholdError:
+        raise HTTPException(status_code=404, detail="Unknown household") from None
+
+
+def household_session(household_id: str | None, create: bool = False) -> Session:
+    """
+    A session on the household's database (the shared one when unsharded).
+    Raises UnknownHouseholdError if the household has no database and
+    `create` is false.
+    """
+    router = get_shard_router()
+    if router is None:
+        if SessionLocal.kw.get("bind") is None:
+            configure_session()
+        return SessionLocal()
+    if household_id is None:
+        raise ValueError("A household id is required when SHARD_URL_TEMPLATE is set")
+    return SessionLocal(bind=router.shard(household_id, create=create).engine)
+
+
+def household_session_factories() -> list[Callable[[], Session]]:
+    """
+    One session factory per database holding household data, for jobs that
+    visit every household: each household's database, or just SessionLocal
+    when unsharded.
+    """
+    router = get_shard_router()
+    if router is None:
+        return [SessionLocal]
+    return [partial(household_session, household_id) for household_id in router.households()]
+
+
+def get_db(household_id: HouseholdId = None) -> Generator[Session, None, None]:
+    router = _household_router(household_id)
+    if router is not None:
+        db: Session = SessionLocal(bind=_open_shard(router, household_id, create=False).engine)
+    else:
+        # Bound once (at startup or on first use) instead of on every request.
+        if SessionLocal.kw.get("bind") is None:
+            configure_session()
+        db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+
+async def _async_db(household_id: str | None, create: bool) -> AsyncGenerator[AsyncSession, None]:
+    router = _household_router(household_id)
+    if router is None:
+        if AsyncSessionLocal.kw.get("bind") is None:
+            configure_async_session()
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    # Opening a shard connects and may create its schema; keep that off the loop.
+    shard = router.cached(household_id) or await run_in_threadpool(_open_shard, router, household_id, create)
+    try:
+        async with AsyncSessionLocal(bind=shard.async_engine) as db:
+            yield db
+    finally:
+        await router.dispose_retired()
+
+
+async def get_async_db(household_id: HouseholdId = None) -> AsyncGenerator[AsyncSession, None]:
+    """Session for reads: a household without a database yet is a 404."""
+    async for db in _async_db(household_id, create=False):
+        yield db
+
+
+async def get_async_write_db(household_id: HouseholdId = None) -> AsyncGenerator[AsyncSession, None]:
+    """Session for writes, creating the household's database on its first write."""
+    async for db in _async_db(household_id, create=True):
+        yield db
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import glob
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .engine import EngineProfile, build_async_engine, build_engine, get_engine_profile
+
+
+HOUSEHOLD_HEADER = "X-Household-Id"
+# Household ids become part of a file name or database name.
+HOUSEHOLD_ID_PATTERN = r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$"
+DEFAULT_MAX_SHARD_ENGINES = 8
+OPEN_LOCK_STRIPES = 16
+
+
+class UnknownHouseholdError(LookupError):
+    """The household has no database yet; only a write creates one."""
+
+
+def get_shard_url_template() -> str | None:
+    """
+    Database URL with a `{household}` placeholder, e.g.
+    sqlite:///./data/household-{household}.db. Unset means one shared
+    database for every household.
+    """
+    return os.getenv("SHARD_URL_TEMPLATE") or None
+
+
+def get_max_shard_engines() -> int:
+    return int(os.getenv("SHARD_MAX_ENGINES", DEFAULT_MAX_SHARD_ENGINES))
+
+
+@dataclass(frozen=True)
+class Shard:
+    household_id: str
+    url: str
+    engine: Engine
+    async_engine: AsyncEngine
+
+
+class ShardRouter:
+    """
+    Gives each household its own database and holds engines for at most
+    `max_engines` of them, least recently used first out. Every household is
+    a separate SQLite file with its own writer lock, so writes for different
+    households do not serialize behind each other.
+
+    Evicted sync engines are disposed immediately; async engines can only be
+    disposed from a running loop, so they wait for `dispose_retired()`.
+    Sessions already open on an evicted engine keep their connection.
+    """
+
+    def __init__(
+        self,
+        url_template: str,
+        profile: EngineProfile,
+        max_engines: int = DEFAULT_MAX_SHARD_ENGINES,
+    ) -> None:
+        if "{household}" not in url_template:
+            raise ValueError("SHARD_URL_TEMPLATE must contain {household}")
+        if max_engines < 1:
+            raise ValueError("max_engines must be at least 1")
+        self.url_template = url_template
+        self.profile = profile
+        self.max_engines = max_engines
+        self._shards: OrderedDict[str, Shard] = OrderedDict()
+        self._retired: list[AsyncEngine] = []
+        self._lock = threading.Lock()
+        self._open_locks = [threading.Lock() for _ in range(OPEN_LOCK_STRIPES)]
+        self.opened = 0
+        self.evicted = 0
+
+    def url_for(self, household_id: str) -> str:
+        if not re.fullmatch(HOUSEHOLD_ID_PATTERN, household_id):
+            raise ValueError(f"Invalid household id: {household_id!r}")
+        return self.url_template.format(household=household_id)
+
+    def cached(self, household_id: str) -> Shard | None:
+        """The household's shard if its engines are open, without opening them."""
+        with self._lock:
+            shard = self._shards.get(household_id)
+            if shard is not None:
+                self._shards.move_to_end(household_id)
+            return shard
+
+    def exists(self, household_id: str) -> bool:
+        """
+        Whether the household has a database. Only SQLite files can be
+        checked; any other backend is assumed to be provisioned.
+        """
+        url = make_url(self.url_for(household_id))
+        if url.get_backend_name() != "sqlite" or not url.database:
+            return True
+        return os.path.exists(url.database)
+
+    def shard(self, household_id: str, create: bool = False) -> Shard:
+        """
+        Engines for the household's database, opening them (and bringing the
+        schema up to date) on first use. A database that does not exist yet
+        is only created with `create=True`, for writes; otherwise this raises
+        UnknownHouseholdError. Opening connects, so async callers should run
+        this off the event loop.
+        """
+        shard = self.cached(household_id)
+        if shard is not None:
+            return shard
+
+        url = self.url_for(household_id)
+        # Schema creation runs under the household's stripe only, so opening
+        # one database does not hold up requests for households already open.
+        with self._open_locks[hash(household_id) % len(self._open_locks)]:
+            shard = self.cached(household_id)
+            if shard is not None:
+                return shard
+            if not create and not self.exists(household_id):
+                raise UnknownHouseholdError(household_id)
+
+            from .models import create_schema
+
+            shard = Shard(
+                household_id=household_id,
+                url=url,
+                engine=build_engine(url, self.profile),
+                async_engine=build_async_engine(url, self.profile),
+            )
+            try:
+                create_schema(shard.engine)
+            except Exception:
+                shard.engine.dispose()
+                raise
+            with self._lock:
+                self._shards[household_id] = shard
+                self.opened += 1
+                while len(self._shards) > self.max_engines:
+                    _, evicted = self._shards.popitem(last=False)
+                    evicted.engine.dispose()
+                    self._retired.append(evicted.async_engine)
+                    self.evicted += 1
+            return shard
+
+    def households(self) -> list[str]:
+        """
+        Households with a database: found on disk for SQLite file templates,
+        otherwise only those opened by this process.
+        """
+        url = make_url(self.url_template)
+        if url.get_backend_name() == "sqlite" and url.database:
+            prefix, _, suffix = url.database.partition("{household}")
+            paths = glob.glob(glob.escape(prefix) + "*" + glob.escape(suffix))
+            found = (path[len(prefix) : len(path) - len(suffix)] for path in paths)
+            return sorted(h for h in found if re.fullmatch(HOUSEHOLD_ID_PATTERN, h))
+        with self._lock:
+            return sorted(self._shards)
+
+    def open_shards(self) -> int:
+        with self._lock:
+            return len(self._shards)
+
+    async def dispose_retired(self) -> None:
+        with self._lock:
+            retired, self._retired = self._retired, []
+        for engine in retired:
+            await engine.dispose()
+
+    async def dispose(self) -> None:
+        """Close every engine; the router can still reopen shards afterwards."""
+        with self._lock:
+            shards = list(self._shards.values())
+            self._shards.clear()
+        for shard in shards:
+            shard.engine.dispose()
+            await shard.async_engine.dispose()
+        await self.dispose_retired()
+
+
+@lru_cache(maxsize=1)
+def get_shard_router() -> ShardRouter | None:
+    """Process-wide router, or None when SHARD_URL_TEMPLATE is unset."""
+    template = get_shard_url_template()
+    if template is None:
+        return None
+    return ShardRouter(template, get_engine_profile(), get_max_shard_engines())
+
+
+def shard_router_metric_lines() -> list[str]:
+    if not get_shard_router.cache_info().currsize:
+        return []
+    router = get_shard_router()
+    if router is None:
+        return []
+    return [
+        "# HELP db_shard_engines_open Household databases with open engines.",
+        "# TYPE db_shard_engines_open gauge",
+        f"db_shard_engines_open {router.open_shards()}",
+        "# HELP db_shard_engine_events_total Household engine opens and evictions.",
+        "# TYPE db_shard_engine_events_total counter",
+        f'db_shard_engine_events_total{{event="opened"}} {router.opened}',
+        f'db_shard_engine_events_total{{event="evicted"}} {router.evicted}',
+    ]
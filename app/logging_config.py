@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route root logging through a queue drained by a background listener
+    thread, so a log call only enqueues the record and never waits on the
+    stream. The listener owns the real handler and is flushed at exit.
+    Calling this again returns the running listener.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    _queue_handler = QueueHandler(records)
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -2,30 +2,86 @@ import logging
 import uuid
 
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from fastapi.responses import PlainTextResponse
+from starlette.datastructures import Headers, MutableHeaders
 
 from app.api.routers.inventory import router as inventory_router
 from app.api.routers.mealplan import router as mealplan_router
 from app.db.models import init_db
+from app.db.session import (
+    SessionLocal,
+    configure_async_session,
+    configure_session,
+    household_session_factories,
+)
+from app.db.shards import get_shard_router, shard_router_metric_lines
+from app.logging_config import configure_logging
+from app.metrics import MetricsMiddleware, install_db_timing, registry
+from app.services.classifiers import get_classifier_engine
+from app.services.expiry_maintenance import ExpirySweeper, get_sweep_interval_seconds
+from app.services.mealplan_cache import mealplan_cache_metric_lines
+from app.services.provider_factory import get_recipe_provider, recipe_provider_metric_lines
 
-logging.basicConfig(level=logging.INFO)
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI()
 
+install_db_timing()
+registry.register_collector(recipe_provider_metric_lines)
+registry.register_collector(mealplan_cache_metric_lines)
+registry.register_collector(shard_router_metric_lines)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
-        request.state.request_id = request_id
-        logger.info("request_id=%s method=%s path=%s", request_id, request.method, request.scope.get("path", ""))
-        return await call_next(request)
+
+class RequestLoggingMiddleware:
+    """
+    Pure ASGI middleware: reuse or assign an x-request-id, expose it as
+    request.state.request_id, echo it on the response and log the request.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        logger.info("request_id=%s method=%s path=%s", request_id, scope["method"], scope.get("path", ""))
+
+        async def send_with_request_id(message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["x-request-id"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     init_db()
+    get_classifier_engine()
+    get_recipe_provider()
+    configure_session()
+    configure_async_session()
+    app.state.expiry_sweeper = ExpirySweeper(
+        SessionLocal,
+        get_sweep_interval_seconds(),
+        databases=household_session_factories,
+    )
+    app.state.expiry_sweeper.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    sweeper = getattr(app.state, "expiry_sweeper", None)
+    if sweeper is not None:
+        await sweeper.stop()
+    router = get_shard_router()
+    if router is not None:
+        await router.dispose()
 
 
 @app.get("/health")
@@ -33,7 +89,14 @@ async def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 app.add_middleware(RequestLoggingMiddleware)
+# Added last so it is outermost and its timings include the logging middleware.
+app.add_middleware(MetricsMiddleware)
 app.include_router(inventory_router)
 app.include_router(mealplan_router)
 
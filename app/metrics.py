@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds in seconds; +Inf is implicit.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+# Recent observations kept per route for the quantile estimates.
+QUANTILE_WINDOW = 1024
+
+SERVER_TIMING_SEGMENTS = ("db", "provider", "scoring")
+UNMATCHED_ROUTE = "<unmatched>"
+
+Labels = tuple[tuple[str, str], ...]
+Collector = Callable[[], list[str]]
+
+
+def get_server_timing_enabled() -> bool:
+    return os.getenv("SERVER_TIMING_ENABLED", "").lower() in {"1", "true", "yes"}
+
+
+@dataclass
+class RequestTimings:
+    """Seconds spent per segment ("db", "provider", "scoring") in one request."""
+
+    segments: dict[str, float] = field(default_factory=dict)
+
+    def add(self, segment: str, seconds: float) -> None:
+        self.segments[segment] = self.segments.get(segment, 0.0) + seconds
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current_timings.get()
+
+
+@contextmanager
+def timed(segment: str) -> Iterator[None]:
+    """
+    Add the wall time of the block to `segment` of the current request.
+    Does nothing outside of a request. Work handed to the threadpool with
+    run_in_threadpool inherits the request's context, and so its timings.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(segment, time.perf_counter() - started)
+
+
+class Histogram:
+    """Cumulative-bucket histogram plus a sliding window for quantiles."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.recent: deque[float] = deque(maxlen=QUANTILE_WINDOW)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+        self.recent.append(value)
+
+    def quantiles(self) -> dict[float, float]:
+        if not self.recent:
+            return {}
+        ordered = sorted(self.recent)
+        last = len(ordered) - 1
+        return {q: ordered[min(last, math.ceil(q * len(ordered)) - 1)] for q in QUANTILES}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    In-process request metrics rendered in the Prometheus text format.
+
+    Tracks per-route request latency and DB time, responses by status and
+    the number of requests in flight. Extra metric families (e.g. recipe
+    cache counters) can be added with `register_collector`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[Labels, Histogram] = {}
+        self._db_time: dict[Labels, Histogram] = {}
+        self._responses: dict[Labels, int] = {}
+        self._in_flight = 0
+        self._collectors: list[Collector] = []
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        timings: RequestTimings,
+    ) -> None:
+        labels = (("method", method), ("route", route))
+        with self._lock:
+            self._in_flight -= 1
+            self._latency.setdefault(labels, Histogram()).observe(seconds)
+            self._db_time.setdefault(labels, Histogram()).observe(timings.segments.get("db", 0.0))
+            status_labels = labels + (("status", str(status)),)
+            self._responses[status_labels] = self._responses.get(status_labels, 0) + 1
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    def register_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def _render_histogram(self, name: str, help_text: str, series: dict[Labels, Histogram]) -> list[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, histogram in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (math.inf,), histogram.counts):
+                cumulative += count
+                le = (("le", _format_value(bound)),)
+                lines.append(f"{name}_bucket{_format_labels(labels + le)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return lines
+
+    def _render_quantiles(self, name: str, help_text: str, series: dict[Labels, Histogram]) -> list[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for labels, histogram in sorted(series.items()):
+            for q, value in histogram.quantiles().items():
+                quantile = (("quantile", str(q)),)
+                lines.append(f"{name}{_format_labels(labels + quantile)} {_format_value(value)}")
+        return lines
+
+    def render(self) -> str:
+        with self._lock:
+            lines = self._render_histogram(
+                "http_request_duration_seconds", "Request latency by route.", self._latency
+            )
+            lines += self._render_quantiles(
+                "http_request_duration_quantile_seconds",
+                f"Latency quantiles over the last {QUANTILE_WINDOW} requests per route.",
+                self._latency,
+            )
+            lines += self._render_histogram(
+                "http_request_db_seconds", "Database time per request by route.", self._db_time
+            )
+            lines += [
+                "# HELP http_responses_total Responses by route and status.",
+                "# TYPE http_responses_total counter",
+            ]
+            lines += [
+                f"http_responses_total{_format_labels(labels)} {count}"
+                for labels, count in sorted(self._responses.items())
+            ]
+            lines += [
+                "# HELP http_requests_in_flight Requests currently being served.",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self._in_flight}",
+            ]
+            collectors = list(self._collectors)
+        for collector in collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def _route_template(scope: dict) -> str:
+    # Set by the router once a route matched; the template keeps label
+    # cardinality bounded (/items/{item_id}, not one series per id).
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def server_timing_header(timings: RequestTimings, total: float) -> str:
+    parts = [f"{segment};dur={timings.segments.get(segment, 0.0) * 1000:.1f}" for segment in SERVER_TIMING_SEGMENTS]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording every HTTP request into `registry`.
+
+    With `server_timing` enabled, responses carry a Server-Timing header
+    splitting the time up to the response start into DB, provider and
+    scoring segments. Segments can overlap: queries made by the catalog
+    provider count towards both "db" and "provider".
+    """
+
+    def __init__(
+        self,
+        app,
+        registry: MetricsRegistry = registry,
+        server_timing: bool | None = None,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.server_timing = get_server_timing_enabled() if server_timing is None else server_timing
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+        self.registry.request_started()
+
+        async def send_with_timing(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    header = server_timing_header(timings, time.perf_counter() - started)
+                    message = {
+                        **message,
+                        "headers": [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))],
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.registry.request_finished(
+                scope["method"],
+                _route_template(scope),
+                status,
+                time.perf_counter() - started,
+                timings,
+            )
+            _current_timings.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info["query_started"].pop()
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add("db", time.perf_counter() - started)
+
+
+def _handle_error(context) -> None:
+    # after_cursor_execute does not fire for a failed statement.
+    if context.connection is not None and context.execution_context is not None:
+        stack = context.connection.info.get("query_started")
+        if stack:
+            stack.pop()
+
+
+def install_db_timing() -> None:
+    """
+    Attribute cursor execution time to the current request's "db" segment.
+    Listens on the Engine class, so it covers every engine, including the
+    sync engine under each AsyncEngine. Safe to call more than once.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
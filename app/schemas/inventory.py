@@ -29,3 +29,28 @@ class InventoryItemOut(BaseModel):
     class Config:
         from_attributes = True
 
+
+class ExpiringBucket(BaseModel):
+    urgency_points: int
+    min_days: int
+    max_days: int
+    items: list[InventoryItemOut]
+
+
+class ExpiringInventoryResponse(BaseModel):
+    today: date
+    buckets: list[ExpiringBucket]
+
+
+class ImportChunkTiming(BaseModel):
+    index: int
+    rows: int
+    first_line: int
+    elapsed_ms: float
+
+
+class InventoryImportSummary(BaseModel):
+    rows_imported: int
+    chunk_size: int
+    chunks: list[ImportChunkTiming]
+    elapsed_ms: float
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from datetime import date
 
+from pydantic import BaseModel, Field
+
+from app.db.shards import HOUSEHOLD_ID_PATTERN
 from app.schemas.recipe import RecipeCandidate
 
+MAX_BATCH_JOBS = 10000
+
 
 class MealplanGenerateRequest(BaseModel):
     """Optional preferences for MVP; can be empty."""
@@ -14,3 +19,27 @@ class MealplanGenerateRequest(BaseModel):
 class MealplanGenerateResponse(BaseModel):
     visible_candidates: list[RecipeCandidate]
     candidate_pool_size: int
+
+
+class MealplanBatchJob(BaseModel):
+    """One plan to generate: a household's inventory, scored as of `week_start`."""
+
+    # Required when household databases are configured.
+    household_id: str | None = Field(None, pattern=HOUSEHOLD_ID_PATTERN)
+    week_start: date
+
+
+class MealplanBatchRequest(BaseModel):
+    jobs: list[MealplanBatchJob] = Field(min_length=1, max_length=MAX_BATCH_JOBS)
+    preferences: dict | None = None
+
+
+class MealplanBatchResult(BaseModel):
+    """One NDJSON line; `job` is the job's position in the request."""
+
+    job: int
+    household_id: str | None
+    week_start: date
+    visible_candidates: list[RecipeCandidate] = []
+    candidate_pool_size: int = 0
+    error: str | None = None
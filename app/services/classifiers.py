@@ -1,50 +1,31 @@
 from __future__ import annotations
 
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Final
 
+from app.services.keyword_automaton import KeywordAutomaton
+
 
 Location = str
 Category = str
 
+DEFAULT_KEYWORDS_PATH: Final[Path] = (
+    Path(__file__).resolve().parents[1] / "data" / "classifier_keywords.json"
+)
 
-_LOCATION_KEYWORDS: Final[dict[Location, list[str]]] = {
-    "fridge": ["milk", "oat milk", "eggs", "egg"],
-    "pantry": ["pasta", "rice", "tomato sauce", "sauce"],
-    "freezer": ["frozen", "frozen peas", "peas"],
-}
-
-_CATEGORY_KEYWORDS: Final[dict[Category, list[str]]] = {
-    "dairy_alt": ["oat milk"],
-    "dairy": ["milk"],
-    "grain": ["pasta", "rice"],
-    "produce": ["peas"],
-    "protein": ["eggs", "egg"],
-    "condiment": ["tomato sauce", "sauce"],
-    "frozen": ["frozen", "frozen peas"],
-}
-
-
-def infer_location(name: str) -> Location:
-    lowered = name.lower()
-    for location, keywords in _LOCATION_KEYWORDS.items():
-        for kw in keywords:
-            if kw in lowered:
-                return location
-    return "unknown"
-
-
-def infer_category(name: str) -> Category:
-    lowered = name.lower()
-    for category, keywords in _CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in lowered:
-                return category
-    return "unknown"
 
+@dataclass(frozen=True)
+class Classification:
+    location: Location
+    category: Category
+    storage_guidance: str
 
-def infer_storage_guidance(name: str, category: str) -> str:
-    location = infer_location(name)
 
+def storage_guidance_for(location: Location, category: Category) -> str:
     if location == "fridge":
         return "Refrigerate after opening and keep chilled."
     if location == "freezer":
@@ -58,3 +39,79 @@ def infer_storage_guidance(name: str, category: str) -> str:
 
     return "Store appropriately according to package instructions."
 
+
+class ClassifierEngine:
+    """
+    Keyword tables compiled into a single automaton.
+
+    Each table keeps the original first-match priority: labels are tried in
+    table order and keywords in list order, and the first keyword contained
+    in the lowercased name decides the label. One scan of the name resolves
+    location and category together.
+    """
+
+    def __init__(
+        self,
+        location_keywords: dict[Location, list[str]],
+        category_keywords: dict[Category, list[str]],
+    ) -> None:
+        self._locations: list[Location] = []
+        self._categories: list[Category] = []
+        ranks: dict[str, list[int | None]] = {}
+
+        for table, (labels, keywords_by_label) in enumerate(
+            ((self._locations, location_keywords), (self._categories, category_keywords))
+        ):
+            for label, keywords in keywords_by_label.items():
+                for kw in keywords:
+                    entry = ranks.setdefault(kw, [None, None])
+                    if entry[table] is None:
+                        entry[table] = len(labels)
+                    labels.append(label)
+
+        self._automaton = KeywordAutomaton(list(ranks.items()), tables=2)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "ClassifierEngine":
+        with open(path, encoding="utf-8") as fh:
+            tables = json.load(fh)
+        return cls(tables["location"], tables["category"])
+
+    def location_and_category(self, name: str) -> tuple[Location, Category]:
+        location_rank, category_rank = self._automaton.best_ranks(name.lower())
+        location = "unknown" if location_rank is None else self._locations[location_rank]
+        category = "unknown" if category_rank is None else self._categories[category_rank]
+        return location, category
+
+    def classify(self, name: str) -> Classification:
+        location, category = self.location_and_category(name)
+        return Classification(
+            location=location,
+            category=category,
+            storage_guidance=storage_guidance_for(location, category),
+        )
+
+
+def get_keywords_path() -> Path:
+    return Path(os.getenv("CLASSIFIER_KEYWORDS_PATH", DEFAULT_KEYWORDS_PATH))
+
+
+@lru_cache(maxsize=1)
+def get_classifier_engine() -> ClassifierEngine:
+    return ClassifierEngine.from_file(get_keywords_path())
+
+
+def classify(name: str) -> Classification:
+    return get_classifier_engine().classify(name)
+
+
+def infer_location(name: str) -> Location:
+    return get_classifier_engine().location_and_category(name)[0]
+
+
+def infer_category(name: str) -> Category:
+    return get_classifier_engine().location_and_category(name)[1]
+
+
+def infer_storage_guidance(name: str, category: str) -> str:
+    return storage_guidance_for(infer_location(name), category)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from sqlalchemy import case, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.db.models import InventoryItem
+from app.services.inventory_version import bump_inventory_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SWEEP_INTERVAL_SECONDS = 3600.0
+
+
+def get_sweep_interval_seconds() -> float:
+    return float(os.getenv("EXPIRY_SWEEP_INTERVAL_SECONDS", DEFAULT_SWEEP_INTERVAL_SECONDS))
+
+
+def refresh_expired_flags(session: Session, now: datetime | None = None) -> int:
+    """
+    Recompute expired_flag for every row with one set-based UPDATE, using the
+    same rule as `expiration_service.is_expired(effective_expiration(...))`.
+    Returns the number of rows whose flag changed.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    effective = InventoryItem.expiration_date_effective
+    # A NULL effective date compares as NULL and falls through to False,
+    # matching is_expired(None) == False.
+    expired = case((effective < now.date(), True), else_=False)
+
+    result = session.execute(
+        update(InventoryItem)
+        .where(InventoryItem.expired_flag != expired)
+        .values(expired_flag=expired)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        bump_inventory_version(session)
+    session.commit()
+    return result.rowcount
+
+
+class ExpirySweeper:
+    """
+    In-process background job that runs `refresh_expired_flags` every
+    `interval` seconds on a fresh session. With `databases`, it instead
+    sweeps every database that callable lists on each run, so household
+    databases created after startup are included.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval: float,
+        databases: Callable[[], Iterable[Callable[[], Session]]] | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval = interval
+        self.databases = databases
+        self._task: asyncio.Task | None = None
+
+    def sweep(self) -> int:
+        changed = 0
+        session_factories = self.databases() if self.databases is not None else [self.session_factory]
+        for session_factory in session_factories:
+            with session_factory() as session:
+                changed += refresh_expired_flags(session)
+        logger.info("expiry sweep updated %d item(s)", changed)
+        return changed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.sweep)
+            except Exception:
+                logger.exception("expiry sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
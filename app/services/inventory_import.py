@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.schemas.inventory import (
+    ImportChunkTiming,
+    InventoryCreateItem,
+    InventoryImportSummary,
+)
+
+
+DEFAULT_IMPORT_CHUNK_SIZE = 500
+MAX_IMPORT_CHUNK_SIZE = 10_000
+
+NDJSON_CONTENT_TYPES = {
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+    "application/x-jsonlines",
+}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+
+class InventoryImportError(ValueError):
+    def __init__(self, message: str, line: int, rows_committed: int = 0) -> None:
+        super().__init__(message)
+        self.message = message
+        self.line = line
+        self.rows_committed = rows_committed
+
+
+def get_import_chunk_size() -> int:
+    """
+    INVENTORY_IMPORT_CHUNK_SIZE clamped to [1, MAX_IMPORT_CHUNK_SIZE], the
+    same range the chunk_size query parameter accepts; the default when it
+    is unset or not an integer.
+    """
+    try:
+        size = int(os.getenv("INVENTORY_IMPORT_CHUNK_SIZE", DEFAULT_IMPORT_CHUNK_SIZE))
+    except ValueError:
+        return DEFAULT_IMPORT_CHUNK_SIZE
+    return min(max(size, 1), MAX_IMPORT_CHUNK_SIZE)
+
+
+def import_format_for(content_type: str | None) -> str | None:
+    """
+    Map a request Content-Type to "ndjson" / "csv", or None if unsupported.
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    return None
+
+
+def _decode_line(raw: bytes, line_number: int) -> str:
+    try:
+        # Only the first line can start with a byte order mark.
+        return raw.decode("utf-8-sig" if line_number == 1 else "utf-8").rstrip("\r")
+    except UnicodeDecodeError as e:
+        raise InventoryImportError("invalid UTF-8", line_number) from e
+
+
+async def iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """
+    Incrementally split a UTF-8 byte stream into (line_number, line) pairs.
+    A newline byte never occurs inside a multi-byte character, so lines are
+    split before decoding and invalid UTF-8 is reported on its own line.
+    """
+    pending = b""
+    line_number = 0
+
+    async for chunk in body:
+        *complete, pending = (pending + chunk).split(b"\n")
+        for raw in complete:
+            line_number += 1
+            yield line_number, _decode_line(raw, line_number)
+
+    if pending:
+        line_number += 1
+        yield line_number, _decode_line(pending, line_number)
+
+
+def _validated(record: Any, line: int) -> dict[str, Any]:
+    try:
+        item = InventoryCreateItem.model_validate(record)
+    except ValidationError as e:
+        raise InventoryImportError(f"invalid item: {e.errors()[0]['msg']}", line) from e
+    return {"name": item.name, "quantity": item.quantity}
+
+
+async def parse_ndjson(lines: AsyncIterator[tuple[int, str]]) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise InventoryImportError(f"invalid JSON: {e.msg}", line_number) from e
+        yield line_number, _validated(record, line_number)
+
+
+async def parse_csv(lines: AsyncIterator[tuple[int, str]]) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """
+    Parse CSV with a header row. Quoted fields may contain commas and
+    newlines: physical lines are joined until their quotes balance.
+    """
+    header: list[str] | None = None
+    record = ""
+    record_line = 0
+
+    async for line_number, line in lines:
+        if not record:
+            record_line = line_number
+            record = line
+        else:
+            record += "\n" + line
+        if record.count('"') % 2:
+            continue
+
+        text, record = record, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip().lower() for column in values]
+            if "name" not in header or "quantity" not in header:
+                raise InventoryImportError("CSV header must include name and quantity", record_line)
+            continue
+        yield record_line, _validated(dict(zip(header, values)), record_line)
+
+    if record:
+        raise InventoryImportError("unterminated quoted field", record_line)
+
+
+def parse_records(
+    body: AsyncIterator[bytes],
+    import_format: str,
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    lines = iter_lines(body)
+    if import_format == "csv":
+        return parse_csv(lines)
+    return parse_ndjson(lines)
+
+
+async def import_records(
+    records: AsyncIterator[tuple[int, dict[str, Any]]],
+    write_chunk: Callable[[list[dict[str, Any]]], Awaitable[Any]],
+    chunk_size: int,
+) -> InventoryImportSummary:
+    """
+    Buffer parsed records into chunks of `chunk_size` and hand each one to
+    `write_chunk`, which commits it. Only one chunk is held in memory.
+    """
+    started = time.perf_counter()
+    chunks: list[ImportChunkTiming] = []
+    rows_committed = 0
+    buffer: list[dict[str, Any]] = []
+    first_line = 0
+
+    async def flush() -> None:
+        nonlocal rows_committed
+        chunk_started = time.perf_counter()
+        await write_chunk(buffer)
+        rows_committed += len(buffer)
+        chunks.append(
+            ImportChunkTiming(
+                index=len(chunks),
+                rows=len(buffer),
+                first_line=first_line,
+                elapsed_ms=(time.perf_counter() - chunk_started) * 1000,
+            )
+        )
+        buffer.clear()
+
+    try:
+        async for line_number, record in records:
+            if not buffer:
+                first_line = line_number
+            buffer.append(record)
+            if len(buffer) >= chunk_size:
+                await flush()
+        if buffer:
+            await flush()
+    except InventoryImportError as e:
+        e.rows_committed = rows_committed
+        raise
+
+    return InventoryImportSummary(
+        rows_imported=rows_committed,
+        chunk_size=chunk_size,
+        chunks=chunks,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.models import InventoryItem
-from app.services.classifiers import (
-    infer_category,
-    infer_location,
-    infer_storage_guidance,
-)
+from app.schemas.inventory import InventoryItemOut
+from app.services.classifiers import classify
 from app.services.expiration_service import (
     effective_expiration,
     estimate_expiration,
     is_expired,
 )
+from app.services.inventory_version import bump_inventory_version, get_inventory_version
 
 
 @dataclass
@@ -26,65 +29,252 @@ class InventoryInput:
     quantity: float
 
 
+@dataclass
+class InventoryFilters:
+    location: str | None = None
+    category: str | None = None
+    expired_flag: bool | None = None
+    is_staple: bool | None = None
+    expires_before: date | None = None
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+# Response columns, in InventoryItemOut field order so a row dict encodes
+# exactly like the model.
+OUT_COLUMNS = [getattr(InventoryItem, name) for name in InventoryItemOut.model_fields]
+
+
+def encode_cursor(item: Any) -> str:
+    payload = json.dumps([item.seq])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (seq,) = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(seq, int):
+            raise TypeError("seq must be an integer")
+        return seq
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
 class InventoryService:
     def __init__(self, session: Session) -> None:
         self.session = session
 
     def add_items(self, items: list[dict[str, Any]]) -> list[InventoryItem]:
         created_at = datetime.utcnow()
-        created_items: list[InventoryItem] = []
+        rows = self._build_rows(items, created_at)
+
+        if rows:
+            # One executemany INSERT for the whole batch.
+            self.session.execute(insert(InventoryItem), rows)
+            bump_inventory_version(self.session)
+        self.session.commit()
+
+        # Every column value is already known, so build the response objects
+        # from the rows instead of re-selecting each one.
+        return [InventoryItem(**row) for row in rows]
+
+    def _build_rows(
+        self,
+        items: list[dict[str, Any]],
+        created_at: datetime,
+    ) -> list[dict[str, Any]]:
+        opened = False
+        is_staple = False
+
+        # Classification and expiration only depend on the name for a given
+        # batch, so repeated names are resolved once.
+        derived: dict[str, dict[str, Any]] = {}
+        rows: list[dict[str, Any]] = []
 
         for raw in items:
             name = str(raw["name"])
             quantity = float(raw["quantity"])
 
-            category = infer_category(name)
-            location = infer_location(name)
-            guidance = infer_storage_guidance(name, category)
+            fields = derived.get(name)
+            if fields is None:
+                classification = classify(name)
 
-            opened = False
-            is_staple = False
+                estimated_expiration = estimate_expiration(
+                    created_at=created_at,
+                    category=classification.category,
+                    opened=opened,
+                )
+                effective = effective_expiration(
+                    estimated=estimated_expiration,
+                    override=None,
+                )
+                expired = is_expired(effective, now=created_at)
 
-            estimated_expiration = estimate_expiration(
-                created_at=created_at,
-                category=category,
-                opened=opened,
-            )
-            effective = effective_expiration(
-                estimated=estimated_expiration,
-                override=None,
-            )
-            expired = is_expired(effective, now=created_at)
-
-            item = InventoryItem(
-                item_id=str(uuid4()),
-                name=name,
-                quantity=quantity,
-                created_at=created_at,
-                location=location,
-                storage_guidance=guidance,
-                category=category,
-                is_staple=is_staple,
-                opened=opened,
-                expiration_date_estimated=estimated_expiration,
-                expiration_date_user_override=None,
-                expired_flag=expired,
+                fields = {
+                    "location": classification.location,
+                    "storage_guidance": classification.storage_guidance,
+                    "category": classification.category,
+                    "expiration_date_estimated": estimated_expiration,
+                    "expired_flag": expired,
+                }
+                derived[name] = fields
+
+            rows.append(
+                {
+                    "item_id": str(uuid4()),
+                    "name": name,
+                    "quantity": quantity,
+                    "created_at": created_at,
+                    "is_staple": is_staple,
+                    "opened": opened,
+                    "expiration_date_user_override": None,
+                    **fields,
+                }
             )
 
-            self.session.add(item)
-            created_items.append(item)
+        return rows
 
-        self.session.commit()
+    def list_items(
+        self,
+        filters: InventoryFilters | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[InventoryItem], str | None]:
+        """
+        Return items in insertion order (seq) plus the cursor for the next
+        page, or None when this is the last page.
+        """
+        stmt = self._filtered(select(InventoryItem), filters, cursor)
+        return self._page(stmt, limit, scalars=True)
+
+    def list_item_rows(
+        self,
+        filters: InventoryFilters | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        `list_items` as plain dicts of the InventoryItemOut columns, skipping
+        ORM identity-map bookkeeping and per-row model validation.
+        """
+        stmt = self._filtered(select(*OUT_COLUMNS, InventoryItem.seq), filters, cursor)
+        rows, next_cursor = self._page(stmt, limit, scalars=False)
+        dicts = []
+        for row in rows:
+            values = row._asdict()
+            del values["seq"]
+            dicts.append(values)
+        return dicts, next_cursor
+
+    def list_expiring(self, today: date, within_days: int) -> list[tuple[int, dict[str, Any]]]:
+        """
+        (days until expiration, row) for every item whose effective
+        expiration falls in [today, today + within_days], soonest first.
+        Expired items (before today) are excluded, as in scoring. Served by
+        one range scan of ix_inventory_items_expiration_date_effective.
+        """
+        effective = InventoryItem.expiration_date_effective
+        stmt = (
+            select(effective, *OUT_COLUMNS)
+            .where(effective >= today, effective <= today + timedelta(days=within_days))
+            .order_by(effective, InventoryItem.seq)
+        )
+        expiring = []
+        for row in self.session.execute(stmt):
+            values = row._asdict()
+            expires_on = values.pop("expiration_date_effective")
+            expiring.append(((expires_on - today).days, values))
+        return expiring
 
-        for item in created_items:
-            self.session.refresh(item)
+    def _filtered(
+        self,
+        stmt: Select,
+        filters: InventoryFilters | None,
+        cursor: str | None,
+    ) -> Select:
+        if filters is not None:
+            if filters.location is not None:
+                stmt = stmt.where(InventoryItem.location == filters.location)
+            if filters.category is not None:
+                stmt = stmt.where(InventoryItem.category == filters.category)
+            if filters.expired_flag is not None:
+                stmt = stmt.where(InventoryItem.expired_flag == filters.expired_flag)
+            if filters.is_staple is not None:
+                stmt = stmt.where(InventoryItem.is_staple == filters.is_staple)
+            if filters.expires_before is not None:
+                stmt = stmt.where(InventoryItem.expiration_date_effective < filters.expires_before)
 
-        return created_items
+        if cursor is not None:
+            stmt = stmt.where(InventoryItem.seq > decode_cursor(cursor))
+
+        return stmt.order_by(InventoryItem.seq)
+
+    def _page(self, stmt: Select, limit: int | None, scalars: bool) -> tuple[list[Any], str | None]:
+        if limit is not None:
+            # Fetch one extra row to learn whether another page exists.
+            stmt = stmt.limit(limit + 1)
+        result = self.session.execute(stmt)
+        items = list(result.scalars() if scalars else result)
+        if limit is None or len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, encode_cursor(items[-1])
 
     def delete_item(self, item_id: str) -> None:
         item = self.session.get(InventoryItem, item_id)
         if item is None:
             return
         self.session.delete(item)
+        bump_inventory_version(self.session)
         self.session.commit()
 
+    def inventory_version(self) -> int:
+        return get_inventory_version(self.session)
+
+
+class AsyncInventoryService:
+    """
+    AsyncSession front end for InventoryService. Each call runs the sync
+    implementation through `AsyncSession.run_sync`, so both paths share one
+    set of queries and business rules.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add_items(self, items: list[dict[str, Any]]) -> list[InventoryItem]:
+        return await self.session.run_sync(lambda s: InventoryService(s).add_items(items))
+
+    async def list_items(
+        self,
+        filters: InventoryFilters | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[InventoryItem], str | None]:
+        return await self.session.run_sync(
+            lambda s: InventoryService(s).list_items(filters, limit=limit, cursor=cursor)
+        )
+
+    async def list_item_rows(
+        self,
+        filters: InventoryFilters | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        return await self.session.run_sync(
+            lambda s: InventoryService(s).list_item_rows(filters, limit=limit, cursor=cursor)
+        )
+
+    async def list_expiring(self, today: date, within_days: int) -> list[tuple[int, dict[str, Any]]]:
+        return await self.session.run_sync(
+            lambda s: InventoryService(s).list_expiring(today, within_days)
+        )
+
+    async def delete_item(self, item_id: str) -> None:
+        await self.session.run_sync(lambda s: InventoryService(s).delete_item(item_id))
+
+    async def inventory_version(self) -> int:
+        return await self.session.run_sync(lambda s: InventoryService(s).inventory_version())
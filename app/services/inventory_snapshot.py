@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import InventoryItem
+from app.services.inventory_version import database_key, get_inventory_version
+from app.services.scoring import InventoryMatchIndex, _tokens
+
+
+class SnapshotItem(NamedTuple):
+    """
+    Immutable, pre-digested inventory row: what matching and scoring read,
+    without ORM attribute instrumentation.
+    """
+
+    item_id: str
+    name: str
+    name_lower: str
+    tokens: frozenset[str]
+    # Effective expiration (override, else estimate) as a date ordinal.
+    expires_on: Optional[int]
+
+    # InventoryItem-compatible views, for code that takes either.
+    @property
+    def expiration_date_estimated(self) -> Optional[date]:
+        return None if self.expires_on is None else date.fromordinal(self.expires_on)
+
+    @property
+    def expiration_date_user_override(self) -> None:
+        return None
+
+
+class InventorySnapshot(InventoryMatchIndex):
+    """
+    Match index over SnapshotItems for one inventory version. Accepted
+    anywhere an InventoryMatchIndex is, and cheap to share between requests
+    because nothing in it changes after construction.
+    """
+
+    def __init__(self, version: int, items: list[SnapshotItem]) -> None:
+        super().__init__(items)
+        self.version = version
+        self._expires_on = [item.expires_on for item in items]
+
+    def _keys(self, item: SnapshotItem) -> tuple[str, frozenset[str]]:
+        return item.name_lower, item.tokens
+
+    def expiration_ordinal(self, position: int) -> Optional[int]:
+        return self._expires_on[position]
+
+    @classmethod
+    def load(cls, session: Session, version: int | None = None) -> "InventorySnapshot":
+        """
+        Build from a narrow column query in insertion (listing) order, the
+        order the ORM path matched in. `version` should be read before the
+        rows, so the snapshot is never labelled newer than its contents.
+        """
+        if version is None:
+            version = get_inventory_version(session)
+        rows = session.execute(
+            select(
+                InventoryItem.item_id,
+                InventoryItem.name,
+                InventoryItem.expiration_date_estimated,
+                InventoryItem.expiration_date_user_override,
+            ).order_by(InventoryItem.seq)
+        )
+        items = []
+        for item_id, name, estimated, override in rows:
+            expires = override if override is not None else estimated
+            items.append(
+                SnapshotItem(
+                    item_id=item_id,
+                    name=name,
+                    name_lower=name.lower(),
+                    tokens=frozenset(_tokens(name)),
+                    expires_on=None if expires is None else expires.toordinal(),
+                )
+            )
+        return cls(version, items)
+
+
+class InventorySnapshotCache:
+    """
+    Latest snapshot per database, reused while the inventory version is
+    unchanged. A lookup costs one primary-key read of the version row. The
+    version and the rows are separate reads (pysqlite starts no transaction
+    for a SELECT), but the version is read first: a write in between only
+    labels the snapshot older than its rows, so the next lookup rebuilds it.
+    """
+
+    def __init__(self, max_databases: int = 16) -> None:
+        self.max_databases = max_databases
+        self._snapshots: OrderedDict[str, InventorySnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session: Session) -> InventorySnapshot:
+        key = database_key(session)
+        version = get_inventory_version(session)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.version == version:
+                self._snapshots.move_to_end(key)
+                return snapshot
+
+        snapshot = InventorySnapshot.load(session, version)
+        with self._lock:
+            current = self._snapshots.get(key)
+            # A concurrent request may have stored a newer one meanwhile.
+            if current is None or current.version <= version:
+                self._snapshots[key] = snapshot
+                self._snapshots.move_to_end(key)
+                while len(self._snapshots) > self.max_databases:
+                    self._snapshots.popitem(last=False)
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
+@lru_cache(maxsize=1)
+def get_inventory_snapshot_cache() -> InventorySnapshotCache:
+    return InventorySnapshotCache()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import InventoryState
+
+_STATE_ID = 1
+_CHANGED_KEY = "inventory_changed"
+
+_listeners: list[Callable[[str], None]] = []
+
+
+def database_key(session: Session) -> str:
+    """
+    Identifies the database `session` is bound to, independent of driver,
+    so sync and async sessions on one file share per-database cache entries.
+    """
+    url = session.get_bind().url
+    return str(url.set(drivername=url.get_backend_name()))
+
+
+def on_inventory_change(callback: Callable[[str], None]) -> None:
+    """
+    Call `callback(database_key)` after every commit that bumped the
+    inventory version in this process. Writes from other processes are only
+    visible through `get_inventory_version`.
+    """
+    _listeners.append(callback)
+
+
+def _notify_change(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+    database = database_key(session)
+    for callback in list(_listeners):
+        callback(database)
+
+
+def get_inventory_version(session: Session) -> int:
+    """
+    Current inventory version: 0 for a database that has never been written,
+    then strictly increasing with every committed inventory change. Usable
+    as a cache key for anything derived from the inventory.
+    """
+    version = session.execute(
+        select(InventoryState.version).where(InventoryState.id == _STATE_ID)
+    ).scalar_one_or_none()
+    return version or 0
+
+
+def bump_inventory_version(session: Session) -> None:
+    """
+    Increment the version inside the caller's transaction, so it commits
+    (or rolls back) together with the inventory change.
+    """
+    stmt = insert(InventoryState).values(id=_STATE_ID, version=1)
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[InventoryState.id],
+            set_={"version": InventoryState.version + 1},
+        )
+    )
+    if not session.info.get(_CHANGED_KEY):
+        session.info[_CHANGED_KEY] = True
+        event.listen(session, "after_commit", _notify_change, once=True)
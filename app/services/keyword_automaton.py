@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+
+
+_NO_MATCH = 1 << 62
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over keywords that each carry one rank per table.
+
+    `best_ranks(text)` scans the text once and returns, per table, the lowest
+    rank among keywords occurring anywhere in it (or None). With ranks
+    assigned in table iteration order this reproduces "first keyword that is
+    a substring wins" for every table at once.
+    """
+
+    def __init__(self, keywords: Sequence[tuple[str, Sequence[int | None]]], tables: int) -> None:
+        self.tables = tables
+        self._goto: list[dict[str, int]] = [{}]
+        self._ranks: list[list[int]] = [[_NO_MATCH] * tables]
+
+        for keyword, ranks in keywords:
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._ranks.append([_NO_MATCH] * tables)
+                node = nxt
+            self._merge(node, ranks)
+
+        self._fail = [0] * len(self._goto)
+        self._build_fail_links()
+
+    def _merge(self, node: int, ranks: Sequence[int | None]) -> None:
+        current = self._ranks[node]
+        for table, rank in enumerate(ranks):
+            if rank is not None and rank < current[table]:
+                current[table] = rank
+
+    def _build_fail_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Fold the suffix's outputs in so a scan only has to look at
+                # the node it is currently on.
+                self._merge(child, self._ranks[self._fail[child]])
+
+    def best_ranks(self, text: str) -> list[int | None]:
+        goto = self._goto
+        fail = self._fail
+        node_ranks = self._ranks
+
+        best = list(node_ranks[0])
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            ranks = node_ranks[node]
+            for table in range(self.tables):
+                if ranks[table] < best[table]:
+                    best[table] = ranks[table]
+
+        return [None if rank == _NO_MATCH else rank for rank in best]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, time
+
+from starlette.concurrency import run_in_threadpool
+
+from app.db.session import household_session
+from app.db.shards import UnknownHouseholdError, get_shard_router
+from app.metrics import timed
+from app.schemas.mealplan import MealplanBatchJob, MealplanBatchResult
+from app.schemas.recipe import RecipeCandidate
+from app.services.inventory_snapshot import InventorySnapshot, get_inventory_snapshot_cache
+from app.services.mealplan_service import get_candidate_pool_size, rank_candidates
+from app.services.recipe_provider import RecipeProvider
+from app.services.scoring import get_scoring_engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def get_batch_concurrency() -> int:
+    return int(os.getenv("MEALPLAN_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY))
+
+
+async def fetch_recipe_pool(provider: RecipeProvider, preferences: dict | None = None) -> list[RecipeCandidate]:
+    """The candidate pool every job in a batch is scored against, fetched once."""
+    limit = get_candidate_pool_size()
+    with timed("provider"):
+        return await run_in_threadpool(provider.search_recipes, preferences=preferences, limit=limit)
+
+
+def _load_inventory(household_id: str | None) -> InventorySnapshot:
+    with household_session(household_id) as session:
+        return get_inventory_snapshot_cache().get(session)
+
+
+async def generate_mealplan_batch(
+    jobs: Sequence[MealplanBatchJob],
+    pool: list[RecipeCandidate],
+    concurrency: int | None = None,
+    engine: str | None = None,
+) -> AsyncIterator[MealplanBatchResult]:
+    """
+    Score every job against one shared `pool`, yielding each result as soon
+    as it is ready (not in job order). Jobs are grouped by household so each
+    inventory is loaded once, as one snapshot, however many weeks it has; at
+    most `concurrency` households are loaded and scored at a time. A failing
+    household yields error results for its jobs without stopping the batch.
+    """
+    if concurrency is None:
+        concurrency = get_batch_concurrency()
+    if engine is None:
+        engine = get_scoring_engine()
+
+    by_household: dict[str | None, list[tuple[int, MealplanBatchJob]]] = defaultdict(list)
+    for position, job in enumerate(jobs):
+        by_household[job.household_id].append((position, job))
+
+    results: asyncio.Queue[MealplanBatchResult] = asyncio.Queue()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_household(household_id: str | None, household_jobs: list[tuple[int, MealplanBatchJob]]) -> None:
+        async with semaphore:
+            try:
+                inventory = await run_in_threadpool(_load_inventory, household_id)
+            except UnknownHouseholdError:
+                for position, job in household_jobs:
+                    await results.put(_failed(position, job, "unknown_household"))
+                return
+            except Exception:
+                logger.warning("Batch mealplan: inventory for %s unavailable", household_id, exc_info=True)
+                for position, job in household_jobs:
+                    await results.put(_failed(position, job, "inventory_unavailable"))
+                return
+            for position, job in household_jobs:
+                now = datetime.combine(job.week_start, time.min)
+                try:
+                    visible = await run_in_threadpool(rank_candidates, pool, inventory, now, engine)
+                except Exception:
+                    logger.warning("Batch mealplan: scoring failed for %s", household_id, exc_info=True)
+                    await results.put(_failed(position, job, "scoring_failed"))
+                    continue
+                await results.put(
+                    MealplanBatchResult(
+                        job=position,
+                        household_id=job.household_id,
+                        week_start=job.week_start,
+                        visible_candidates=visible,
+                        candidate_pool_size=len(pool),
+                    )
+                )
+
+    tasks = [asyncio.create_task(run_household(h, group)) for h, group in by_household.items()]
+    try:
+        for _ in range(len(jobs)):
+            yield await results.get()
+    finally:
+        # The consumer may stop early (e.g. a disconnected client).
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        router = get_shard_router()
+        if router is not None:
+            await router.dispose_retired()
+
+
+def _failed(position: int, job: MealplanBatchJob, error: str) -> MealplanBatchResult:
+    return MealplanBatchResult(
+        job=position,
+        household_id=job.household_id,
+        week_start=job.week_start,
+        error=error,
+    )
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from datetime import date
+from functools import lru_cache
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.inventory_version import on_inventory_change
+from app.services.recipe_cache import normalize_preferences
+
+MealplanKey = tuple[str, int, date, Hashable, int, str, str]
+MealplanResult = tuple[list[RecipeCandidate], int]
+
+
+def mealplan_key(
+    database: str,
+    inventory_version: int,
+    today: date,
+    provider: object,
+    pool_size: int,
+    engine: str,
+    preferences: dict | None,
+) -> MealplanKey:
+    """
+    Everything a generated mealplan depends on. Versions are per database
+    (one per household shard), so the database is part of the key. The
+    provider is identified by instance, since get_recipe_provider() hands
+    out one per process.
+    """
+    provider_id = (type(provider).__qualname__, id(provider))
+    return (
+        database,
+        inventory_version,
+        today,
+        provider_id,
+        pool_size,
+        engine,
+        normalize_preferences(preferences),
+    )
+
+
+@dataclass
+class MealplanCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class MealplanCache:
+    """
+    Bounded LRU of generated mealplans with a TTL, since provider results
+    drift even when the inventory does not.
+
+    It also remembers each database's inventory version for up to
+    `version_max_age` seconds, so repeat requests need no query at all.
+    Local inventory writes call `invalidate(database)`, which drops both for
+    that database; writes from other processes are picked up once the
+    remembered version ages out.
+    Versions and results computed across an invalidation are discarded:
+    callers pass back the `generation` they saw before reading.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        version_max_age: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version_max_age = version_max_age
+        self._clock = clock
+        self._entries: OrderedDict[MealplanKey, tuple[float, MealplanResult]] = OrderedDict()
+        # database -> (version, read at)
+        self._versions: dict[str, tuple[int, float]] = {}
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._metrics = MealplanCacheMetrics()
+
+    def known_version(self, database: str) -> int | None:
+        with self._lock:
+            remembered = self._versions.get(database)
+            if remembered is None or self._clock() - remembered[1] >= self.version_max_age:
+                return None
+            return remembered[0]
+
+    def remember_version(self, database: str, version: int, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._versions[database] = (version, self._clock())
+
+    def get(self, key: MealplanKey) -> MealplanResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self._metrics.hits += 1
+                visible, pool_size = entry[1]
+                return list(visible), pool_size
+            if entry is not None:
+                del self._entries[key]
+            self._metrics.misses += 1
+            return None
+
+    def put(self, key: MealplanKey, result: MealplanResult, generation: int) -> None:
+        visible, pool_size = result
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (self._clock(), (list(visible), pool_size))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics.evictions += 1
+
+    def invalidate(self, database: str | None = None) -> None:
+        """Drop results and versions for `database`, or for all of them."""
+        with self._lock:
+            if database is None:
+                self._entries.clear()
+                self._versions.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == database]:
+                    del self._entries[key]
+                self._versions.pop(database, None)
+            # Global, so in-flight fills for other databases are dropped too;
+            # that only costs them a cache miss.
+            self.generation += 1
+            self._metrics.invalidations += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {**asdict(self._metrics), "entries": len(self._entries)}
+
+
+def get_mealplan_cache_ttl() -> float:
+    return float(os.getenv("MEALPLAN_CACHE_TTL_SECONDS", "300"))
+
+
+def get_mealplan_cache_max_entries() -> int:
+    return int(os.getenv("MEALPLAN_CACHE_MAX_ENTRIES", "256"))
+
+
+@lru_cache(maxsize=1)
+def get_mealplan_cache() -> MealplanCache | None:
+    """Process-wide mealplan cache, or None when the TTL is 0."""
+    ttl = get_mealplan_cache_ttl()
+    if ttl <= 0:
+        return None
+    return MealplanCache(max_entries=get_mealplan_cache_max_entries(), ttl=ttl)
+
+
+def _invalidate_on_write(database: str) -> None:
+    # Only a cache that already exists has anything to drop.
+    if get_mealplan_cache.cache_info().currsize:
+        cache = get_mealplan_cache()
+        if cache is not None:
+            cache.invalidate(database)
+
+
+on_inventory_change(_invalidate_on_write)
+
+
+def mealplan_cache_metric_lines() -> list[str]:
+    if not get_mealplan_cache.cache_info().currsize:
+        return []
+    cache = get_mealplan_cache()
+    if cache is None:
+        return []
+    stats = cache.metrics()
+    entries = stats.pop("entries")
+    lines = [
+        "# HELP mealplan_cache_events_total Mealplan result cache events.",
+        "# TYPE mealplan_cache_events_total counter",
+    ]
+    lines += [f'mealplan_cache_events_total{{event="{event}"}} {count}' for event, count in stats.items()]
+    lines += [
+        "# HELP mealplan_cache_entries Mealplans currently cached.",
+        "# TYPE mealplan_cache_entries gauge",
+        f"mealplan_cache_entries {entries}",
+    ]
+    return lines
@@ -1,37 +1,143 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.db.models import InventoryItem
-from app.services.scoring import filter_ineligible, waste_score
+from app.metrics import timed
+from app.services.inventory_snapshot import get_inventory_snapshot_cache
+from app.services.inventory_version import database_key, get_inventory_version
+from app.services.mealplan_cache import MealplanCache, MealplanKey, mealplan_key
+from app.services.parallel_scoring import get_parallel_scorer
+from app.services.scoring import InventoryLike, get_scoring_engine, select_top_k
 
 if TYPE_CHECKING:
     from app.schemas.recipe import RecipeCandidate
     from app.services.recipe_provider import RecipeProvider
 
+DEFAULT_CANDIDATE_POOL_SIZE = 15
+
+
+def get_candidate_pool_size() -> int:
+    """How many recipes a mealplan asks the provider for and scores."""
+    return int(os.getenv("MEALPLAN_CANDIDATE_POOL_SIZE", DEFAULT_CANDIDATE_POOL_SIZE))
+
+
+def rank_candidates(
+    pool: list["RecipeCandidate"],
+    inventory_items: InventoryLike,
+    now: datetime,
+    engine: str,
+) -> list["RecipeCandidate"]:
+    parallel = get_parallel_scorer()
+    with timed("scoring"):
+        if parallel is not None and engine == "python":
+            top = parallel.select_top_k(pool, inventory_items, now, k=5)
+        else:
+            top = select_top_k(pool, inventory_items, now, k=5, engine=engine)
+    return [r for r, _ in top]
+
+
+def _cache_key(
+    cache: MealplanCache,
+    database: str,
+    version: int,
+    now: datetime,
+    provider: "RecipeProvider",
+    pool_size: int,
+    engine: str,
+    preferences: dict | None,
+    generation: int,
+) -> MealplanKey:
+    cache.remember_version(database, version, generation)
+    return mealplan_key(database, version, now.date(), provider, pool_size, engine, preferences)
+
 
 def generate_mealplan(
     session: Session,
     provider: "RecipeProvider",
     now: datetime | None = None,
+    engine: str | None = None,
+    preferences: dict | None = None,
+    cache: MealplanCache | None = None,
 ) -> tuple[list["RecipeCandidate"], int]:
     """
     Load inventory, get recipes from provider, filter ineligible, score, return top 5.
     Returns (visible_candidates, candidate_pool_size).
+
+    With a `cache`, a result for the same database, inventory version, day,
+    provider, engine and preferences is returned without loading anything.
     """
     if now is None:
         now = datetime.utcnow()
+    if engine is None:
+        engine = get_scoring_engine()
+    pool_size = get_candidate_pool_size()
+
+    if cache is not None:
+        generation = cache.generation
+        database = database_key(session)
+        version = cache.known_version(database)
+        if version is None:
+            version = get_inventory_version(session)
+        key = _cache_key(cache, database, version, now, provider, pool_size, engine, preferences, generation)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    inventory_items = get_inventory_snapshot_cache().get(session)
+    with timed("provider"):
+        pool = provider.search_recipes(preferences=preferences, limit=pool_size)
+    candidate_pool_size = len(pool)
+
+    visible = rank_candidates(pool, inventory_items, now, engine)
+
+    if cache is not None:
+        cache.put(key, (visible, candidate_pool_size), generation)
+    return visible, candidate_pool_size
+
+
+async def generate_mealplan_async(
+    session: AsyncSession,
+    provider: "RecipeProvider",
+    now: datetime | None = None,
+    engine: str | None = None,
+    preferences: dict | None = None,
+    cache: MealplanCache | None = None,
+) -> tuple[list["RecipeCandidate"], int]:
+    """
+    Async counterpart of `generate_mealplan`. The provider interface and
+    scoring are blocking (scoring may wait on worker processes), so both run
+    on the threadpool.
+    """
+    if now is None:
+        now = datetime.utcnow()
+    if engine is None:
+        engine = get_scoring_engine()
+    pool_size = get_candidate_pool_size()
+
+    if cache is not None:
+        generation = cache.generation
+        database = database_key(session)
+        version = cache.known_version(database)
+        if version is None:
+            version = await session.run_sync(get_inventory_version)
+        key = _cache_key(cache, database, version, now, provider, pool_size, engine, preferences, generation)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
 
-    inventory_items: list[InventoryItem] = list(session.query(InventoryItem).all())
-    pool = provider.search_recipes(limit=15)
+    inventory_items = await session.run_sync(get_inventory_snapshot_cache().get)
+    with timed("provider"):
+        pool = await run_in_threadpool(provider.search_recipes, preferences=preferences, limit=pool_size)
     candidate_pool_size = len(pool)
 
-    eligible = filter_ineligible(pool, inventory_items, now)
-    scored = [(r, waste_score(r, inventory_items, now)) for r in eligible]
-    scored.sort(key=lambda x: -x[1])
-    visible = [r for r, _ in scored[:5]]
+    visible = await run_in_threadpool(rank_candidates, pool, inventory_items, now, engine)
 
+    if cache is not None:
+        cache.put(key, (visible, candidate_pool_size), generation)
     return visible, candidate_pool_size
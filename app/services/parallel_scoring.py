@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import heapq
+import multiprocessing
+import os
+import pickle
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.scoring import (
+    InventoryLike,
+    InventoryMatchIndex,
+    RecipeScorer,
+    _effective_expiration_for_item,
+    select_top_k,
+    top_k_scores,
+)
+
+
+DEFAULT_MIN_POOL_SIZE = 5000
+
+
+class _CompactItem(NamedTuple):
+    """
+    Picklable stand-in for InventoryItem carrying only what scoring reads.
+    The effective expiration is folded into the estimated date.
+    """
+
+    name: str
+    expiration_date_estimated: Optional[date]
+    expiration_date_user_override: Optional[date] = None
+
+
+def compact_inventory(inventory_items: InventoryLike) -> list[_CompactItem]:
+    items = inventory_items.items if isinstance(inventory_items, InventoryMatchIndex) else inventory_items
+    return [_CompactItem(item.name, _effective_expiration_for_item(item)) for item in items]
+
+
+# Worker-side cache: the scorer for the most recent snapshot token.
+_worker_token: Optional[str] = None
+_worker_scorer: Optional[RecipeScorer] = None
+
+
+def _worker_scorer_for(token: str, block_name: str, size: int) -> RecipeScorer:
+    global _worker_token, _worker_scorer
+    if token != _worker_token:
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            items, now = pickle.loads(bytes(block.buf[:size]))
+        finally:
+            block.close()
+        _worker_scorer = RecipeScorer(InventoryMatchIndex(items), now)
+        _worker_token = token
+    assert _worker_scorer is not None
+    return _worker_scorer
+
+
+def _score_chunk(
+    token: str,
+    block_name: str,
+    size: int,
+    start: int,
+    chunk: list[tuple[str, ...]],
+    k: int,
+) -> list[tuple[int, int]]:
+    scorer = _worker_scorer_for(token, block_name, size)
+    return top_k_scores(((start + offset, names) for offset, names in enumerate(chunk)), scorer, k)
+
+
+class ParallelScorer:
+    """
+    Opt-in process-pool backend for `select_top_k`.
+
+    Per call, the inventory is reduced to (name, effective expiration)
+    tuples and written once to a shared-memory block; every worker loads it
+    the first time it sees the call's token. The recipe pool is split into
+    chunks of ingredient names, each worker returns its chunk's top k, and
+    the chunk results are merged with the same (score desc, pool order)
+    ordering as the single-process path. Pools smaller than `min_pool_size`
+    are scored in-process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        min_pool_size: int = DEFAULT_MIN_POOL_SIZE,
+        chunk_size: int | None = None,
+        mp_context: str | None = "spawn",
+    ) -> None:
+        self.max_workers = max_workers
+        self.min_pool_size = min_pool_size
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            return self._executor
+
+    def _chunk_size_for(self, count: int) -> int:
+        if self.chunk_size:
+            return self.chunk_size
+        # A few chunks per worker evens out stragglers.
+        return max(1, -(-count // (self.max_workers * 4)))
+
+    def select_top_k(
+        self,
+        recipes: list[RecipeCandidate],
+        inventory_items: InventoryLike,
+        now: datetime,
+        k: int,
+    ) -> list[tuple[RecipeCandidate, int]]:
+        if k <= 0 or self.max_workers <= 1 or len(recipes) < self.min_pool_size:
+            return select_top_k(recipes, inventory_items, now, k)
+
+        payload = pickle.dumps((compact_inventory(inventory_items), now), protocol=pickle.HIGHEST_PROTOCOL)
+        block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        try:
+            block.buf[: len(payload)] = payload
+            token = uuid.uuid4().hex
+            size = self._chunk_size_for(len(recipes))
+            pool = self._pool()
+            futures = [
+                pool.submit(
+                    _score_chunk,
+                    token,
+                    block.name,
+                    len(payload),
+                    start,
+                    [tuple(i.name for i in r.ingredients) for r in recipes[start : start + size]],
+                    k,
+                )
+                for start in range(0, len(recipes), size)
+            ]
+            chunk_results = [future.result() for future in futures]
+        finally:
+            block.close()
+            block.unlink()
+
+        merged = heapq.merge(*chunk_results, key=lambda entry: (-entry[0], entry[1]))
+        return [(recipes[index], score) for score, index in list(merged)[:k]]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+def get_scoring_workers() -> int:
+    return int(os.getenv("SCORING_WORKERS", "0"))
+
+
+def get_parallel_min_pool_size() -> int:
+    return int(os.getenv("SCORING_PARALLEL_MIN_POOL", DEFAULT_MIN_POOL_SIZE))
+
+
+@lru_cache(maxsize=1)
+def get_parallel_scorer() -> ParallelScorer | None:
+    """
+    Process-wide ParallelScorer, or None unless SCORING_WORKERS > 1.
+    """
+    workers = get_scoring_workers()
+    if workers <= 1:
+        return None
+    return ParallelScorer(max_workers=workers, min_pool_size=get_parallel_min_pool_size())
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from functools import lru_cache
+
+from app.db.shards import get_shard_url_template
+from app.services.recipe_aggregator import AggregatingRecipeProvider
+from app.services.recipe_cache import CachingRecipeProvider
+from app.services.recipe_catalog import CatalogRecipeProvider
+from app.services.recipe_provider import RecipeProvider, StubRecipeProvider
+
+
+PROVIDER_BACKENDS: dict[str, Callable[[], RecipeProvider]] = {
+    "stub": StubRecipeProvider,
+    "catalog": CatalogRecipeProvider,
+}
+
+
+def get_recipe_backend_names() -> list[str]:
+    raw = os.getenv("RECIPE_PROVIDERS", "stub")
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def get_recipe_cache_ttl() -> float:
+    return float(os.getenv("RECIPE_CACHE_TTL_SECONDS", "300"))
+
+
+def get_recipe_cache_stale_ttl() -> float:
+    return float(os.getenv("RECIPE_CACHE_STALE_SECONDS", "600"))
+
+
+def get_recipe_cache_max_entries() -> int:
+    return int(os.getenv("RECIPE_CACHE_MAX_ENTRIES", "128"))
+
+
+def get_aggregate_deadline() -> float:
+    return float(os.getenv("RECIPE_AGGREGATE_DEADLINE_SECONDS", "2.0"))
+
+
+def get_provider_timeout() -> float:
+    return float(os.getenv("RECIPE_PROVIDER_TIMEOUT_SECONDS", "1.5"))
+
+
+def get_hedge_after() -> float:
+    return float(os.getenv("RECIPE_PROVIDER_HEDGE_AFTER_SECONDS", "0.3"))
+
+
+def build_backends(names: list[str]) -> list[RecipeProvider]:
+    # The catalog ranks against the inventory in the shared database, which
+    # no household's inventory lives in once each has its own database.
+    if "catalog" in names and get_shard_url_template() is not None:
+        raise ValueError("The catalog recipe provider does not support SHARD_URL_TEMPLATE")
+    try:
+        return [PROVIDER_BACKENDS[name]() for name in names]
+    except KeyError as e:
+        raise ValueError(f"Unknown recipe provider: {e.args[0]!r}") from None
+
+
+def build_backend_provider(backends: list[RecipeProvider]) -> RecipeProvider:
+    if len(backends) == 1:
+        return backends[0]
+    return AggregatingRecipeProvider(
+        backends,
+        deadline=get_aggregate_deadline(),
+        provider_timeout=get_provider_timeout(),
+        hedge_after=get_hedge_after(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_recipe_provider() -> RecipeProvider:
+    """
+    Process-wide recipe provider used by the API: the backends named in
+    RECIPE_PROVIDERS (aggregated when there are several), behind the cache.
+    A cache TTL of 0 disables caching, and so does any backend whose
+    results depend on the inventory.
+    """
+    backends = build_backends(get_recipe_backend_names())
+    provider = build_backend_provider(backends)
+    ttl = get_recipe_cache_ttl()
+    if ttl <= 0 or any(getattr(b, "inventory_dependent", False) for b in backends):
+        return provider
+    return CachingRecipeProvider(
+        provider,
+        max_entries=get_recipe_cache_max_entries(),
+        ttl=ttl,
+        stale_ttl=get_recipe_cache_stale_ttl(),
+    )
+
+
+def recipe_provider_metric_lines() -> list[str]:
+    """
+    Prometheus text lines for the recipe cache and aggregated backends.
+    Empty until the process-wide provider has been built.
+    """
+    if get_recipe_provider.cache_info().currsize == 0:
+        return []
+    provider = get_recipe_provider()
+    lines: list[str] = []
+    if isinstance(provider, CachingRecipeProvider):
+        stats = provider.metrics()
+        entries = stats.pop("entries")
+        lines += [
+            "# HELP recipe_cache_events_total Recipe cache lookups and refreshes.",
+            "# TYPE recipe_cache_events_total counter",
+        ]
+        lines += [f'recipe_cache_events_total{{event="{event}"}} {count}' for event, count in stats.items()]
+        lines += [
+            "# HELP recipe_cache_entries Entries currently cached.",
+            "# TYPE recipe_cache_entries gauge",
+            f"recipe_cache_entries {entries}",
+        ]
+        provider = provider.provider
+    if isinstance(provider, AggregatingRecipeProvider):
+        lines += [
+            "# HELP recipe_backend_events_total Attempts and outcomes per recipe backend.",
+            "# TYPE recipe_backend_events_total counter",
+        ]
+        for index, stats in enumerate(provider.metrics()):
+            lines += [
+                f'recipe_backend_events_total{{backend="{index}",event="{event}"}} {count}'
+                for event, count in stats.items()
+            ]
+    return lines
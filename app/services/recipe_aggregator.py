@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.recipe_provider import RecipeProvider
+
+logger = logging.getLogger(__name__)
+
+
+class RecipeProviderError(RuntimeError):
+    """No backend produced recipes before the deadline."""
+
+
+@dataclass
+class BackendMetrics:
+    requests: int = 0
+    hedges: int = 0
+    successes: int = 0
+    failures: int = 0
+    timeouts: int = 0
+
+
+@dataclass
+class _BackendState:
+    index: int
+    deadline: float
+    attempts: int = 0
+    last_started: float = 0.0
+    pending: int = 0
+    done: bool = False
+    recipes: list[RecipeCandidate] | None = None
+
+
+def _title_key(recipe: RecipeCandidate) -> str:
+    return " ".join(recipe.title.lower().split())
+
+
+def merge_recipes(results: Sequence[list[RecipeCandidate]], limit: int) -> list[RecipeCandidate]:
+    """
+    Concatenate backend results in priority order, dropping any recipe whose
+    recipe_id or normalized title was already seen.
+    """
+    seen_ids: set[str] = set()
+    seen_titles: set[str] = set()
+    merged: list[RecipeCandidate] = []
+    for recipes in results:
+        for recipe in recipes:
+            title = _title_key(recipe)
+            if recipe.recipe_id in seen_ids or title in seen_titles:
+                continue
+            seen_ids.add(recipe.recipe_id)
+            seen_titles.add(title)
+            merged.append(recipe)
+            if len(merged) >= limit:
+                return merged
+    return merged
+
+
+class AggregatingRecipeProvider:
+    """
+    Query several RecipeProviders concurrently and merge their results.
+
+    Every backend gets its own deadline (`provider_timeout`, either one
+    value or one per backend). A backend that has not answered after
+    `hedge_after` seconds, or that failed, gets another attempt, up to
+    `max_hedges` extra attempts; the first successful attempt wins. When the
+    overall `deadline` passes, whatever has arrived is returned. Backends
+    earlier in `providers` take priority when deduplicating.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[RecipeProvider],
+        deadline: float = 2.0,
+        provider_timeout: float | Sequence[float] = 1.5,
+        hedge_after: float | None = 0.3,
+        max_hedges: int = 1,
+    ) -> None:
+        if not providers:
+            raise ValueError("AggregatingRecipeProvider needs at least one provider")
+        self.providers = list(providers)
+        self.deadline = deadline
+        if isinstance(provider_timeout, (int, float)):
+            provider_timeout = [float(provider_timeout)] * len(self.providers)
+        self.provider_timeouts = list(provider_timeout)
+        self.hedge_after = hedge_after
+        self.max_hedges = max_hedges
+        # Abandoned attempts keep running to completion, so leave headroom
+        # for a few overlapping requests.
+        self._executor = ThreadPoolExecutor(
+            max_workers=4 * len(self.providers) * (1 + max_hedges),
+            thread_name_prefix="recipe-aggregator",
+        )
+        self._metrics = [BackendMetrics() for _ in self.providers]
+        self._lock = threading.Lock()
+
+    def _launch(
+        self,
+        state: _BackendState,
+        futures: dict[Future, int],
+        preferences: dict | None,
+        limit: int,
+        now: float,
+    ) -> None:
+        provider = self.providers[state.index]
+        future = self._executor.submit(provider.search_recipes, preferences=preferences, limit=limit)
+        futures[future] = state.index
+        with self._lock:
+            metrics = self._metrics[state.index]
+            metrics.requests += 1
+            if state.attempts:
+                metrics.hedges += 1
+        state.attempts += 1
+        state.pending += 1
+        state.last_started = now
+
+    def search_recipes(
+        self,
+        preferences: dict | None = None,
+        limit: int = 15,
+    ) -> list[RecipeCandidate]:
+        started = time.monotonic()
+        overall_deadline = started + self.deadline
+        states = [
+            _BackendState(index=i, deadline=min(started + timeout, overall_deadline))
+            for i, timeout in enumerate(self.provider_timeouts)
+        ]
+        futures: dict[Future, int] = {}
+        for state in states:
+            self._launch(state, futures, preferences, limit, started)
+
+        while True:
+            now = time.monotonic()
+            for state in states:
+                if not state.done and now >= state.deadline:
+                    state.done = True
+                    with self._lock:
+                        self._metrics[state.index].timeouts += 1
+            active = [s for s in states if not s.done]
+            if not active:
+                break
+
+            # Hedge backends that are slow or have no attempt in flight.
+            for state in active:
+                if state.attempts > self.max_hedges:
+                    continue
+                slow = (
+                    self.hedge_after is not None
+                    and now - state.last_started >= self.hedge_after
+                )
+                if state.pending == 0 or slow:
+                    self._launch(state, futures, preferences, limit, now)
+
+            wake_at = min(s.deadline for s in active)
+            if self.hedge_after is not None:
+                for state in active:
+                    if state.attempts <= self.max_hedges:
+                        wake_at = min(wake_at, state.last_started + self.hedge_after)
+            pending = [f for f, i in futures.items() if not states[i].done]
+            if not pending:
+                # Every attempt failed and no hedges remain.
+                for state in active:
+                    state.done = True
+                break
+
+            finished, _ = wait(pending, timeout=max(wake_at - now, 0), return_when=FIRST_COMPLETED)
+            for future in finished:
+                state = states[futures.pop(future)]
+                state.pending -= 1
+                if state.done:
+                    continue
+                error = future.exception()
+                if error is None:
+                    state.recipes = future.result()
+                    state.done = True
+                    with self._lock:
+                        self._metrics[state.index].successes += 1
+                else:
+                    logger.warning(
+                        "Recipe backend %d failed: %s", state.index, error, exc_info=error
+                    )
+                    with self._lock:
+                        self._metrics[state.index].failures += 1
+
+        # Late attempts may still finish; nobody is waiting for them.
+        for future in futures:
+            future.cancel()
+
+        results = [s.recipes for s in states if s.recipes is not None]
+        if not results:
+            raise RecipeProviderError("No recipe provider answered before the deadline")
+        return merge_recipes(results, limit)
+
+    def metrics(self) -> list[dict[str, int]]:
+        with self._lock:
+            return [asdict(m) for m in self._metrics]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.recipe_provider import RecipeProvider
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, int]
+
+
+def normalize_preferences(preferences: dict | None) -> str:
+    """
+    Canonical text form of a preferences dict, so equal preferences share a
+    cache entry regardless of key order. None and {} are the same request.
+    """
+    return json.dumps(preferences or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@dataclass
+class CacheMetrics:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    recipes: list[RecipeCandidate]
+    fetched_at: float
+    refreshing: bool = False
+
+
+class CachingRecipeProvider:
+    """
+    RecipeProvider wrapper with a bounded LRU + TTL cache.
+
+    Fresh entries (younger than `ttl`) are served directly. Entries within a
+    further `stale_ttl` seconds are still served, but trigger one background
+    refresh; anything older is dropped and fetched synchronously.
+    """
+
+    def __init__(
+        self,
+        provider: RecipeProvider,
+        max_entries: int = 128,
+        ttl: float = 300.0,
+        stale_ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Executor | None = None,
+    ) -> None:
+        self.provider = provider
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="recipe-cache"
+        )
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = CacheMetrics()
+
+    def search_recipes(
+        self,
+        preferences: dict | None = None,
+        limit: int = 15,
+    ) -> list[RecipeCandidate]:
+        key = (normalize_preferences(preferences), limit)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self._clock() - entry.fetched_at
+                if age < self.ttl:
+                    self._metrics.hits += 1
+                    self._entries.move_to_end(key)
+                    return list(entry.recipes)
+                if age < self.ttl + self.stale_ttl:
+                    self._metrics.stale_hits += 1
+                    self._entries.move_to_end(key)
+                    if not entry.refreshing:
+                        self._schedule_refresh(entry, key, preferences, limit)
+                    return list(entry.recipes)
+                del self._entries[key]
+            self._metrics.misses += 1
+
+        # Fetch outside the lock so one slow miss does not block hits.
+        recipes = self.provider.search_recipes(preferences=preferences, limit=limit)
+        self._store(key, recipes)
+        return list(recipes)
+
+    def _schedule_refresh(
+        self,
+        entry: _Entry,
+        key: CacheKey,
+        preferences: dict | None,
+        limit: int,
+    ) -> None:
+        try:
+            self._executor.submit(self._refresh, key, preferences, limit)
+        except RuntimeError:
+            # Executor already shut down (see close()); keep serving stale.
+            return
+        entry.refreshing = True
+
+    def _store(self, key: CacheKey, recipes: list[RecipeCandidate]) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(recipes=list(recipes), fetched_at=self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics.evictions += 1
+
+    def _refresh(self, key: CacheKey, preferences: dict | None, limit: int) -> None:
+        try:
+            recipes = self.provider.search_recipes(preferences=preferences, limit=limit)
+        except Exception:
+            logger.warning("Background recipe refresh failed", exc_info=True)
+            with self._lock:
+                self._metrics.refresh_failures += 1
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+        self._store(key, recipes)
+        with self._lock:
+            self._metrics.refreshes += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {**asdict(self._metrics), "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Wait for in-flight background refreshes and stop the executor."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.models import InventoryItem, Recipe, RecipeIngredient, RecipeIngredientToken
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.scoring import _tokens
+
+
+DEFAULT_LOAD_BATCH_SIZE = 1000
+
+
+def _batches(items: Iterable[RecipeCandidate], size: int) -> Iterator[list[RecipeCandidate]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def load_recipes(
+    session: Session,
+    recipes: Iterable[RecipeCandidate],
+    source: str = "catalog",
+    batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+) -> int:
+    """
+    Bulk load recipes into the catalog, replacing any existing recipe with
+    the same recipe_id. Each batch is written with one executemany INSERT per
+    table and committed. Returns the number of recipes loaded.
+    """
+    loaded = 0
+    for batch in _batches(recipes, batch_size):
+        # Last occurrence wins if a batch repeats a recipe_id.
+        by_id = {recipe.recipe_id: recipe for recipe in batch}
+        ids = list(by_id)
+
+        recipe_rows: list[dict] = []
+        ingredient_rows: list[dict] = []
+        token_rows: list[dict] = []
+        for recipe in by_id.values():
+            recipe_rows.append(
+                {
+                    "recipe_id": recipe.recipe_id,
+                    "title": recipe.title,
+                    "servings": recipe.servings,
+                    "instructions_json": json.dumps(recipe.instructions),
+                    "source": source,
+                }
+            )
+            for position, ingredient in enumerate(recipe.ingredients):
+                ingredient_rows.append(
+                    {
+                        "recipe_id": recipe.recipe_id,
+                        "position": position,
+                        "name": ingredient.name,
+                        "amount": ingredient.amount,
+                        "unit": ingredient.unit,
+                    }
+                )
+                token_rows.extend(
+                    {"token": token, "recipe_id": recipe.recipe_id, "position": position}
+                    for token in _tokens(ingredient.name)
+                )
+
+        for model in (RecipeIngredientToken, RecipeIngredient, Recipe):
+            session.execute(delete(model).where(model.recipe_id.in_(ids)))
+        session.execute(insert(Recipe), recipe_rows)
+        if ingredient_rows:
+            session.execute(insert(RecipeIngredient), ingredient_rows)
+        if token_rows:
+            session.execute(insert(RecipeIngredientToken), token_rows)
+        session.commit()
+        loaded += len(recipe_rows)
+
+    return loaded
+
+
+def _amount(value: float) -> float | int:
+    return int(value) if float(value).is_integer() else value
+
+
+class CatalogRecipeProvider:
+    """
+    RecipeProvider backed by the local recipe catalog.
+
+    Candidates are retrieved through the ingredient-token inverted index:
+    recipes are ranked by how many of their ingredients share a token with
+    the current inventory, then padded with other recipes up to `limit`.
+    Preferences are ignored for now, as with the stub provider.
+    """
+
+    # Results depend on the inventory, so a preferences-keyed cache in front
+    # of this provider would serve stale rankings.
+    inventory_dependent = True
+
+    def __init__(self, session_factory: Callable[[], Session] | None = None) -> None:
+        if session_factory is None:
+            from app.db.session import SessionLocal
+
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    def search_recipes(
+        self,
+        preferences: dict | None = None,
+        limit: int = 15,
+    ) -> list[RecipeCandidate]:
+        with self.session_factory() as session:
+            tokens: set[str] = set()
+            for name in session.execute(select(InventoryItem.name)).scalars():
+                tokens |= _tokens(name)
+
+            ranked = self._rank_by_inventory(session, tokens, limit)
+            if len(ranked) < limit:
+                ranked += self._fill(session, ranked, limit - len(ranked))
+            return self._load(session, ranked)
+
+    def _rank_by_inventory(self, session: Session, tokens: set[str], limit: int) -> list[str]:
+        if not tokens or limit <= 0:
+            return []
+        matched = func.count(func.distinct(RecipeIngredientToken.position))
+        stmt = (
+            select(RecipeIngredientToken.recipe_id)
+            .where(RecipeIngredientToken.token.in_(bindparam("tokens", expanding=True)))
+            .group_by(RecipeIngredientToken.recipe_id)
+            .order_by(matched.desc(), RecipeIngredientToken.recipe_id)
+            .limit(limit)
+        )
+        return list(session.execute(stmt, {"tokens": sorted(tokens)}).scalars())
+
+    def _fill(self, session: Session, exclude: list[str], count: int) -> list[str]:
+        stmt = select(Recipe.recipe_id).order_by(Recipe.recipe_id).limit(count)
+        if exclude:
+            stmt = stmt.where(Recipe.recipe_id.not_in(exclude))
+        return list(session.execute(stmt).scalars())
+
+    def _load(self, session: Session, recipe_ids: list[str]) -> list[RecipeCandidate]:
+        if not recipe_ids:
+            return []
+        recipes = {
+            r.recipe_id: r
+            for r in session.execute(select(Recipe).where(Recipe.recipe_id.in_(recipe_ids))).scalars()
+        }
+        ingredients: dict[str, list[Ingredient]] = {rid: [] for rid in recipe_ids}
+        rows = session.execute(
+            select(RecipeIngredient)
+            .where(RecipeIngredient.recipe_id.in_(recipe_ids))
+            .order_by(RecipeIngredient.recipe_id, RecipeIngredient.position)
+        ).scalars()
+        for row in rows:
+            ingredients[row.recipe_id].append(
+                Ingredient(name=row.name, amount=_amount(row.amount), unit=row.unit)
+            )
+
+        return [
+            RecipeCandidate(
+                recipe_id=rid,
+                title=recipes[rid].title,
+                servings=recipes[rid].servings,
+                ingredients=ingredients[rid],
+                instructions=json.loads(recipes[rid].instructions_json),
+            )
+            for rid in recipe_ids
+        ]
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import heapq
+import os
+from bisect import bisect_right
 from datetime import date, datetime
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence, Union
 
 from app.db.models import InventoryItem
 from app.schemas.recipe import RecipeCandidate
 from app.services.expiration_service import effective_expiration, is_expired
 
 
+MAX_URGENCY_POINTS = 5
+# Inclusive day ranges that earn urgency points, most urgent first; each
+# range gets a single `urgency_points` value.
+URGENCY_BUCKETS = ((0, 1), (2, 3), (4, 7))
+
+
 def urgency_points(days: int) -> int:
     if days <= 1:
-        return 5
+        return MAX_URGENCY_POINTS
     if days <= 3:
         return 3
     if 4 <= days <= 7:
@@ -22,14 +31,123 @@ def _tokens(text: str) -> set[str]:
     return {t for t in text.lower().replace(",", " ").split() if t}
 
 
+class InventoryMatchIndex:
+    """
+    Precomputed lookup structures for matching ingredient names to inventory.
+
+    Build once per request and pass it anywhere a list of inventory items is
+    accepted. Matches are identical to the linear scan in `match_inventory`:
+    token overlap wins over substring matching, and within each rule the
+    earliest item in the original order wins.
+    """
+
+    _SEPARATOR = "\x00"
+
+    def __init__(self, items: Iterable[InventoryItem]) -> None:
+        self.items: list[InventoryItem] = list(items)
+
+        # token -> position of the first item whose name contains it
+        self._token_positions: dict[str, int] = {}
+        # lowered name -> position of the first item with that name
+        self._name_positions: dict[str, int] = {}
+        self._name_lengths: set[int] = set()
+
+        lowered: list[str] = []
+        self._starts: list[int] = []
+        offset = 0
+        for position, item in enumerate(self.items):
+            name_lower, tokens = self._keys(item)
+            lowered.append(name_lower)
+            self._starts.append(offset)
+            offset += len(name_lower) + len(self._SEPARATOR)
+
+            for token in tokens:
+                self._token_positions.setdefault(token, position)
+            self._name_positions.setdefault(name_lower, position)
+            self._name_lengths.add(len(name_lower))
+
+        # All names joined into one string so "ingredient in name" becomes a
+        # single str.find; the lowest offset belongs to the earliest item.
+        self._haystack = self._SEPARATOR.join(lowered)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _keys(self, item: InventoryItem) -> tuple[str, Iterable[str]]:
+        """Lowered name and name tokens of an item."""
+        return item.name.lower(), _tokens(item.name)
+
+    def expiration_ordinal(self, position: int) -> Optional[int]:
+        """Effective expiration of the item at `position` as a date ordinal."""
+        eff = _effective_expiration_for_item(self.items[position])
+        return None if eff is None else eff.toordinal()
+
+    def match(self, ingredient_name: str) -> Optional[InventoryItem]:
+        position = self.match_position(ingredient_name)
+        if position is None:
+            return None
+        return self.items[position]
+
+    def match_position(self, ingredient_name: str) -> Optional[int]:
+        if not self.items:
+            return None
+
+        token_hits = [
+            self._token_positions[t]
+            for t in _tokens(ingredient_name)
+            if t in self._token_positions
+        ]
+        if token_hits:
+            return min(token_hits)
+
+        ingredient_lower = ingredient_name.lower()
+        if self._SEPARATOR in ingredient_lower:
+            return self._scan_substring(ingredient_lower)
+
+        best: Optional[int] = None
+
+        # ingredient_lower in name_lower
+        offset = self._haystack.find(ingredient_lower)
+        if offset != -1:
+            best = bisect_right(self._starts, offset) - 1
+
+        # name_lower in ingredient_lower: look up every window of the
+        # ingredient whose length matches some inventory name.
+        size = len(ingredient_lower)
+        for length in self._name_lengths:
+            if length > size:
+                continue
+            for start in range(size - length + 1):
+                position = self._name_positions.get(
+                    ingredient_lower[start : start + length]
+                )
+                if position is not None and (best is None or position < best):
+                    best = position
+
+        return best
+
+    def _scan_substring(self, ingredient_lower: str) -> Optional[int]:
+        for position, item in enumerate(self.items):
+            name_lower = self._keys(item)[0]
+            if ingredient_lower in name_lower or name_lower in ingredient_lower:
+                return position
+        return None
+
+
+InventoryLike = Union[list[InventoryItem], InventoryMatchIndex]
+
+
 def match_inventory(
     ingredient_name: str,
-    items: Iterable[InventoryItem],
+    items: Union[Iterable[InventoryItem], InventoryMatchIndex],
 ) -> Optional[InventoryItem]:
     """
     Match an ingredient name to an inventory item using simple
     lowercased token overlap / substring logic.
     """
+    if isinstance(items, InventoryMatchIndex):
+        return items.match(ingredient_name)
+
     ingredient_tokens = _tokens(ingredient_name)
     ingredient_lower = ingredient_name.lower()
 
@@ -58,7 +176,7 @@ def _effective_expiration_for_item(item: InventoryItem) -> Optional[date]:
 
 def waste_score(
     recipe: RecipeCandidate,
-    inventory_items: list[InventoryItem],
+    inventory_items: InventoryLike,
     now: datetime,
 ) -> int:
     """
@@ -91,13 +209,15 @@ def waste_score(
 
 def filter_ineligible(
     recipes: list[RecipeCandidate],
-    inventory_items: list[InventoryItem],
+    inventory_items: InventoryLike,
     now: datetime,
 ) -> list[RecipeCandidate]:
     """
     Remove recipes that use any expired inventory item.
     """
     eligible: list[RecipeCandidate] = []
+    if not isinstance(inventory_items, InventoryMatchIndex):
+        inventory_items = InventoryMatchIndex(inventory_items)
 
     for recipe in recipes:
         exclude = False
@@ -119,3 +239,163 @@ def filter_ineligible(
 
     return eligible
 
+
+class RecipeScorer:
+    """
+    Single-pass eligibility + waste scoring for a pool of recipes.
+
+    Each distinct ingredient name is resolved once and each matched item's
+    urgency points are computed once; the memo is shared across every recipe
+    scored by the same instance, so build one per request.
+    """
+
+    def __init__(self, inventory_items: InventoryLike, now: datetime) -> None:
+        if not isinstance(inventory_items, InventoryMatchIndex):
+            inventory_items = InventoryMatchIndex(inventory_items)
+        self.index = inventory_items
+        self.now = now
+        self._today = now.date().toordinal()
+        # position -> urgency points, or None when the item is expired
+        self._item_points: dict[int, Optional[int]] = {}
+        # ingredient name -> urgency points, or None when it hits an expired item
+        self._ingredient_points: dict[str, Optional[int]] = {}
+
+    def ingredient_points(self, ingredient_name: str) -> Optional[int]:
+        try:
+            return self._ingredient_points[ingredient_name]
+        except KeyError:
+            pass
+
+        position = self.index.match_position(ingredient_name)
+        points: Optional[int] = 0
+        if position is not None:
+            points = self._points_for_position(position)
+        self._ingredient_points[ingredient_name] = points
+        return points
+
+    def _points_for_position(self, position: int) -> Optional[int]:
+        try:
+            return self._item_points[position]
+        except KeyError:
+            pass
+
+        points: Optional[int] = 0
+        ordinal = self.index.expiration_ordinal(position)
+        if ordinal is not None:
+            days = ordinal - self._today
+            # Same rule as is_expired: expired once the date is before today.
+            points = None if days < 0 else urgency_points(days)
+        self._item_points[position] = points
+        return points
+
+    def score(self, recipe: RecipeCandidate) -> Optional[int]:
+        """
+        Return the waste score, or None if the recipe uses an expired item.
+        """
+        return self.score_names(ingredient.name for ingredient in recipe.ingredients)
+
+    def score_names(self, ingredient_names: Iterable[str]) -> Optional[int]:
+        total = 0
+        for name in ingredient_names:
+            points = self.ingredient_points(name)
+            if points is None:
+                return None
+            total += points
+        return total
+
+
+SCORING_ENGINES = ("python", "numpy")
+
+
+def get_scoring_engine() -> str:
+    return os.getenv("SCORING_ENGINE", "python")
+
+
+def score_recipes(
+    recipes: list[RecipeCandidate],
+    inventory_items: InventoryLike,
+    now: datetime,
+    engine: str = "python",
+) -> list[tuple[RecipeCandidate, int]]:
+    """
+    Fused equivalent of `filter_ineligible` followed by `waste_score`:
+    returns (recipe, score) for every eligible recipe, in input order.
+
+    `engine="numpy"` scores the whole pool with array operations (requires
+    the optional numpy dependency); results are identical.
+    """
+    if engine not in SCORING_ENGINES:
+        raise ValueError(f"Unknown scoring engine: {engine!r}")
+    if engine == "numpy":
+        from app.services.scoring_numpy import score_recipes_numpy
+
+        return score_recipes_numpy(recipes, inventory_items, now)
+
+    scorer = RecipeScorer(inventory_items, now)
+    scored: list[tuple[RecipeCandidate, int]] = []
+    for recipe in recipes:
+        score = scorer.score(recipe)
+        if score is not None:
+            scored.append((recipe, score))
+    return scored
+
+
+def select_top_k(
+    recipes: list[RecipeCandidate],
+    inventory_items: InventoryLike,
+    now: datetime,
+    k: int,
+    engine: str = "python",
+) -> list[tuple[RecipeCandidate, int]]:
+    """
+    The first k of `score_recipes` sorted by descending score, with ties kept
+    in pool order (the same result as a stable sort then slice).
+
+    The Python engine keeps a k-sized heap and skips recipes whose upper
+    bound (MAX_URGENCY_POINTS per ingredient) cannot beat the current k-th
+    best; later recipes lose ties, so an equal bound is skipped too.
+    """
+    if k <= 0:
+        return []
+    if engine != "python":
+        scored = score_recipes(recipes, inventory_items, now, engine=engine)
+        return heapq.nsmallest(k, scored, key=lambda x: -x[1])
+
+    scorer = RecipeScorer(inventory_items, now)
+    top = top_k_scores(
+        ((index, [i.name for i in recipe.ingredients]) for index, recipe in enumerate(recipes)),
+        scorer,
+        k,
+    )
+    return [(recipes[index], score) for score, index in top]
+
+
+def top_k_scores(
+    entries: Iterable[tuple[int, Sequence[str]]],
+    scorer: RecipeScorer,
+    k: int,
+) -> list[tuple[int, int]]:
+    """
+    Heap selection behind `select_top_k` over (index, ingredient names)
+    entries given in ascending index order. Returns (score, index) pairs,
+    best first.
+    """
+    # Min-heap of (score, -index): the root is the current k-th best.
+    heap: list[tuple[int, int]] = []
+
+    for index, names in entries:
+        full = len(heap) >= k
+        if full and MAX_URGENCY_POINTS * len(names) <= heap[0][0]:
+            continue
+
+        score = scorer.score_names(names)
+        if score is None:
+            continue
+
+        if not full:
+            heapq.heappush(heap, (score, -index))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -index))
+
+    heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+    return [(score, -neg_index) for score, neg_index in heap]
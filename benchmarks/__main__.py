@@ -0,0 +1,117 @@
+"""
+Benchmark runner.
+
+    python -m benchmarks run --scale medium --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.15
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from benchmarks import macro, micro
+from benchmarks.generators import SCALES
+
+
+SUITES = {"micro": micro.run, "macro": macro.run}
+
+
+def run_suites(scale_name: str, suites: Sequence[str], seed: int, repeat: int) -> dict:
+    scale = SCALES[scale_name]
+    results: dict[str, dict] = {}
+    for suite in suites:
+        for measurement in SUITES[suite](scale, seed, repeat):
+            results[measurement.name] = measurement.as_dict()
+    return {
+        "meta": {
+            "scale": scale_name,
+            "seed": seed,
+            "repeat": repeat,
+            "suites": list(suites),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    """
+    One row per benchmark present in both files. A row is a regression when
+    the current median exceeds the baseline median by more than `threshold`
+    (a fraction, so 0.1 means 10% slower).
+    """
+    rows = []
+    for name, base in baseline["results"].items():
+        cur = current["results"].get(name)
+        if cur is None:
+            continue
+        ratio = cur["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": base["median_s"],
+                "current_s": cur["median_s"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def _run(args: argparse.Namespace) -> int:
+    report = run_suites(args.scale, args.suite, args.seed, args.repeat)
+    for name, result in report["results"].items():
+        print(f"{name:<36} median {result['median_s'] * 1000:>10.3f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"wrote {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    with open(args.current, encoding="utf-8") as fh:
+        current = json.load(fh)
+
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<36} {row['baseline_s'] * 1000:>10.3f} ms -> "
+            f"{row['current_s'] * 1000:>10.3f} ms  x{row['ratio']:.2f} {flag}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmark suites and optionally save JSON.")
+    run.add_argument("--scale", choices=sorted(SCALES), default="small")
+    run.add_argument("--suite", choices=sorted(SUITES), nargs="+", default=["micro", "macro"])
+    run.add_argument("--seed", type=int, default=196)
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--output", help="Path for the JSON results.")
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser("compare", help="Flag regressions against a stored baseline.")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.1)
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
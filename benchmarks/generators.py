@@ -0,0 +1,97 @@
+"""
+Seeded synthetic data for benchmarks: inventories and recipe pools with
+realistic grocery names, at a few fixed scales.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from app.db.models import InventoryItem
+from app.schemas.recipe import Ingredient, RecipeCandidate
+
+
+BRANDS = ["Chobani", "Barilla", "Kirkland", "Trader Joe's", "Organic Valley", "Great Value", "Bob's Red Mill"]
+ADJECTIVES = ["whole", "organic", "frozen", "fresh", "low fat", "unsalted", "baby", "wild", "smoked", "dried"]
+FOODS = [
+    "milk", "oat milk", "eggs", "butter", "cheddar", "yogurt", "pasta", "rice", "quinoa", "lentils",
+    "tomato sauce", "salsa", "peas", "spinach", "kale", "carrots", "onion", "garlic", "potatoes",
+    "sweet potato", "chicken breast", "ground beef", "salmon", "tofu", "black beans", "chickpeas",
+    "bread", "tortillas", "apples", "bananas", "avocado", "lemons", "broccoli", "mushrooms",
+    "bell pepper", "zucchini", "corn", "flour", "sugar", "olive oil", "soy sauce", "peanut butter",
+]
+UNITS = ["cup", "g", "tbsp", "tsp", "oz", "item"]
+
+
+@dataclass(frozen=True)
+class Scale:
+    inventory: int
+    recipes: int
+    batch: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(inventory=50, recipes=200, batch=50),
+    "medium": Scale(inventory=300, recipes=2000, batch=200),
+    "large": Scale(inventory=1000, recipes=10000, batch=1000),
+}
+
+
+def grocery_name(rng: random.Random) -> str:
+    parts = []
+    if rng.random() < 0.3:
+        parts.append(rng.choice(BRANDS))
+    if rng.random() < 0.4:
+        parts.append(rng.choice(ADJECTIVES))
+    parts.append(rng.choice(FOODS))
+    return " ".join(parts)
+
+
+def inventory_payload(rng: random.Random, size: int) -> list[dict]:
+    """Rows shaped like POST /api/v1/inventory items."""
+    return [{"name": grocery_name(rng), "quantity": rng.randint(1, 6)} for _ in range(size)]
+
+
+def inventory_items(rng: random.Random, size: int, today: date) -> list[InventoryItem]:
+    items = []
+    for i in range(size):
+        estimated = today + timedelta(days=rng.randint(-3, 60))
+        override = today + timedelta(days=rng.randint(-2, 10)) if rng.random() < 0.1 else None
+        items.append(
+            InventoryItem(
+                item_id=f"item-{i}",
+                name=grocery_name(rng),
+                quantity=float(rng.randint(1, 6)),
+                created_at=datetime.combine(today, datetime.min.time()),
+                location="unknown",
+                storage_guidance="",
+                category="unknown",
+                is_staple=False,
+                opened=False,
+                expiration_date_estimated=estimated,
+                expiration_date_user_override=override,
+                expired_flag=False,
+            )
+        )
+    return items
+
+
+def recipe_pool(rng: random.Random, size: int) -> list[RecipeCandidate]:
+    return [
+        RecipeCandidate(
+            recipe_id=f"bench-{i}",
+            title=f"Benchmark Recipe {i}",
+            servings=rng.randint(1, 6),
+            ingredients=[
+                Ingredient(
+                    name=rng.choice(FOODS) if rng.random() < 0.8 else grocery_name(rng),
+                    amount=rng.randint(1, 500),
+                    unit=rng.choice(UNITS),
+                )
+                for _ in range(rng.randint(3, 12))
+            ],
+            instructions=["Prep ingredients.", "Cook.", "Serve."],
+        )
+        for i in range(size)
+    ]
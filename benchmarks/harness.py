@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class Measurement:
+    name: str
+    runs: int
+    min_s: float
+    median_s: float
+    mean_s: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def measure(name: str, fn: Callable[[], object], repeat: int = 5, warmup: int = 1) -> Measurement:
+    """
+    Time `fn` `repeat` times after `warmup` untimed calls, with GC paused
+    during each timed call.
+    """
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return Measurement(
+        name=name,
+        runs=repeat,
+        min_s=min(timings),
+        median_s=statistics.median(timings),
+        mean_s=statistics.fmean(timings),
+    )
@@ -0,0 +1,102 @@
+"""
+Per-request inventory cost of mealplan scoring: loading ORM InventoryItems
+every request against the cached InventorySnapshot, in time and memory.
+
+    python -m benchmarks.inventory_snapshot --sizes 500 5000 20000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.engine import ENGINE_PROFILES, build_engine
+from app.db.models import Base, InventoryItem
+from app.services.inventory_snapshot import InventorySnapshot, InventorySnapshotCache
+from app.services.scoring import select_top_k
+from benchmarks.generators import inventory_items, recipe_pool
+
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def _rows(size: int) -> list[dict]:
+    columns = [c.name for c in InventoryItem.__table__.columns]
+    return [{c: getattr(item, c) for c in columns} for item in inventory_items(random.Random(0), size, NOW.date())]
+
+
+def _per_request(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _retained(fn) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = fn()  # noqa: F841 - measured while alive
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 20000])
+    parser.add_argument("--recipes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    recipes = recipe_pool(random.Random(1), args.recipes)
+    print(f"{'items':>7} {'orm ms':>8} {'snap ms':>8} {'speedup':>7} {'orm KiB':>9} {'snap KiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = Path(tmp) / f"inv-{size}.db"
+            engine = build_engine(f"sqlite:///{path}", ENGINE_PROFILES["production"])
+            Base.metadata.create_all(engine)
+            with engine.begin() as conn:
+                conn.execute(insert(InventoryItem), _rows(size))
+            Session = sessionmaker(bind=engine)
+            cache = InventorySnapshotCache()
+
+            def orm_items() -> list[InventoryItem]:
+                with Session() as session:
+                    return list(session.execute(select(InventoryItem)).scalars())
+
+            def snapshot() -> InventorySnapshot:
+                with Session() as session:
+                    return cache.get(session)
+
+            def orm_request() -> None:
+                select_top_k(recipes, orm_items(), NOW, 5)
+
+            def snapshot_request() -> None:
+                select_top_k(recipes, snapshot(), NOW, 5)
+
+            snapshot()  # warm the cache; later requests reuse it
+            orm_s = _per_request(orm_request, args.repeat)
+            snap_s = _per_request(snapshot_request, args.repeat)
+            orm_kib = _retained(orm_items) / 1024
+            cache.clear()
+            snap_kib = _retained(snapshot) / 1024
+            print(
+                f"{size:>7} {orm_s * 1000:>8.1f} {snap_s * 1000:>8.1f} {orm_s / snap_s:>7.1f}"
+                f" {orm_kib:>9.0f} {snap_kib:>9.0f}"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
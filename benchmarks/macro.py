@@ -0,0 +1,114 @@
+"""
+End-to-end benchmarks of the FastAPI endpoints through the ASGI test client,
+against a throwaway SQLite database.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import tempfile
+from pathlib import Path
+
+from benchmarks.generators import Scale, inventory_payload, recipe_pool
+from benchmarks.harness import Measurement, measure
+
+
+class _FixedPoolProvider:
+    """Serves a recipe pool from memory, so only scoring grows with its size."""
+
+    def __init__(self, pool: list) -> None:
+        self.pool = pool
+
+    def search_recipes(self, preferences: dict | None = None, limit: int = 15) -> list:
+        return self.pool[:limit]
+
+
+def _configure_database(path: Path) -> None:
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.setdefault("DB_PROFILE", "production")
+    # generate ranks the catalog against the inventory, but asks for only
+    # MEALPLAN_CANDIDATE_POOL_SIZE (15) recipes whatever the scale; the
+    # .scale_pool scenario scores all of them.
+    os.environ.setdefault("RECIPE_PROVIDERS", "catalog")
+
+    from app.db.engine import get_async_engine, get_engine
+    from app.db.models import init_db
+    from app.db.session import configure_async_session, configure_session
+    from app.services.mealplan_cache import get_mealplan_cache
+    from app.services.provider_factory import get_recipe_provider
+
+    get_engine.cache_clear()
+    get_async_engine.cache_clear()
+    get_recipe_provider.cache_clear()
+    get_mealplan_cache.cache_clear()
+    configure_session()
+    configure_async_session()
+    init_db()
+
+
+def run(scale: Scale, seed: int, repeat: int) -> list[Measurement]:
+    rng = random.Random(seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _configure_database(Path(tmp) / "bench.db")
+
+        from fastapi.testclient import TestClient
+
+        from app.db.session import SessionLocal
+        from app.main import app
+        from app.services.mealplan_cache import get_mealplan_cache
+        from app.services.provider_factory import get_recipe_provider
+        from app.services.recipe_catalog import load_recipes
+
+        # Per-request access logs would dominate the timings.
+        logging.getLogger().setLevel(logging.WARNING)
+
+        pool = recipe_pool(rng, scale.recipes)
+        with SessionLocal() as session:
+            load_recipes(session, pool)
+
+        client = TestClient(app)
+        client.post("/api/v1/inventory", json={"items": inventory_payload(rng, scale.inventory)})
+
+        batch = {"items": inventory_payload(rng, scale.batch)}
+
+        def post_inventory() -> None:
+            assert client.post("/api/v1/inventory", json=batch).status_code == 200
+
+        def get_inventory() -> None:
+            assert client.get("/api/v1/inventory").status_code == 200
+
+        def get_inventory_page() -> None:
+            assert client.get("/api/v1/inventory", params={"limit": 50, "location": "fridge"}).status_code == 200
+
+        def generate() -> None:
+            # A fresh result cache, so this measures the full generate path.
+            get_mealplan_cache.cache_clear()
+            assert client.post("/api/v1/mealplan/generate", json={}).status_code == 200
+
+        def generate_cached() -> None:
+            assert client.post("/api/v1/mealplan/generate", json={}).status_code == 200
+
+        def scale_pool_scenario() -> Measurement:
+            # The whole scale-sized pool goes through the API and is scored.
+            app.dependency_overrides[get_recipe_provider] = lambda: _FixedPoolProvider(pool)
+            os.environ["MEALPLAN_CANDIDATE_POOL_SIZE"] = str(len(pool))
+            try:
+                response = client.post("/api/v1/mealplan/generate", json={})
+                assert response.json()["candidate_pool_size"] == len(pool)
+                return measure("api.mealplan_generate.scale_pool", generate, repeat)
+            finally:
+                del os.environ["MEALPLAN_CANDIDATE_POOL_SIZE"]
+                app.dependency_overrides.pop(get_recipe_provider)
+
+        results = [
+            measure("api.get_inventory", get_inventory, repeat),
+            measure("api.get_inventory.page", get_inventory_page, repeat),
+            measure("api.mealplan_generate", generate, repeat),
+            measure("api.mealplan_generate.cached", generate_cached, repeat),
+            scale_pool_scenario(),
+            measure("api.post_inventory", post_inventory, repeat),
+        ]
+        client.close()
+        return results
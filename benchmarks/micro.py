@@ -0,0 +1,75 @@
+"""
+In-process microbenchmarks for classification, expiration estimation and
+scoring.
+"""
+from __future__ import annotations
+
+import importlib.util
+import random
+from datetime import datetime
+
+from app.services.classifiers import classify, get_classifier_engine
+from app.services.expiration_service import estimate_expiration
+from app.services.scoring import (
+    InventoryMatchIndex,
+    filter_ineligible,
+    match_inventory,
+    score_recipes,
+    select_top_k,
+    waste_score,
+)
+from benchmarks.generators import Scale, grocery_name, inventory_items, recipe_pool
+from benchmarks.harness import Measurement, measure
+
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def run(scale: Scale, seed: int, repeat: int) -> list[Measurement]:
+    rng = random.Random(seed)
+    names = [grocery_name(rng) for _ in range(scale.batch * 10)]
+    inventory = inventory_items(rng, scale.inventory, NOW.date())
+    recipes = recipe_pool(rng, scale.recipes)
+    ingredient_names = [i.name for r in recipes for i in r.ingredients][:5000]
+    categories = [classify(name).category for name in names]
+
+    get_classifier_engine()
+    results = [
+        measure("classifiers.classify", lambda: [classify(n) for n in names], repeat),
+        measure(
+            "expiration.estimate_expiration",
+            lambda: [estimate_expiration(NOW, c, opened=False) for c in categories],
+            repeat,
+        ),
+        measure(
+            "scoring.match_inventory.linear",
+            lambda: [match_inventory(n, inventory) for n in ingredient_names[:500]],
+            repeat,
+        ),
+        measure("scoring.match_index.build", lambda: InventoryMatchIndex(inventory), repeat),
+    ]
+
+    index = InventoryMatchIndex(inventory)
+    results += [
+        measure(
+            "scoring.match_inventory.index",
+            lambda: [match_inventory(n, index) for n in ingredient_names[:500]],
+            repeat,
+        ),
+        measure(
+            "scoring.two_pass",
+            lambda: [waste_score(r, index, NOW) for r in filter_ineligible(recipes, index, NOW)],
+            repeat,
+        ),
+        measure("scoring.score_recipes.python", lambda: score_recipes(recipes, inventory, NOW), repeat),
+        measure("scoring.select_top_k.python", lambda: select_top_k(recipes, inventory, NOW, 5), repeat),
+    ]
+    if importlib.util.find_spec("numpy") is not None:
+        results.append(
+            measure(
+                "scoring.score_recipes.numpy",
+                lambda: score_recipes(recipes, inventory, NOW, engine="numpy"),
+                repeat,
+            )
+        )
+    return results
@@ -0,0 +1,129 @@
+"""
+Per-request overhead of the request-id logging middleware: the previous
+BaseHTTPMiddleware version against the pure ASGI one, both over a bare
+endpoint and with logging on (queued and direct to a stream).
+
+    python -m benchmarks.middleware_overhead --requests 5000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import logging
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.main import RequestLoggingMiddleware
+
+logger = logging.getLogger("app.main")
+
+
+class _BaseHTTPRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The middleware as it was before the pure ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        logger.info("request_id=%s method=%s path=%s", request_id, request.method, request.scope.get("path", ""))
+        return await call_next(request)
+
+
+async def _ping(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+def _app(middleware=None):
+    app = Starlette(routes=[Route("/ping", _ping)])
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def _drive(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - started
+
+
+def _with_handler(handler: logging.Handler | None, fn):
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    root.handlers = [handler] if handler is not None else []
+    root.setLevel(logging.INFO if handler is not None else logging.WARNING)
+    try:
+        return fn()
+    finally:
+        root.handlers, level = saved
+        root.setLevel(level)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    variants = {
+        "none": None,
+        "base_http": _BaseHTTPRequestLoggingMiddleware,
+        "pure_asgi": RequestLoggingMiddleware,
+    }
+    # A real file, so every record costs a write syscall as stderr would.
+    stream = tempfile.TemporaryFile("w")
+    records: SimpleQueue = SimpleQueue()
+    listener = QueueListener(records, logging.StreamHandler(stream))
+    listener.start()
+    handlers = {
+        "off": None,
+        "stream": logging.StreamHandler(stream),
+        "queued": QueueHandler(records),
+    }
+    try:
+        print(f"{'middleware':<10} {'logging':<8} {'us/request':>10} {'overhead us':>11}")
+        for log_name, handler in handlers.items():
+            baseline = None
+            for name, middleware in variants.items():
+                app = _app(middleware)
+                _with_handler(handler, lambda: asyncio.run(_drive(app, 200)))  # warm up
+                elapsed = _with_handler(handler, lambda: asyncio.run(_drive(app, args.requests)))
+                per_request = elapsed / args.requests * 1e6
+                if baseline is None:
+                    baseline = per_request
+                print(f"{name:<10} {log_name:<8} {per_request:>10.1f} {per_request - baseline:>11.1f}")
+    finally:
+        listener.stop()
+        stream.close()
+
+
+if __name__ == "__main__":
+    main()
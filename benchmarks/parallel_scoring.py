@@ -0,0 +1,61 @@
+"""
+Speedup of ParallelScorer over in-process select_top_k by pool size and
+worker count.
+
+    python -m benchmarks.parallel_scoring --sizes 2000 10000 50000 --workers 1 2 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from datetime import datetime
+
+from app.services.parallel_scoring import ParallelScorer
+from app.services.scoring import select_top_k
+from benchmarks.generators import inventory_items, recipe_pool
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 10000, 50000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--inventory", type=int, default=300)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    inventory = inventory_items(rng, args.inventory, now.date())
+    workers = sorted(set(w for w in args.workers if w > 1))
+
+    print(f"cpu_count={os.cpu_count()} inventory={args.inventory} k={args.k}")
+    print(f"{'pool':>8} {'single ms':>10} " + " ".join(f"{f'x{w} ms':>9} {'speedup':>7}" for w in workers))
+    for size in args.sizes:
+        recipes = recipe_pool(rng, size)
+        single = _best_of(lambda: select_top_k(recipes, inventory, now, args.k), args.repeat)
+        cells = []
+        for w in workers:
+            scorer = ParallelScorer(max_workers=w, min_pool_size=0)
+            scorer.select_top_k(recipes, inventory, now, args.k)  # warm the pool
+            try:
+                elapsed = _best_of(lambda: scorer.select_top_k(recipes, inventory, now, args.k), args.repeat)
+            finally:
+                scorer.close()
+            cells.append(f"{elapsed * 1000:>9.1f} {single / elapsed:>7.2f}")
+        print(f"{size:>8} {single * 1000:>10.1f} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
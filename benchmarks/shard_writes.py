@@ -0,0 +1,103 @@
+"""
+Write throughput with every household in one SQLite file against one file
+per household: one writer thread per household, each committing small
+inventory batches.
+
+    python -m benchmarks.shard_writes --households 1 2 4 8 --seconds 5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.db.engine import ENGINE_PROFILES, build_engine
+from app.db.models import Base, InventoryItem
+from app.db.shards import ShardRouter
+from app.services.inventory_version import bump_inventory_version
+
+
+def _row() -> dict:
+    return {
+        "item_id": str(uuid4()),
+        "name": "oat milk",
+        "quantity": 1.0,
+        "created_at": datetime.utcnow(),
+        "location": "fridge",
+        "storage_guidance": "Refrigerate.",
+        "category": "dairy_alt",
+        "is_staple": False,
+        "opened": False,
+        "expiration_date_estimated": date.today(),
+        "expiration_date_user_override": None,
+        "expired_flag": False,
+    }
+
+
+def run(engines: list[Engine], seconds: float, batch: int) -> dict[str, float]:
+    stop = threading.Event()
+    counts = {"commits": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def writer(engine: Engine) -> None:
+        while not stop.is_set():
+            try:
+                with Session(engine) as session:
+                    session.execute(insert(InventoryItem), [_row() for _ in range(batch)])
+                    bump_inventory_version(session)
+                    session.commit()
+                key = "commits"
+            except OperationalError:
+                key = "errors"
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=writer, args=(engine,)) for engine in engines]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return {"commits_per_s": counts["commits"] / elapsed, "errors": counts["errors"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--households", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--batch", type=int, default=20)
+    args = parser.parse_args()
+
+    profile = ENGINE_PROFILES["production"]
+    print(f"{'households':>10} {'shared/s':>10} {'per-household/s':>16}")
+    for households in args.households:
+        with tempfile.TemporaryDirectory() as tmp:
+            shared = build_engine(f"sqlite:///{tmp}/shared.db", profile)
+            Base.metadata.create_all(shared)
+            shared_result = run([shared] * households, args.seconds, args.batch)
+            shared.dispose()
+
+            router = ShardRouter(f"sqlite:///{tmp}/household-{{household}}.db", profile, max_engines=households)
+            engines = [router.shard(f"h{n}", create=True).engine for n in range(households)]
+            routed_result = run(engines, args.seconds, args.batch)
+            asyncio.run(router.dispose())
+        print(
+            f"{households:>10} {shared_result['commits_per_s']:>10.1f}"
+            f" {routed_result['commits_per_s']:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Read/write concurrency on one SQLite file: a plain engine (what get_engine
+built before profiles existed) against each named engine profile.
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --seconds 5
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from app.db.engine import ENGINE_PROFILES, build_engine
+from app.db.models import Base, InventoryItem
+
+
+def _baseline_engine(url: str) -> Engine:
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def _row() -> dict:
+    return {
+        "item_id": str(uuid4()),
+        "name": "oat milk",
+        "quantity": 1.0,
+        "created_at": datetime.utcnow(),
+        "location": "fridge",
+        "storage_guidance": "Refrigerate.",
+        "category": "dairy_alt",
+        "is_staple": False,
+        "opened": False,
+        "expiration_date_estimated": date.today(),
+        "expiration_date_user_override": None,
+        "expired_flag": False,
+    }
+
+
+def run(engine: Engine, readers: int, seconds: float) -> dict[str, float]:
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(InventoryItem), [_row() for _ in range(2000)])
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def bump(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                with engine.connect() as conn:
+                    conn.execute(select(func.count()).select_from(InventoryItem)).scalar_one()
+                bump("reads")
+            except OperationalError:
+                bump("errors")
+
+    def writer() -> None:
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(InventoryItem), [_row() for _ in range(50)])
+                bump("writes")
+            except OperationalError:
+                bump("errors")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    return {
+        "reads_per_s": counts["reads"] / seconds,
+        "writes_per_s": counts["writes"] / seconds,
+        "errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'engine':<12} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [("baseline", _baseline_engine)]
+        variants += [
+            (name, lambda url, profile=profile: build_engine(url, profile))
+            for name, profile in ENGINE_PROFILES.items()
+        ]
+        for name, factory in variants:
+            url = f"sqlite:///{Path(tmp) / f'{name}.db'}"
+            result = run(factory(url), args.readers, args.seconds)
+            print(
+                f"{name:<12} {result['reads_per_s']:>10.0f} "
+                f"{result['writes_per_s']:>10.0f} {result['errors']:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,13 @@ import sys
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.db.engine import get_engine
+from app.db.engine import get_async_engine, get_engine
 from app.db.models import init_db
-from app.db.session import configure_session
+from app.db.session import configure_async_session, configure_session
+from app.db.shards import get_shard_router
+from app.services.inventory_snapshot import get_inventory_snapshot_cache
+from app.services.mealplan_cache import get_mealplan_cache
+from app.services.provider_factory import get_recipe_provider
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -26,8 +30,15 @@ def _test_database(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest
     db_dir = tmp_path_factory.mktemp("db")
     db_path = db_dir / "test.db"
     monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("DB_PROFILE", "test")
 
     get_engine.cache_clear()
+    get_async_engine.cache_clear()
+    get_recipe_provider.cache_clear()
+    get_mealplan_cache.cache_clear()
+    get_inventory_snapshot_cache.cache_clear()
+    get_shard_router.cache_clear()
     configure_session()
+    configure_async_session()
     init_db()
 
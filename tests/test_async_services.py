@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.db.session import AsyncSessionLocal, SessionLocal
+from app.services import mealplan_service
+from app.services.inventory_service import AsyncInventoryService, InventoryService
+from app.services.mealplan_service import generate_mealplan, generate_mealplan_async
+from app.services.recipe_provider import StubRecipeProvider
+
+
+def test_async_inventory_service_add_list_delete() -> None:
+    async def scenario() -> tuple[list, list]:
+        async with AsyncSessionLocal() as session:
+            service = AsyncInventoryService(session)
+            created = await service.add_items(
+                [{"name": "oat milk", "quantity": 1}, {"name": "rice", "quantity": 2}]
+            )
+            await service.delete_item(created[0].item_id)
+            remaining, next_cursor = await service.list_items()
+            assert next_cursor is None
+            return created, remaining
+
+    created, remaining = asyncio.run(scenario())
+
+    assert [item.category for item in created] == ["dairy_alt", "grain"]
+    assert [item.item_id for item in remaining] == [created[1].item_id]
+
+    # The sync path sees the same rows.
+    with SessionLocal() as session:
+        items, _ = InventoryService(session).list_items()
+    assert [item.item_id for item in items] == [created[1].item_id]
+
+
+def test_generate_mealplan_async_matches_sync() -> None:
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": "oat milk", "quantity": 1}])
+
+    now = datetime.utcnow()
+    provider = StubRecipeProvider()
+
+    with SessionLocal() as session:
+        expected = generate_mealplan(session, provider, now=now)
+
+    async def scenario():
+        async with AsyncSessionLocal() as session:
+            return await generate_mealplan_async(session, provider, now=now)
+
+    visible, pool_size = asyncio.run(scenario())
+
+    assert pool_size == expected[1]
+    assert [r.recipe_id for r in visible] == [r.recipe_id for r in expected[0]]
+
+
+def test_generate_mealplan_async_scores_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads = []
+    original = mealplan_service.rank_candidates
+
+    def recording(*args):
+        threads.append(threading.current_thread())
+        return original(*args)
+
+    monkeypatch.setattr(mealplan_service, "rank_candidates", recording)
+
+    async def scenario():
+        async with AsyncSessionLocal() as session:
+            await generate_mealplan_async(session, StubRecipeProvider())
+
+    asyncio.run(scenario())
+
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,33 @@
+import random
+from datetime import date
+
+from benchmarks.__main__ import compare
+from benchmarks.generators import inventory_items, inventory_payload, recipe_pool
+
+
+def _report(**medians: float) -> dict:
+    return {"results": {name: {"median_s": value} for name, value in medians.items()}}
+
+
+def test_compare_flags_only_regressions_beyond_threshold() -> None:
+    baseline = _report(fast=1.0, steady=1.0, slower=1.0, removed=1.0)
+    current = _report(fast=0.5, steady=1.05, slower=1.5, added=1.0)
+
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=0.1)}
+
+    assert set(rows) == {"fast", "steady", "slower"}
+    assert [name for name, row in rows.items() if row["regression"]] == ["slower"]
+    assert rows["slower"]["ratio"] == 1.5
+
+
+def test_generators_are_deterministic_for_a_seed() -> None:
+    def names(seed: int) -> tuple:
+        rng = random.Random(seed)
+        return (
+            [row["name"] for row in inventory_payload(rng, 20)],
+            [item.name for item in inventory_items(rng, 20, date(2024, 1, 1))],
+            [r.model_dump() for r in recipe_pool(rng, 5)],
+        )
+
+    assert names(7) == names(7)
+    assert names(7) != names(8)
@@ -0,0 +1,80 @@
+import json
+import random
+
+from app.services.classifiers import ClassifierEngine, classify
+
+
+_LOCATIONS = {
+    "fridge": ["milk", "oat milk", "eggs", "egg"],
+    "pantry": ["pasta", "rice", "tomato sauce", "sauce"],
+    "freezer": ["frozen", "frozen peas", "peas"],
+}
+_CATEGORIES = {
+    "dairy_alt": ["oat milk"],
+    "dairy": ["milk"],
+    "grain": ["pasta", "rice"],
+    "produce": ["peas"],
+    "protein": ["eggs", "egg"],
+    "condiment": ["tomato sauce", "sauce"],
+    "frozen": ["frozen", "frozen peas"],
+}
+
+
+def _first_match(name: str, table: dict[str, list[str]]) -> str:
+    lowered = name.lower()
+    for label, keywords in table.items():
+        for kw in keywords:
+            if kw in lowered:
+                return label
+    return "unknown"
+
+
+def test_engine_matches_nested_loop_first_match_semantics() -> None:
+    engine = ClassifierEngine(_LOCATIONS, _CATEGORIES)
+    rng = random.Random(4)
+    fragments = ["oat", " milk", "egg", "s", "Frozen", " peas", "tomato", " sauce", "rice", "x", " "]
+
+    for _ in range(2000):
+        name = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 5)))
+        assert engine.location_and_category(name) == (
+            _first_match(name, _LOCATIONS),
+            _first_match(name, _CATEGORIES),
+        )
+
+
+def test_engine_handles_overlapping_and_suffix_keywords() -> None:
+    locations = {"a": ["bcd"], "b": ["abcde"], "c": ["cd"]}
+    categories = {"x": ["e"], "y": ["abc"]}
+    engine = ClassifierEngine(locations, categories)
+
+    for name in ["abcde", "xabcdx", "abce", "cd", "", "zzz"]:
+        assert engine.location_and_category(name) == (
+            _first_match(name, locations),
+            _first_match(name, categories),
+        )
+
+
+def test_engine_loads_tables_from_file(tmp_path) -> None:
+    path = tmp_path / "keywords.json"
+    path.write_text(
+        json.dumps(
+            {
+                "location": {"fridge": ["yogurt"], "pantry": ["lentils"]},
+                "category": {"dairy": ["yogurt"], "legume": ["lentils"]},
+            }
+        )
+    )
+
+    result = ClassifierEngine.from_file(path).classify("Red Lentils")
+
+    assert result.location == "pantry"
+    assert result.category == "legume"
+    assert "pantry" in result.storage_guidance.lower()
+
+
+def test_classify_uses_default_tables() -> None:
+    result = classify("Oat Milk")
+
+    assert result.location == "fridge"
+    assert result.category == "dairy_alt"
+    assert "Refrigerate" in result.storage_guidance
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import text
+
+from app.db.engine import ENGINE_PROFILES, build_engine, get_engine, get_engine_profile
+from app.db.session import SessionLocal, get_db
+
+
+def _pragma(engine, name: str):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar_one()
+
+
+def test_test_profile_pragmas_are_applied_on_connect() -> None:
+    engine = get_engine()
+
+    assert _pragma(engine, "journal_mode") == "memory"
+    assert _pragma(engine, "synchronous") == 0
+    assert _pragma(engine, "busy_timeout") == 5000
+
+
+def test_production_profile_enables_wal_and_sizes_pool(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'prod.db'}", ENGINE_PROFILES["production"])
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1
+        assert _pragma(engine, "mmap_size") == 268435456
+        assert engine.pool.size() == 10
+    finally:
+        engine.dispose()
+
+
+def test_unknown_profile_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DB_PROFILE", "turbo")
+    with pytest.raises(ValueError):
+        get_engine_profile()
+
+
+def test_get_db_does_not_rebind_session_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr("app.db.session.configure_session", lambda: calls.append(1))
+
+    gen = get_db()
+    db = next(gen)
+    gen.close()
+
+    assert calls == []
+    assert db.get_bind() is SessionLocal.kw["bind"]
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from app.cli import main
+from app.db.models import InventoryItem
+from app.db.session import SessionLocal
+from app.services.expiry_maintenance import ExpirySweeper, refresh_expired_flags
+
+
+def _item(item_id: str, estimated: date | None, override: date | None, flag: bool) -> InventoryItem:
+    return InventoryItem(
+        item_id=item_id,
+        name=item_id,
+        quantity=1.0,
+        created_at=datetime(2024, 1, 1),
+        location="fridge",
+        storage_guidance="Refrigerate.",
+        category="dairy",
+        is_staple=False,
+        opened=False,
+        expiration_date_estimated=estimated,
+        expiration_date_user_override=override,
+        expired_flag=flag,
+    )
+
+
+def _flags() -> dict[str, bool]:
+    with SessionLocal() as session:
+        rows = session.execute(select(InventoryItem.item_id, InventoryItem.expired_flag))
+        return {item_id: flag for item_id, flag in rows}
+
+
+def test_refresh_expired_flags_recomputes_from_effective_expiration() -> None:
+    with SessionLocal() as session:
+        session.add_all(
+            [
+                _item("stale-fresh", date(2024, 1, 9), None, False),
+                _item("today", date(2024, 1, 10), None, True),
+                _item("override-wins", date(2024, 1, 5), date(2024, 1, 20), True),
+                _item("override-past", date(2024, 1, 20), date(2024, 1, 5), False),
+            ]
+        )
+        session.commit()
+
+    now = datetime(2024, 1, 10, 23, 0, 0)
+    with SessionLocal() as session:
+        assert refresh_expired_flags(session, now) == 4
+
+    assert _flags() == {
+        "stale-fresh": True,
+        "today": False,
+        "override-wins": False,
+        "override-past": True,
+    }
+
+    with SessionLocal() as session:
+        assert refresh_expired_flags(session, now) == 0
+
+
+def test_sweeper_runs_in_background_until_stopped() -> None:
+    with SessionLocal() as session:
+        session.add(_item("old", date(2000, 1, 1), None, False))
+        session.commit()
+
+    async def scenario() -> None:
+        sweeper = ExpirySweeper(SessionLocal, interval=60)
+        sweeper.start()
+        for _ in range(100):
+            if _flags()["old"]:
+                break
+            await asyncio.sleep(0.01)
+        await sweeper.stop()
+
+    asyncio.run(scenario())
+
+    assert _flags() == {"old": True}
+
+
+def test_cli_sweep_expired(capsys) -> None:
+    with SessionLocal() as session:
+        session.add(_item("old", date(2000, 1, 1), None, False))
+        session.commit()
+
+    assert main(["sweep-expired"]) == 0
+    assert "updated 1 item(s)" in capsys.readouterr().out
+    assert _flags() == {"old": True}
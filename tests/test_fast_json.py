@@ -0,0 +1,112 @@
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.api import responses
+from app.db.models import InventoryItem
+from app.db.session import SessionLocal
+from app.main import app
+from app.schemas.inventory import InventoryItemOut
+from app.schemas.mealplan import MealplanGenerateResponse
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.inventory_service import InventoryService
+
+
+client = TestClient(app)
+
+PLAIN_QUANTITIES = [1.0, 0.5, 2.25, 0.1 + 0.2, 12345.678]
+# orjson (1e16, 1e22) and the json module (1e-07) format these differently
+# from Pydantic, so they take the fallback.
+EXPONENT_QUANTITIES = PLAIN_QUANTITIES + [1e16, 1e22, 1e-7]
+
+
+def _seed(quantities: list[float] = PLAIN_QUANTITIES) -> None:
+    with SessionLocal() as session:
+        for i, quantity in enumerate(quantities):
+            session.add(
+                InventoryItem(
+                    item_id=f"item-{i}",
+                    name=f"Crème fraîche “{i}”   <tab>\t",
+                    quantity=quantity,
+                    created_at=datetime(2024, 5, 1, 9, 30, 0, i * 7),
+                    location="fridge",
+                    storage_guidance="Refrigerate.",
+                    category="dairy",
+                    is_staple=False,
+                    opened=False,
+                    expiration_date_estimated=date(2024, 5, 10),
+                    expiration_date_user_override=date(2024, 5, 8) if i % 2 else None,
+                    expired_flag=bool(i % 3),
+                )
+            )
+        session.commit()
+
+
+def _model_path_body() -> bytes:
+    # What FastAPI produced from ORM objects through response_model.
+    adapter = TypeAdapter(list[InventoryItemOut])
+    with SessionLocal() as session:
+        items, _ = InventoryService(session).list_items()
+        return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+
+@pytest.mark.parametrize("quantities", [PLAIN_QUANTITIES, EXPONENT_QUANTITIES])
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_inventory_list_bytes_match_model_path(
+    monkeypatch: pytest.MonkeyPatch,
+    use_orjson: bool,
+    quantities: list[float],
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    elif responses.orjson is None:
+        pytest.skip("orjson not installed")
+    _seed(quantities)
+
+    response = client.get("/api/v1/inventory")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == _model_path_body()
+
+
+def test_row_columns_follow_schema_field_order() -> None:
+    _seed()
+    with SessionLocal() as session:
+        rows, _ = InventoryService(session).list_item_rows(limit=2)
+
+    assert [list(row) for row in rows] == [list(InventoryItemOut.model_fields)] * 2
+
+
+def test_mealplan_bytes_match_model_path() -> None:
+    recipe = RecipeCandidate(
+        recipe_id="r1",
+        title="Big batch",
+        servings=4,
+        ingredients=[
+            Ingredient(name="oats", amount=2, unit="cup"),
+            Ingredient(name="salt", amount=1e-7, unit="g"),
+            Ingredient(name="water", amount=1e16, unit="ml"),
+        ],
+        instructions=["Mix.", "Cook – gently."],
+    )
+    expected = MealplanGenerateResponse(visible_candidates=[recipe], candidate_pool_size=1)
+    adapter = TypeAdapter(MealplanGenerateResponse)
+
+    response = responses.fast_json_response(
+        {"visible_candidates": [recipe.model_dump()], "candidate_pool_size": 1},
+        adapter,
+        floats=(i.amount for i in recipe.ingredients),
+    )
+
+    assert response.body == adapter.dump_json(expected)
+
+
+def test_mealplan_endpoint_matches_model_path() -> None:
+    response = client.post("/api/v1/mealplan/generate", json={})
+
+    assert response.status_code == 200
+    parsed = MealplanGenerateResponse.model_validate_json(response.content)
+    assert response.content == parsed.model_dump_json().encode("utf-8")
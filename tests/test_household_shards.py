@@ -0,0 +1,158 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, select
+
+from app.db.engine import ENGINE_PROFILES
+from app.db.models import InventoryItem
+from app.db.session import SessionLocal, household_session_factories
+from app.db.shards import HOUSEHOLD_HEADER, ShardRouter, UnknownHouseholdError, get_shard_router
+from app.main import app
+from app.services.mealplan_cache import get_mealplan_cache
+from app.services.provider_factory import get_recipe_provider
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def sharded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SHARD_URL_TEMPLATE", f"sqlite:///{tmp_path}/household-{{household}}.db")
+    get_shard_router.cache_clear()
+    router = get_shard_router()
+    yield router
+    asyncio.run(router.dispose())
+
+
+def test_router_evicts_least_recently_used_engine(tmp_path: Path) -> None:
+    router = ShardRouter(f"sqlite:///{tmp_path}/h-{{household}}.db", ENGINE_PROFILES["test"], max_engines=2)
+    try:
+        first = router.shard("a", create=True)
+        router.shard("b", create=True)
+        router.shard("a")
+        router.shard("c", create=True)
+
+        assert router.open_shards() == 2
+        assert router.cached("b") is None
+        assert router.cached("a") is first
+        assert router.evicted == 1
+        assert router.households() == ["a", "b", "c"]
+        for household in "abc":
+            assert "inventory_items" in inspect(router.shard(household).engine).get_table_names()
+    finally:
+        asyncio.run(router.dispose())
+
+
+def test_router_only_creates_databases_when_asked(tmp_path: Path) -> None:
+    router = ShardRouter(f"sqlite:///{tmp_path}/h-{{household}}.db", ENGINE_PROFILES["test"])
+    try:
+        with pytest.raises(UnknownHouseholdError):
+            router.shard("a")
+        assert router.households() == []
+
+        router.shard("a", create=True)
+        asyncio.run(router.dispose())
+
+        # Reopening an existing database does not need create=True.
+        assert "inventory_items" in inspect(router.shard("a").engine).get_table_names()
+    finally:
+        asyncio.run(router.dispose())
+
+
+def test_router_rejects_bad_template_and_household_ids(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ShardRouter("sqlite:///./one.db", ENGINE_PROFILES["test"])
+    router = ShardRouter(f"sqlite:///{tmp_path}/h-{{household}}.db", ENGINE_PROFILES["test"])
+    with pytest.raises(ValueError):
+        router.shard("../escape")
+
+
+def test_households_see_only_their_own_inventory(sharded: ShardRouter) -> None:
+    a, b = "alpha", "beta"
+
+    created = client.post(
+        "/api/v1/inventory",
+        json={"items": [{"name": "Oat Milk", "quantity": 1}]},
+        headers={HOUSEHOLD_HEADER: a},
+    )
+    assert created.status_code == 200
+
+    listed_a = client.get("/api/v1/inventory", headers={HOUSEHOLD_HEADER: a})
+    listed_b = client.get("/api/v1/inventory", headers={HOUSEHOLD_HEADER: b})
+    assert [item["name"] for item in listed_a.json()] == ["Oat Milk"]
+    # Reads do not create a database for a household that never wrote one.
+    assert listed_b.status_code == 404
+    assert sharded.households() == [a]
+    # Nothing reached the shared database.
+    with SessionLocal() as session:
+        assert session.execute(select(InventoryItem)).first() is None
+
+
+def test_household_header_is_required_when_sharded(sharded: ShardRouter) -> None:
+    response = client.get("/api/v1/inventory")
+
+    assert response.status_code == 400
+    assert HOUSEHOLD_HEADER in response.json()["detail"]
+    assert client.get("/api/v1/inventory", headers={HOUSEHOLD_HEADER: "../x"}).status_code == 422
+
+
+def test_mealplan_cache_is_not_shared_between_households(sharded: ShardRouter) -> None:
+    a, b = "alpha", "beta"
+    for household in (a, b):
+        # Both databases end up at inventory version 1.
+        client.post(
+            "/api/v1/inventory",
+            json={"items": [{"name": "Oat Milk", "quantity": 1}]},
+            headers={HOUSEHOLD_HEADER: household},
+        )
+    for household in (a, b):
+        response = client.post("/api/v1/mealplan/generate", json={}, headers={HOUSEHOLD_HEADER: household})
+        assert response.status_code == 200
+
+    stats = get_mealplan_cache().metrics()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 2
+
+
+def test_sweep_visits_every_household_database(sharded: ShardRouter) -> None:
+    for household in ("alpha", "beta"):
+        client.post(
+            "/api/v1/inventory",
+            json={"items": [{"name": "Oat Milk", "quantity": 1}]},
+            headers={HOUSEHOLD_HEADER: household},
+        )
+    client.get("/api/v1/inventory", headers={HOUSEHOLD_HEADER: "gamma"})
+
+    factories = household_session_factories()
+
+    assert len(factories) == 2
+    with factories[1]() as session:
+        assert str(session.get_bind().url) == sharded.url_for("beta")
+
+
+def test_etag_differs_between_households(sharded: ShardRouter) -> None:
+    for household in ("alpha", "beta"):
+        # Both databases end up at inventory version 1.
+        client.post(
+            "/api/v1/inventory",
+            json={"items": [{"name": f"{household} milk", "quantity": 1}]},
+            headers={HOUSEHOLD_HEADER: household},
+        )
+    first = client.get("/api/v1/inventory", headers={HOUSEHOLD_HEADER: "alpha"})
+
+    other = client.get(
+        "/api/v1/inventory",
+        headers={HOUSEHOLD_HEADER: "beta", "If-None-Match": first.headers["etag"]},
+    )
+
+    assert other.status_code == 200
+    assert [item["name"] for item in other.json()] == ["beta milk"]
+    assert first.headers["vary"] == HOUSEHOLD_HEADER
+
+
+def test_catalog_provider_is_refused_when_sharded(sharded: ShardRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RECIPE_PROVIDERS", "stub,catalog")
+
+    with pytest.raises(ValueError, match="SHARD_URL_TEMPLATE"):
+        get_recipe_provider()
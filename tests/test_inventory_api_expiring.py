@@ -0,0 +1,139 @@
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.db.engine import ENGINE_PROFILES, build_engine, get_engine
+from app.db.models import InventoryItem, create_schema
+from app.db.session import SessionLocal
+from app.main import app
+from app.services.expiration_service import effective_expiration
+from app.services.expiry_maintenance import refresh_expired_flags
+from app.services.inventory_service import InventoryService
+from app.services.scoring import URGENCY_BUCKETS, urgency_points
+
+
+client = TestClient(app)
+
+
+def _insert(item_id: str, estimated: date, override: date | None = None) -> None:
+    with SessionLocal() as session:
+        session.add(
+            InventoryItem(
+                item_id=item_id,
+                name=item_id,
+                quantity=1.0,
+                created_at=datetime(2024, 1, 1),
+                location="fridge",
+                storage_guidance="Refrigerate.",
+                category="dairy",
+                is_staple=False,
+                opened=False,
+                expiration_date_estimated=estimated,
+                expiration_date_user_override=override,
+                expired_flag=False,
+            )
+        )
+        session.commit()
+
+
+def test_buckets_cover_exactly_the_days_that_earn_urgency_points() -> None:
+    covered = [d for lo, hi in URGENCY_BUCKETS for d in range(lo, hi + 1)]
+    assert covered == list(range(URGENCY_BUCKETS[-1][1] + 1))
+    for lo, hi in URGENCY_BUCKETS:
+        assert len({urgency_points(d) for d in range(lo, hi + 1)}) == 1
+    assert urgency_points(URGENCY_BUCKETS[-1][1] + 1) == 0
+
+
+def test_expiring_items_are_bucketed_by_urgency() -> None:
+    today = datetime.utcnow().date()
+    for days in [-1, 0, 1, 2, 3, 4, 7, 8]:
+        _insert(f"d{days}", today + timedelta(days=days))
+    # The override wins over the estimate, as in effective_expiration.
+    _insert("override-soon", today + timedelta(days=30), override=today + timedelta(days=2))
+    _insert("override-late", today, override=today + timedelta(days=30))
+
+    response = client.get("/api/v1/inventory/expiring")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["today"] == today.isoformat()
+    assert [
+        (b["urgency_points"], b["min_days"], b["max_days"], [i["item_id"] for i in b["items"]])
+        for b in body["buckets"]
+    ] == [
+        (5, 0, 1, ["d0", "d1"]),
+        (3, 2, 3, ["d2", "override-soon", "d3"]),
+        (1, 4, 7, ["d4", "d7"]),
+    ]
+
+
+def test_expiring_matches_effective_expiration_for_every_item() -> None:
+    today = datetime.utcnow().date()
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": n, "quantity": 1} for n in ["Milk", "Bread", "Rice"]])
+        items = session.query(InventoryItem).all()
+        expiring = InventoryService(session).list_expiring(today, within_days=7)
+
+    expected = {
+        item.item_id: (eff - today).days
+        for item in items
+        if (eff := effective_expiration(item.expiration_date_estimated, item.expiration_date_user_override))
+        and 0 <= (eff - today).days <= 7
+    }
+    assert {row["item_id"]: days for days, row in expiring} == expected
+
+
+def test_expiring_query_is_one_index_range_scan() -> None:
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with SessionLocal() as session:
+            InventoryService(session).list_expiring(date(2024, 1, 1), within_days=7)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    (statement, parameters), = captured
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_inventory_items_expiration_date_effective" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_create_schema_upgrades_a_database_from_before_the_effective_column(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'legacy.db'}", ENGINE_PROFILES["test"])
+    with engine.begin() as conn:
+        # inventory_items as created before expiration_date_effective existed.
+        conn.exec_driver_sql(
+            "CREATE TABLE inventory_items (item_id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL,"
+            " quantity FLOAT NOT NULL, created_at DATETIME NOT NULL, location VARCHAR NOT NULL,"
+            " storage_guidance VARCHAR NOT NULL, category VARCHAR NOT NULL, is_staple BOOLEAN NOT NULL,"
+            " opened BOOLEAN NOT NULL, expiration_date_estimated DATE NOT NULL,"
+            " expiration_date_user_override DATE, expired_flag BOOLEAN NOT NULL)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO inventory_items VALUES ('old', 'old', 1.0, '2024-01-01 00:00:00.000000', 'fridge',"
+            " 'Refrigerate.', 'dairy', 0, 0, '2024-01-03', NULL, 0)"
+        )
+
+    try:
+        create_schema(engine)
+
+        with Session(engine) as session:
+            expiring = InventoryService(session).list_expiring(date(2024, 1, 1), within_days=7)
+            assert [(days, row["item_id"]) for days, row in expiring] == [(2, "old")]
+            assert refresh_expired_flags(session, now=datetime(2024, 2, 1)) == 1
+            InventoryService(session).delete_item("old")
+            assert session.get(InventoryItem, "old") is None
+        index_names = {index["name"] for index in inspect(engine).get_indexes("inventory_items")}
+        assert "ix_inventory_items_expiration_date_effective" in index_names
+    finally:
+        engine.dispose()
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.inventory_import import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    MAX_IMPORT_CHUNK_SIZE,
+    get_import_chunk_size,
+)
+
+
+client = TestClient(app)
+
+
+def test_import_ndjson_commits_in_chunks_and_reports_timings() -> None:
+    rows = [{"name": f"pasta {i}", "quantity": i + 1} for i in range(25)]
+    body = "\n".join(json.dumps(row) for row in rows) + "\n"
+
+    response = client.post(
+        "/api/v1/inventory/import?chunk_size=10",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["rows_imported"] == 25
+    assert summary["chunk_size"] == 10
+    assert [c["rows"] for c in summary["chunks"]] == [10, 10, 5]
+    assert [c["first_line"] for c in summary["chunks"]] == [1, 11, 21]
+    assert all(c["elapsed_ms"] >= 0 for c in summary["chunks"])
+
+    items = client.get("/api/v1/inventory").json()
+    assert len(items) == 25
+    assert {item["category"] for item in items} == {"grain"}
+
+
+def test_import_csv_handles_quoted_fields() -> None:
+    body = 'name,quantity\r\n"milk, whole",1\r\n"frozen\npeas",2\r\nrice,3\r\n'
+
+    response = client.post(
+        "/api/v1/inventory/import",
+        content=body.encode("utf-8"),
+        headers={"content-type": "text/csv; charset=utf-8"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["rows_imported"] == 3
+
+    names = sorted(item["name"] for item in client.get("/api/v1/inventory").json())
+    assert names == ["frozen\npeas", "milk, whole", "rice"]
+
+
+def test_import_reports_bad_row_and_keeps_committed_chunks() -> None:
+    lines = [json.dumps({"name": "rice", "quantity": 1})] * 3 + ["{not json"]
+
+    response = client.post(
+        "/api/v1/inventory/import?chunk_size=2",
+        content="\n".join(lines),
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["line"] == 4
+    assert response.json()["detail"]["rows_committed"] == 2
+    assert len(client.get("/api/v1/inventory").json()) == 2
+
+
+def test_import_reports_invalid_utf8_as_bad_row() -> None:
+    body = json.dumps({"name": "rice", "quantity": 1}).encode() + b'\n{"name": "a\xff", "quantity": 1}\n'
+
+    response = client.post(
+        "/api/v1/inventory/import?chunk_size=1",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == {"error": "invalid UTF-8", "line": 2, "rows_committed": 1}
+
+
+def test_import_rejects_unsupported_content_type() -> None:
+    response = client.post(
+        "/api/v1/inventory/import",
+        json={"items": []},
+    )
+
+    assert response.status_code == 415
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("250", 250),
+        ("lots", DEFAULT_IMPORT_CHUNK_SIZE),
+        ("0", 1),
+        ("-5", 1),
+        ("1000000", MAX_IMPORT_CHUNK_SIZE),
+    ],
+)
+def test_import_chunk_size_setting_is_clamped(monkeypatch: pytest.MonkeyPatch, value: str, expected: int) -> None:
+    monkeypatch.setenv("INVENTORY_IMPORT_CHUNK_SIZE", value)
+
+    assert get_import_chunk_size() == expected
@@ -0,0 +1,162 @@
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.db.engine import ENGINE_PROFILES, build_engine, get_engine
+from app.db.models import InventoryItem, create_schema, init_db
+from app.db.session import SessionLocal
+from app.main import app
+from app.services.inventory_service import InventoryService
+
+
+client = TestClient(app)
+
+
+def _insert(item_id: str, created_at: datetime, **overrides) -> None:
+    values = dict(
+        item_id=item_id,
+        name=item_id,
+        quantity=1.0,
+        created_at=created_at,
+        location="fridge",
+        storage_guidance="Refrigerate.",
+        category="dairy",
+        is_staple=False,
+        opened=False,
+        expiration_date_estimated=date(2024, 1, 10),
+        expiration_date_user_override=None,
+        expired_flag=False,
+    )
+    values.update(overrides)
+    with SessionLocal() as session:
+        session.add(InventoryItem(**values))
+        session.commit()
+
+
+def test_keyset_pagination_walks_all_items_in_order() -> None:
+    created_at = datetime(2024, 1, 1, 8, 0, 0)
+    # Several items share a timestamp so the item_id tiebreak is exercised.
+    for i in range(7):
+        _insert(f"item-{i}", created_at + timedelta(seconds=i // 3))
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/inventory", params=params)
+        assert resp.status_code == 200
+        seen.extend(item["item_id"] for item in resp.json())
+        pages += 1
+        cursor = resp.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == [f"item-{i}" for i in range(7)]
+
+
+def test_list_filters_by_location_staple_expired_and_expiry_date() -> None:
+    created_at = datetime(2024, 1, 1, 8, 0, 0)
+    _insert("milk", created_at)
+    _insert("rice", created_at, location="pantry", category="grain", is_staple=True)
+    _insert("old-eggs", created_at, category="protein", expired_flag=True)
+    _insert(
+        "soon",
+        created_at,
+        expiration_date_estimated=date(2024, 2, 1),
+        expiration_date_user_override=date(2024, 1, 5),
+    )
+
+    def ids(**params) -> list[str]:
+        resp = client.get("/api/v1/inventory", params=params)
+        assert resp.status_code == 200
+        return sorted(item["item_id"] for item in resp.json())
+
+    assert ids(location="pantry") == ["rice"]
+    assert ids(is_staple=True) == ["rice"]
+    assert ids(expired_flag=True) == ["old-eggs"]
+    assert ids(category="dairy", expired_flag=False) == ["milk", "soon"]
+    assert ids(expires_before="2024-01-06") == ["soon"]
+
+
+def test_list_rejects_invalid_cursor() -> None:
+    resp = client.get("/api/v1/inventory", params={"limit": 2, "cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+def test_items_from_one_post_list_in_insertion_order() -> None:
+    # One POST shares created_at and assigns random ids; order must still hold.
+    names = [f"item {i}" for i in range(20)]
+    client.post("/api/v1/inventory", json={"items": [{"name": n, "quantity": 1} for n in names]})
+
+    assert [item["name"] for item in client.get("/api/v1/inventory").json()] == names
+    paged = client.get("/api/v1/inventory", params={"limit": 7})
+    rest = client.get("/api/v1/inventory", params={"cursor": paged.headers["x-next-cursor"]})
+    assert [item["name"] for item in paged.json() + rest.json()] == names
+
+
+def test_cursor_survives_deletes_and_vacuum() -> None:
+    for item_id in ("a", "b", "c"):
+        _insert(item_id, datetime(2024, 1, 1))
+    first = client.get("/api/v1/inventory", params={"limit": 2})
+    # Deleting the newest rows would let a plain rowid be handed out again,
+    # behind the cursor.
+    for item_id in ("b", "c"):
+        client.delete(f"/api/v1/inventory/{item_id}")
+    _insert("d", datetime(2024, 1, 2))
+    with get_engine().connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+
+    rest = client.get("/api/v1/inventory", params={"cursor": first.headers["x-next-cursor"]})
+
+    assert [item["item_id"] for item in rest.json()] == ["d"]
+
+
+def test_create_schema_numbers_rows_of_a_table_from_before_seq(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'legacy.db'}", ENGINE_PROFILES["test"])
+    with engine.begin() as conn:
+        # inventory_items as created while item_id was the primary key.
+        conn.exec_driver_sql(
+            "CREATE TABLE inventory_items (item_id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL,"
+            " quantity FLOAT NOT NULL, created_at DATETIME NOT NULL, location VARCHAR NOT NULL,"
+            " storage_guidance VARCHAR NOT NULL, category VARCHAR NOT NULL, is_staple BOOLEAN NOT NULL,"
+            " opened BOOLEAN NOT NULL, expiration_date_estimated DATE NOT NULL,"
+            " expiration_date_user_override DATE, expired_flag BOOLEAN NOT NULL)"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_inventory_items_location ON inventory_items (location)")
+        for item_id in ("zucchini", "apple"):
+            conn.exec_driver_sql(
+                f"INSERT INTO inventory_items VALUES ('{item_id}', '{item_id}', 1.0, '2024-01-01 00:00:00.000000',"
+                " 'fridge', 'Refrigerate.', 'produce', 0, 0, '2024-01-03', NULL, 0)"
+            )
+
+    try:
+        create_schema(engine)
+
+        with Session(engine) as session:
+            items, _ = InventoryService(session).list_items()
+            assert [(item.seq, item.item_id) for item in items] == [(1, "zucchini"), (2, "apple")]
+        assert inspect(engine).get_pk_constraint("inventory_items")["constrained_columns"] == ["seq"]
+        assert "inventory_items_before_seq" not in inspect(engine).get_table_names()
+    finally:
+        engine.dispose()
+
+
+def test_init_db_replaces_indexes_from_earlier_schema() -> None:
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_inventory_items_location")
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_inventory_items_location_page ON inventory_items (location, created_at, item_id)"
+        )
+
+    init_db()
+
+    names = {index["name"] for index in inspect(engine).get_indexes("inventory_items")}
+    assert "ix_inventory_items_location" in names
+    assert "ix_inventory_items_location_page" not in names
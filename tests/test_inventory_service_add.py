@@ -31,3 +31,41 @@ def test_inventory_service_add_items_sets_fields_and_flags() -> None:
         assert item.expiration_date_user_override is None
         assert item.expired_flag is False
 
+
+def test_inventory_service_add_items_bulk_inserts_without_reselecting() -> None:
+    from sqlalchemy import event, select
+
+    from app.db.engine import get_engine
+    from app.db.models import InventoryItem
+
+    items = [{"name": f"pasta {i}", "quantity": i + 1} for i in range(200)]
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        with SessionLocal() as session:
+            created = InventoryService(session).add_items(items)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(created) == 200
+
+    with SessionLocal() as session:
+        stored = {
+            item.item_id: item
+            for item in session.execute(select(InventoryItem)).scalars()
+        }
+
+    assert len(stored) == 200
+    for item in created:
+        row = stored[item.item_id]
+        assert row.name == item.name
+        assert row.quantity == item.quantity
+        assert row.created_at == item.created_at
+        assert row.category == item.category == "grain"
+        assert row.expiration_date_estimated == item.expiration_date_estimated
@@ -0,0 +1,99 @@
+import importlib.util
+import random
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import delete
+
+from app.db.models import InventoryItem
+from app.db.session import SessionLocal
+from app.services.inventory_service import InventoryService
+from app.services.inventory_snapshot import InventorySnapshot, get_inventory_snapshot_cache
+from app.services.scoring import match_inventory, score_recipes, select_top_k
+from benchmarks.generators import grocery_name, inventory_items, recipe_pool
+
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+ENGINES = ["python"] + (["numpy"] if importlib.util.find_spec("numpy") else [])
+
+
+def _seed(size: int = 150) -> list[InventoryItem]:
+    rng = random.Random(11)
+    with SessionLocal() as session:
+        session.add_all(inventory_items(rng, size, NOW.date()))
+        session.commit()
+        # The ORM path's order before snapshots: no ORDER BY at all.
+        return session.query(InventoryItem).all()
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_snapshot_scores_like_orm_items(engine: str) -> None:
+    orm_items = _seed()
+    recipes = recipe_pool(random.Random(5), 300)
+    with SessionLocal() as session:
+        snapshot = InventorySnapshot.load(session)
+
+    assert score_recipes(recipes, snapshot, NOW, engine=engine) == score_recipes(
+        recipes, orm_items, NOW, engine=engine
+    )
+    assert select_top_k(recipes, snapshot, NOW, 5, engine=engine) == select_top_k(
+        recipes, orm_items, NOW, 5, engine=engine
+    )
+
+
+def test_snapshot_matches_like_orm_items() -> None:
+    orm_items = _seed()
+    with SessionLocal() as session:
+        snapshot = InventorySnapshot.load(session)
+
+    rng = random.Random(2)
+    for name in [grocery_name(rng) for _ in range(200)]:
+        expected = match_inventory(name, orm_items)
+        matched = match_inventory(name, snapshot)
+        assert (matched and matched.item_id) == (expected and expected.item_id)
+
+
+def test_snapshot_items_are_immutable_and_precomputed() -> None:
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": "Greek Yogurt, Plain", "quantity": 1}])
+        snapshot = InventorySnapshot.load(session)
+
+    item = snapshot.items[0]
+    assert item.name_lower == "greek yogurt, plain"
+    assert item.tokens == {"greek", "yogurt", "plain"}
+    assert date.fromordinal(item.expires_on) == item.expiration_date_estimated
+    with pytest.raises(AttributeError):
+        item.name = "other"
+
+
+def test_cached_snapshot_is_reused_until_inventory_changes() -> None:
+    cache = get_inventory_snapshot_cache()
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": "Milk", "quantity": 1}])
+    with SessionLocal() as session:
+        first = cache.get(session)
+    with SessionLocal() as session:
+        assert cache.get(session) is first
+
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": "Eggs", "quantity": 6}])
+    with SessionLocal() as session:
+        second = cache.get(session)
+
+    assert second is not first
+    assert second.version == first.version + 1
+    assert [i.name for i in second.items] == ["Milk", "Eggs"]
+
+
+def test_items_added_together_match_in_insertion_order() -> None:
+    # One add_items call shares created_at and assigns random ids, so only
+    # insertion order decides which of two matching items is picked.
+    for _ in range(8):
+        with SessionLocal() as session:
+            session.execute(delete(InventoryItem))
+            session.commit()
+            InventoryService(session).add_items([{"name": "egg", "quantity": 1}, {"name": "egg pasta", "quantity": 1}])
+            orm_items = session.query(InventoryItem).all()
+            snapshot = InventorySnapshot.load(session)
+
+        assert match_inventory("egg", snapshot).name == match_inventory("egg", orm_items).name == "egg"
@@ -0,0 +1,93 @@
+from datetime import date, datetime
+
+from fastapi.testclient import TestClient
+
+from app.db.models import InventoryItem
+from app.db.session import SessionLocal
+from app.main import app
+from app.services.expiry_maintenance import refresh_expired_flags
+from app.services.inventory_service import InventoryService
+from app.services.inventory_version import get_inventory_version
+
+
+client = TestClient(app)
+
+
+def _version() -> int:
+    with SessionLocal() as session:
+        return get_inventory_version(session)
+
+
+def test_version_is_bumped_by_every_inventory_write() -> None:
+    assert _version() == 0
+
+    with SessionLocal() as session:
+        items = InventoryService(session).add_items([{"name": "Milk", "quantity": 1}])
+    assert _version() == 1
+
+    with SessionLocal() as session:
+        InventoryService(session).add_items([])
+        InventoryService(session).delete_item("missing")
+    assert _version() == 1
+
+    with SessionLocal() as session:
+        InventoryService(session).delete_item(items[0].item_id)
+    assert _version() == 2
+
+
+def test_expiry_sweep_bumps_version_only_when_flags_change() -> None:
+    with SessionLocal() as session:
+        session.add(
+            InventoryItem(
+                item_id="old",
+                name="old",
+                quantity=1.0,
+                created_at=datetime(2024, 1, 1),
+                location="fridge",
+                storage_guidance="Refrigerate.",
+                category="dairy",
+                is_staple=False,
+                opened=False,
+                expiration_date_estimated=date(2024, 1, 5),
+                expiration_date_user_override=None,
+                expired_flag=False,
+            )
+        )
+        session.commit()
+        assert refresh_expired_flags(session, now=datetime(2024, 1, 10)) == 1
+        assert refresh_expired_flags(session, now=datetime(2024, 1, 10)) == 0
+
+    assert _version() == 1
+
+
+def test_unchanged_inventory_returns_304() -> None:
+    client.post("/api/v1/inventory", json={"items": [{"name": "Milk", "quantity": 1}]})
+
+    first = client.get("/api/v1/inventory")
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    cached = client.get("/api/v1/inventory", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    weak = client.get("/api/v1/inventory", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_etag_changes_with_writes_and_query() -> None:
+    client.post("/api/v1/inventory", json={"items": [{"name": "Milk", "quantity": 1}]})
+    etag = client.get("/api/v1/inventory").headers["etag"]
+
+    assert client.get("/api/v1/inventory", params={"location": "fridge"}).headers["etag"] != etag
+    assert (
+        client.get("/api/v1/inventory?location=fridge&limit=5").headers["etag"]
+        == client.get("/api/v1/inventory?limit=5&location=fridge").headers["etag"]
+    )
+
+    client.post("/api/v1/inventory", json={"items": [{"name": "Eggs", "quantity": 6}]})
+    response = client.get("/api/v1/inventory", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
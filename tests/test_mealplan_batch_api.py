@@ -0,0 +1,129 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.cli import main
+from app.db.shards import HOUSEHOLD_HEADER, get_shard_router
+from app.main import app
+from app.services.inventory_snapshot import InventorySnapshot
+from app.services.recipe_provider import StubRecipeProvider
+
+client = TestClient(app)
+
+WEEKS = ["2024-06-03", "2024-06-10", "2024-06-17"]
+
+
+@pytest.fixture
+def provider_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls = []
+    original = StubRecipeProvider.search_recipes
+
+    def counting(self, preferences=None, limit=15):
+        calls.append(preferences)
+        return original(self, preferences=preferences, limit=limit)
+
+    monkeypatch.setattr(StubRecipeProvider, "search_recipes", counting)
+    monkeypatch.setenv("RECIPE_CACHE_TTL_SECONDS", "0")
+    return calls
+
+
+@pytest.fixture
+def inventory_loads(monkeypatch: pytest.MonkeyPatch) -> list:
+    loads = []
+    original = InventorySnapshot.load.__func__
+
+    def counting(cls, session, version=None):
+        loads.append(str(session.get_bind().url))
+        return original(cls, session, version)
+
+    monkeypatch.setattr(InventorySnapshot, "load", classmethod(counting))
+    return loads
+
+
+@pytest.fixture
+def sharded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SHARD_URL_TEMPLATE", f"sqlite:///{tmp_path}/household-{{household}}.db")
+    get_shard_router.cache_clear()
+    router = get_shard_router()
+    yield router
+    asyncio.run(router.dispose())
+
+
+def _lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_streams_one_line_per_job_from_one_pool(provider_calls: list, inventory_loads: list) -> None:
+    response = client.post(
+        "/api/v1/mealplan/batch",
+        json={"jobs": [{"week_start": week} for week in WEEKS], "preferences": {"diet": "any"}},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = _lines(response)
+    assert sorted(line["job"] for line in lines) == [0, 1, 2]
+    assert sorted(line["week_start"] for line in lines) == WEEKS
+    assert all(line["error"] is None and line["candidate_pool_size"] == 15 for line in lines)
+    assert provider_calls == [{"diet": "any"}]
+    assert len(inventory_loads) == 1
+
+
+def test_batch_loads_each_household_once(sharded, provider_calls: list, inventory_loads: list) -> None:
+    for household in ("alpha", "beta"):
+        client.post(
+            "/api/v1/inventory",
+            json={"items": [{"name": "Oat Milk", "quantity": 1}]},
+            headers={HOUSEHOLD_HEADER: household},
+        )
+    jobs = [{"household_id": h, "week_start": week} for h in ("alpha", "beta") for week in WEEKS]
+
+    response = client.post("/api/v1/mealplan/batch", json={"jobs": jobs})
+
+    lines = _lines(response)
+    assert len(lines) == 6
+    for line in lines:
+        assert jobs[line["job"]]["household_id"] == line["household_id"]
+        assert line["error"] is None
+    assert sorted(inventory_loads) == [sharded.url_for("alpha"), sharded.url_for("beta")]
+    assert len(provider_calls) == 1
+
+
+def test_batch_reports_households_without_a_database(sharded) -> None:
+    jobs = [{"household_id": "ghost", "week_start": WEEKS[0]}]
+
+    response = client.post("/api/v1/mealplan/batch", json={"jobs": jobs})
+
+    assert [line["error"] for line in _lines(response)] == ["unknown_household"]
+    assert sharded.households() == []
+
+
+def test_batch_requires_household_ids_when_sharded(sharded) -> None:
+    response = client.post("/api/v1/mealplan/batch", json={"jobs": [{"week_start": WEEKS[0]}]})
+
+    assert response.status_code == 400
+
+
+def test_batch_returns_503_when_provider_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing(self, preferences=None, limit=15):
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(StubRecipeProvider, "search_recipes", failing)
+    response = client.post("/api/v1/mealplan/batch", json={"jobs": [{"week_start": WEEKS[0]}]})
+
+    assert response.status_code == 503
+    assert response.json() == {"error": "recipe_provider_unavailable"}
+
+
+def test_cli_batch_mealplan_writes_ndjson(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    path = tmp_path / "jobs.ndjson"
+    path.write_text("".join(json.dumps({"week_start": week}) + "\n" for week in WEEKS), encoding="utf-8")
+
+    assert main(["batch-mealplan", str(path), "--concurrency", "2"]) == 0
+
+    out = capsys.readouterr()
+    assert sorted(json.loads(line)["job"] for line in out.out.splitlines()) == [0, 1, 2]
+    assert "generated 3 of 3" in out.err
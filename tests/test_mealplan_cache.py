@@ -0,0 +1,145 @@
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.db.engine import get_engine
+from app.db.session import SessionLocal
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.inventory_service import InventoryService
+from app.services.mealplan_cache import MealplanCache
+from app.services.mealplan_service import generate_mealplan
+
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.calls: list[dict | None] = []
+
+    def search_recipes(self, preferences=None, limit=15):
+        self.calls.append(preferences)
+        return [
+            RecipeCandidate(
+                recipe_id=f"r{i}",
+                title=f"Recipe {i}",
+                servings=2,
+                ingredients=[Ingredient(name="milk", amount=1, unit="cup")],
+                instructions=["Cook."],
+            )
+            for i in range(3)
+        ]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _generate(provider, cache, now=NOW, preferences=None):
+    with SessionLocal() as session:
+        return generate_mealplan(session, provider, now=now, preferences=preferences, cache=cache)
+
+
+def test_repeat_generate_skips_db_and_provider() -> None:
+    provider = CountingProvider()
+    cache = MealplanCache()
+    first = _generate(provider, cache)
+
+    statements: list[str] = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(get_engine(), "before_cursor_execute", listener)
+    try:
+        second = _generate(provider, cache)
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", listener)
+
+    assert second == first
+    assert statements == []
+    assert len(provider.calls) == 1
+    assert cache.metrics()["hits"] == 1
+
+
+def test_key_covers_day_and_preferences() -> None:
+    provider = CountingProvider()
+    cache = MealplanCache()
+
+    _generate(provider, cache)
+    _generate(provider, cache, now=NOW.replace(hour=23))
+    _generate(provider, cache, now=NOW.replace(day=2))
+    _generate(provider, cache, preferences={"diet": "vegan"})
+    _generate(provider, cache, preferences={"diet": "vegan"})
+
+    assert provider.calls == [None, None, {"diet": "vegan"}]
+    assert cache.metrics()["misses"] == 3
+
+
+def test_inventory_version_change_misses() -> None:
+    provider = CountingProvider()
+    # Re-read the version every call, as after a write from another process.
+    cache = MealplanCache(version_max_age=0.0)
+    _generate(provider, cache)
+    _generate(provider, cache)
+
+    with SessionLocal() as session:
+        InventoryService(session).add_items([{"name": "Milk", "quantity": 1}])
+    _generate(provider, cache)
+
+    assert len(provider.calls) == 2
+    assert cache.metrics()["invalidations"] == 0
+
+
+def test_remembered_version_ages_out() -> None:
+    clock = FakeClock()
+    cache = MealplanCache(version_max_age=1.0, clock=clock)
+    cache.remember_version("db", 3, cache.generation)
+
+    assert cache.known_version("db") == 3
+    clock.now = 1.0
+    assert cache.known_version("db") is None
+
+
+def test_results_from_before_an_invalidation_are_dropped() -> None:
+    cache = MealplanCache()
+    key = ("db", 1, NOW.date(), "p", "python", "{}")
+    generation = cache.generation
+
+    cache.invalidate()
+    cache.put(key, ([], 0), generation)
+    cache.remember_version("db", 1, generation)
+
+    assert cache.get(key) is None
+    assert cache.known_version("db") is None
+
+
+def test_lru_eviction_and_ttl() -> None:
+    clock = FakeClock()
+    cache = MealplanCache(max_entries=2, ttl=10.0, clock=clock)
+    keys = [("db", v, NOW.date(), "p", "python", "{}") for v in range(3)]
+    for key in keys:
+        cache.put(key, ([], key[1]), cache.generation)
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == ([], 2)
+    clock.now = 10.0
+    assert cache.get(keys[2]) is None
+    assert cache.metrics()["evictions"] == 1
+
+
+def test_invalidation_is_per_database() -> None:
+    cache = MealplanCache()
+    kept = ("a", 1, NOW.date(), "p", "python", "{}")
+    dropped = ("b", 1, NOW.date(), "p", "python", "{}")
+    for key in (kept, dropped):
+        cache.put(key, ([], 0), cache.generation)
+        cache.remember_version(key[0], 1, cache.generation)
+
+    cache.invalidate("b")
+
+    assert cache.get(kept) == ([], 0)
+    assert cache.get(dropped) is None
+    assert cache.known_version("a") == 1
+    assert cache.known_version("b") is None
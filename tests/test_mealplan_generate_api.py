@@ -33,6 +33,14 @@ def test_generate_with_empty_inventory_returns_200_and_pool_size() -> None:
     assert len(data["visible_candidates"]) <= 5
 
 
+def test_generate_pool_size_is_configurable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MEALPLAN_CANDIDATE_POOL_SIZE", "8")
+
+    response = client.post("/api/v1/mealplan/generate", json={})
+
+    assert response.json()["candidate_pool_size"] == 8
+
+
 def test_generate_with_expiring_item_ranks_matching_recipe_high() -> None:
     # Stub recipes all include "oat milk". Insert oat milk expiring in 1 day.
     tomorrow = date.today() + timedelta(days=1)
@@ -105,3 +113,26 @@ def test_generate_with_expired_item_excludes_matching_recipe() -> None:
             assert ing.get("name", "").lower() != "oat milk", (
                 "Recipe using expired oat milk should not appear"
             )
+
+
+def test_repeat_generate_is_served_from_cache_until_inventory_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.recipe_provider import StubRecipeProvider
+
+    calls = []
+    original = StubRecipeProvider.search_recipes
+
+    def counting(self, preferences=None, limit=15):
+        calls.append(preferences)
+        return original(self, preferences=preferences, limit=limit)
+
+    monkeypatch.setattr(StubRecipeProvider, "search_recipes", counting)
+    monkeypatch.setenv("RECIPE_CACHE_TTL_SECONDS", "0")
+
+    first = client.post("/api/v1/mealplan/generate", json={"preferences": {"diet": "any"}})
+    second = client.post("/api/v1/mealplan/generate", json={"preferences": {"diet": "any"}})
+    assert first.content == second.content
+    assert calls == [{"diet": "any"}]
+
+    client.post("/api/v1/inventory", json={"items": [{"name": "Oat Milk", "quantity": 1}]})
+    client.post("/api/v1/mealplan/generate", json={"preferences": {"diet": "any"}})
+    assert len(calls) == 2
@@ -0,0 +1,99 @@
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routers.mealplan import router as mealplan_router
+from app.main import app
+from app.metrics import Histogram, MetricsMiddleware, MetricsRegistry, RequestTimings, server_timing_header
+
+
+client = TestClient(app)
+
+
+def _sample(text: str, name: str, **labels: str) -> float | None:
+    wanted = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    for line in text.splitlines():
+        if line.startswith(f"{name}{{{wanted}}} ") or (not labels and line.startswith(f"{name} ")):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_metrics_endpoint_reports_route_templates_and_statuses() -> None:
+    client.get("/health")
+    client.delete("/api/v1/inventory/no-such-item")
+    client.delete("/api/v1/inventory/another-missing-item")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert _sample(text, "http_responses_total", method="GET", route="/health", status="200") >= 1
+    # Both deletes share the route template rather than one series per id.
+    assert (
+        _sample(
+            text,
+            "http_responses_total",
+            method="DELETE",
+            route="/api/v1/inventory/{item_id}",
+            status="204",
+        )
+        >= 2
+    )
+    assert "no-such-item" not in text
+    assert _sample(text, "http_request_duration_seconds_count", method="GET", route="/health") >= 1
+    assert _sample(
+        text, "http_request_duration_quantile_seconds", method="GET", route="/health", quantile="0.99"
+    ) is not None
+    # The /metrics request itself is still in flight while rendering.
+    assert _sample(text, "http_requests_in_flight") == 1
+
+
+def test_db_time_is_attributed_to_requests() -> None:
+    client.get("/api/v1/inventory")
+
+    text = client.get("/metrics").text
+
+    total = _sample(text, "http_request_db_seconds_sum", method="GET", route="/api/v1/inventory")
+    assert total is not None and total > 0
+
+
+def test_server_timing_header_splits_mealplan_request() -> None:
+    timed_app = FastAPI()
+    timed_app.include_router(mealplan_router)
+    timed_app.add_middleware(MetricsMiddleware, registry=MetricsRegistry(), server_timing=True)
+
+    response = TestClient(timed_app).post("/api/v1/mealplan/generate", json={})
+
+    assert response.status_code == 200
+    header = response.headers["server-timing"]
+    durations = dict(re.findall(r"(\w+);dur=([\d.]+)", header))
+    assert set(durations) == {"db", "provider", "scoring", "total"}
+
+
+def test_server_timing_header_is_off_by_default() -> None:
+    response = client.get("/health")
+    assert "server-timing" not in response.headers
+
+
+def test_histogram_buckets_and_quantiles() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in [0.05] * 98 + [0.5, 2.0]:
+        histogram.observe(value)
+
+    assert histogram.counts == [98, 1, 1]
+    assert histogram.count == 100
+    quantiles = histogram.quantiles()
+    assert quantiles[0.5] == 0.05
+    assert quantiles[0.99] == 0.5
+
+
+def test_server_timing_header_format() -> None:
+    timings = RequestTimings()
+    timings.add("db", 0.002)
+    timings.add("db", 0.001)
+
+    assert server_timing_header(timings, 0.0125) == (
+        "db;dur=3.0, provider;dur=0.0, scoring;dur=0.0, total;dur=12.5"
+    )
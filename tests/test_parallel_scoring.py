@@ -0,0 +1,53 @@
+import random
+from datetime import datetime, timedelta
+
+from app.db.models import InventoryItem
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.parallel_scoring import ParallelScorer
+from app.services.scoring import select_top_k
+
+
+_WORDS = ["oat", "milk", "pasta", "rice", "tomato", "sauce", "peas", "eggs", "lentils"]
+
+
+def test_parallel_top_k_matches_single_process() -> None:
+    rng = random.Random(15)
+    now = datetime(2024, 4, 1, 10, 0, 0)
+    inventory = [
+        InventoryItem(
+            item_id=f"item-{i}",
+            name=" ".join(rng.sample(_WORDS, 2)),
+            expiration_date_estimated=now.date() + timedelta(days=rng.randint(-1, 9)),
+            expiration_date_user_override=None,
+        )
+        for i in range(6)
+    ]
+    recipes = [
+        RecipeCandidate(
+            recipe_id=f"r{i}",
+            title=f"Recipe {i}",
+            servings=2,
+            ingredients=[
+                Ingredient(name=rng.choice(_WORDS), amount=1, unit="cup")
+                for _ in range(rng.randint(0, 4))
+            ],
+            instructions=["Cook."],
+        )
+        for i in range(400)
+    ]
+
+    scorer = ParallelScorer(max_workers=2, min_pool_size=100, chunk_size=37, mp_context="fork")
+    try:
+        for k in (1, 5, 60):
+            expected = select_top_k(recipes, inventory, now, k)
+            actual = scorer.select_top_k(recipes, inventory, now, k)
+            assert [(r.recipe_id, s) for r, s in actual] == [(r.recipe_id, s) for r, s in expected]
+    finally:
+        scorer.close()
+
+
+def test_small_pools_stay_in_process() -> None:
+    scorer = ParallelScorer(max_workers=4, min_pool_size=1000)
+
+    assert scorer.select_top_k([], [], datetime(2024, 1, 1), k=5) == []
+    assert scorer._executor is None
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.recipe_aggregator import AggregatingRecipeProvider, RecipeProviderError
+
+
+def _recipe(recipe_id: str, title: str) -> RecipeCandidate:
+    return RecipeCandidate(
+        recipe_id=recipe_id,
+        title=title,
+        servings=2,
+        ingredients=[],
+        instructions=["Cook."],
+    )
+
+
+class FakeProvider:
+    """Returns fixed recipes after a per-call delay; `failures` calls fail first."""
+
+    def __init__(self, recipes, delays=(0.0,), failures: int = 0) -> None:
+        self.recipes = recipes
+        self.delays = list(delays)
+        self.failures = failures
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def search_recipes(self, preferences=None, limit=15):
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+        time.sleep(self.delays[min(call, len(self.delays) - 1)])
+        if call < self.failures:
+            raise RuntimeError("backend error")
+        return self.recipes[:limit]
+
+
+def test_merges_in_priority_order_and_dedupes_by_id_and_title() -> None:
+    first = FakeProvider([_recipe("a", "Pasta Bake"), _recipe("b", "Oat Porridge")])
+    second = FakeProvider(
+        [_recipe("b", "Other"), _recipe("c", "pasta  bake"), _recipe("d", "Rice Bowl")],
+        delays=[0.05],
+    )
+    aggregator = AggregatingRecipeProvider([first, second], hedge_after=None)
+
+    recipes = aggregator.search_recipes(limit=10)
+
+    assert [r.recipe_id for r in recipes] == ["a", "b", "d"]
+    assert [r.recipe_id for r in aggregator.search_recipes(limit=2)] == ["a", "b"]
+
+
+def test_slow_provider_is_dropped_at_its_deadline() -> None:
+    fast = FakeProvider([_recipe("fast", "Fast")])
+    slow = FakeProvider([_recipe("slow", "Slow")], delays=[1.0])
+    aggregator = AggregatingRecipeProvider(
+        [slow, fast], deadline=1.0, provider_timeout=[0.1, 0.5], hedge_after=None
+    )
+
+    started = time.monotonic()
+    recipes = aggregator.search_recipes()
+    elapsed = time.monotonic() - started
+
+    assert [r.recipe_id for r in recipes] == ["fast"]
+    assert elapsed < 0.5
+    assert aggregator.metrics()[0]["timeouts"] == 1
+
+
+def test_hedged_request_beats_slow_first_attempt() -> None:
+    backend = FakeProvider([_recipe("r", "Recipe")], delays=[1.0, 0.01])
+    aggregator = AggregatingRecipeProvider([backend], deadline=2.0, provider_timeout=2.0, hedge_after=0.05)
+
+    started = time.monotonic()
+    recipes = aggregator.search_recipes()
+
+    assert [r.recipe_id for r in recipes] == ["r"]
+    assert time.monotonic() - started < 0.5
+    metrics = aggregator.metrics()[0]
+    assert metrics["hedges"] == 1
+    assert metrics["successes"] == 1
+
+
+def test_failed_attempt_is_retried() -> None:
+    backend = FakeProvider([_recipe("r", "Recipe")], failures=1)
+    aggregator = AggregatingRecipeProvider([backend], hedge_after=None, max_hedges=1)
+
+    assert [r.recipe_id for r in aggregator.search_recipes()] == ["r"]
+    assert aggregator.metrics()[0]["failures"] == 1
+
+
+def test_raises_when_every_provider_fails() -> None:
+    aggregator = AggregatingRecipeProvider(
+        [FakeProvider([], failures=5), FakeProvider([], failures=5)],
+        hedge_after=None,
+    )
+
+    with pytest.raises(RecipeProviderError):
+        aggregator.search_recipes()
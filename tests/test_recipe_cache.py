@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from app.schemas.recipe import RecipeCandidate
+from app.services.recipe_cache import CachingRecipeProvider
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProvider:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    def search_recipes(self, preferences=None, limit=15):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [
+            RecipeCandidate(
+                recipe_id=f"fake-{self.calls}-{i}",
+                title=f"Fake {i}",
+                servings=2,
+                ingredients=[],
+                instructions=["Cook."],
+            )
+            for i in range(limit)
+        ]
+
+
+def test_cache_hits_on_normalized_preferences_and_limit() -> None:
+    inner = FakeProvider()
+    cache = CachingRecipeProvider(inner, clock=FakeClock())
+
+    first = cache.search_recipes(preferences={"a": 1, "b": 2}, limit=3)
+    second = cache.search_recipes(preferences={"b": 2, "a": 1}, limit=3)
+    cache.search_recipes(preferences={"a": 1, "b": 2}, limit=4)
+    cache.search_recipes(preferences=None, limit=3)
+    cache.search_recipes(preferences={}, limit=3)
+
+    assert [r.recipe_id for r in first] == [r.recipe_id for r in second]
+    assert inner.calls == 3
+    metrics = cache.metrics()
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 3
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    inner = FakeProvider()
+    cache = CachingRecipeProvider(inner, max_entries=2, clock=FakeClock())
+
+    cache.search_recipes(limit=1)
+    cache.search_recipes(limit=2)
+    cache.search_recipes(limit=1)  # refresh recency of limit=1
+    cache.search_recipes(limit=3)  # evicts limit=2
+
+    assert cache.metrics()["evictions"] == 1
+    cache.search_recipes(limit=1)
+    assert inner.calls == 3
+    cache.search_recipes(limit=2)
+    assert inner.calls == 4
+
+
+def test_stale_entry_is_served_while_refreshing_in_background() -> None:
+    inner = FakeProvider(delay=0.2)
+    clock = FakeClock()
+    cache = CachingRecipeProvider(inner, ttl=10, stale_ttl=10, clock=clock)
+
+    original = cache.search_recipes(limit=2)
+    clock.now = 15
+
+    started = time.perf_counter()
+    stale = cache.search_recipes(limit=2)
+    elapsed = time.perf_counter() - started
+
+    assert [r.recipe_id for r in stale] == [r.recipe_id for r in original]
+    assert elapsed < 0.1
+
+    cache.close()
+    refreshed = cache.search_recipes(limit=2)
+    assert refreshed[0].recipe_id == "fake-2-0"
+    metrics = cache.metrics()
+    assert metrics["stale_hits"] == 1
+    assert metrics["refreshes"] == 1
+    assert metrics["hits"] == 1
+
+
+def test_expired_entry_is_refetched_and_errors_propagate() -> None:
+    inner = FakeProvider()
+    clock = FakeClock()
+    cache = CachingRecipeProvider(inner, ttl=10, stale_ttl=5, clock=clock)
+
+    cache.search_recipes(limit=2)
+    clock.now = 20
+    inner.fail = True
+
+    with pytest.raises(RuntimeError):
+        cache.search_recipes(limit=2)
+    assert cache.metrics()["misses"] == 2
+
+
+def test_failed_background_refresh_keeps_serving_stale_entry() -> None:
+    inner = FakeProvider()
+    clock = FakeClock()
+    cache = CachingRecipeProvider(inner, ttl=10, stale_ttl=10, clock=clock)
+
+    original = cache.search_recipes(limit=1)
+    clock.now = 12
+    inner.fail = True
+    cache.search_recipes(limit=1)
+    cache.close()
+
+    assert cache.search_recipes(limit=1)[0].recipe_id == original[0].recipe_id
+    assert cache.metrics()["refresh_failures"] == 1
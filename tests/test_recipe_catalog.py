@@ -0,0 +1,92 @@
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+
+from app.cli import main
+from app.db.models import InventoryItem, RecipeIngredientToken
+from app.db.session import SessionLocal
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.recipe_catalog import CatalogRecipeProvider, load_recipes
+
+
+def _recipe(recipe_id: str, *ingredients: str) -> RecipeCandidate:
+    return RecipeCandidate(
+        recipe_id=recipe_id,
+        title=f"Recipe {recipe_id}",
+        servings=2,
+        ingredients=[Ingredient(name=name, amount=1, unit="cup") for name in ingredients],
+        instructions=["Mix.", "Cook."],
+    )
+
+
+def _add_inventory(*names: str) -> None:
+    with SessionLocal() as session:
+        for i, name in enumerate(names):
+            session.add(
+                InventoryItem(
+                    item_id=f"inv-{i}",
+                    name=name,
+                    quantity=1.0,
+                    created_at=datetime(2024, 1, 1),
+                    location="fridge",
+                    storage_guidance="Refrigerate.",
+                    category="dairy",
+                    is_staple=False,
+                    opened=False,
+                    expiration_date_estimated=date(2024, 1, 8),
+                    expiration_date_user_override=None,
+                    expired_flag=False,
+                )
+            )
+        session.commit()
+
+
+def test_catalog_ranks_recipes_by_ingredients_in_inventory() -> None:
+    with SessionLocal() as session:
+        load_recipes(
+            session,
+            [
+                _recipe("a", "flour", "sugar"),
+                _recipe("b", "oat milk", "pasta"),
+                _recipe("c", "whole milk", "rice", "eggs"),
+                _recipe("d", "pasta"),
+            ],
+            batch_size=2,
+        )
+    _add_inventory("Chobani Oat Milk", "Basmati Rice")
+
+    recipes = CatalogRecipeProvider().search_recipes(limit=3)
+
+    # c matches two ingredients (milk, rice), b one (oat milk); a fills the page.
+    assert [r.recipe_id for r in recipes] == ["c", "b", "a"]
+    assert recipes[0].ingredients[0] == Ingredient(name="whole milk", amount=1, unit="cup")
+    assert recipes[0].instructions == ["Mix.", "Cook."]
+
+
+def test_catalog_without_inventory_returns_recipes_in_id_order() -> None:
+    with SessionLocal() as session:
+        load_recipes(session, [_recipe("z", "pasta"), _recipe("y", "rice")])
+
+    assert [r.recipe_id for r in CatalogRecipeProvider().search_recipes(limit=5)] == ["y", "z"]
+
+
+def test_load_recipes_replaces_existing_recipe() -> None:
+    with SessionLocal() as session:
+        load_recipes(session, [_recipe("a", "pasta", "tomato sauce")])
+        load_recipes(session, [_recipe("a", "rice")])
+        tokens = session.execute(select(RecipeIngredientToken.token)).scalars().all()
+
+    assert tokens == ["rice"]
+    recipes = CatalogRecipeProvider().search_recipes(limit=5)
+    assert [i.name for i in recipes[0].ingredients] == ["rice"]
+
+
+def test_cli_load_recipes(tmp_path, capsys) -> None:
+    path = tmp_path / "recipes.ndjson"
+    path.write_text("\n".join(_recipe(str(i), "pasta").model_dump_json() for i in range(3)))
+
+    assert main(["load-recipes", str(path)]) == 0
+    assert "loaded 3 recipe(s)" in capsys.readouterr().out
+    with SessionLocal() as session:
+        count = session.execute(select(func.count()).select_from(RecipeIngredientToken)).scalar_one()
+    assert count == 3
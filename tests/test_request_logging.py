@@ -0,0 +1,48 @@
+import logging
+import uuid
+from logging.handlers import QueueHandler
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.main import RequestLoggingMiddleware, app
+
+
+client = TestClient(app)
+
+
+def test_request_id_is_echoed_back() -> None:
+    response = client.get("/health", headers={"x-request-id": "abc-123"})
+
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "abc-123"
+
+
+def test_request_id_is_generated_when_missing() -> None:
+    response = client.get("/health")
+
+    assert uuid.UUID(response.headers["x-request-id"])
+
+
+def test_request_id_is_available_on_request_state() -> None:
+    state_app = FastAPI()
+
+    @state_app.get("/whoami")
+    async def whoami(request: Request) -> dict:
+        return {"request_id": request.state.request_id}
+
+    state_app.add_middleware(RequestLoggingMiddleware)
+
+    response = TestClient(state_app).get("/whoami", headers={"x-request-id": "req-7"})
+
+    assert response.json() == {"request_id": "req-7"}
+    assert response.headers["x-request-id"] == "req-7"
+
+
+def test_request_log_goes_through_queue_handler(caplog) -> None:
+    assert any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+
+    with caplog.at_level(logging.INFO, logger="app.main"):
+        client.get("/health", headers={"x-request-id": "logged-1"})
+
+    assert "request_id=logged-1 method=GET path=/health" in caplog.text
@@ -3,6 +3,7 @@ from datetime import date, datetime, timedelta
 from app.db.models import InventoryItem
 from app.schemas.recipe import Ingredient, RecipeCandidate
 from app.services.scoring import (
+    InventoryMatchIndex,
     filter_ineligible,
     match_inventory,
     urgency_points,
@@ -101,3 +102,32 @@ def test_filter_ineligible_removes_recipes_using_expired_items() -> None:
     assert "uses-expired" not in ids
     assert "safe" in ids
 
+
+def test_match_index_prefers_earliest_token_match_over_substring() -> None:
+    items = [
+        make_inventory_item("almond milkshake", effective_in_days=5, item_id="sub"),
+        make_inventory_item("Whole Milk", effective_in_days=5, item_id="tok-1"),
+        make_inventory_item("milk powder", effective_in_days=5, item_id="tok-2"),
+    ]
+    index = InventoryMatchIndex(items)
+
+    matched = match_inventory("milk", index)
+
+    assert matched is not None
+    assert matched.item_id == "tok-1"
+    assert matched is match_inventory("milk", items)
+
+
+def test_match_index_substring_fallback_matches_linear_scan() -> None:
+    items = [
+        make_inventory_item("zucchini", effective_in_days=5, item_id="a"),
+        make_inventory_item("tomatoes", effective_in_days=5, item_id="b"),
+        make_inventory_item("tomato", effective_in_days=5, item_id="c"),
+        make_inventory_item("", effective_in_days=5, item_id="empty"),
+    ]
+    index = InventoryMatchIndex(items)
+
+    for name in ["tomato", "cherry tomatoes!", "tomatoesque", "zucchinis", "", "xyz"]:
+        assert match_inventory(name, index) is match_inventory(name, items)
+
+    assert match_inventory("anything", InventoryMatchIndex([])) is None
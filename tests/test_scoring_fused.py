@@ -0,0 +1,119 @@
+import random
+from datetime import date, datetime, timedelta
+
+from app.db.models import InventoryItem
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.scoring import (
+    InventoryMatchIndex,
+    filter_ineligible,
+    score_recipes,
+    waste_score,
+)
+
+
+_WORDS = ["oat", "milk", "pasta", "rice", "tomato", "sauce", "frozen", "peas", "eggs", "to", "a"]
+
+
+def _random_name(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+
+
+def _random_inventory(rng: random.Random, now: datetime) -> list[InventoryItem]:
+    items = []
+    for i in range(rng.randint(0, 12)):
+        estimated = now.date() + timedelta(days=rng.randint(-3, 12))
+        override = None
+        if rng.random() < 0.3:
+            override = now.date() + timedelta(days=rng.randint(-3, 12))
+        items.append(
+            InventoryItem(
+                item_id=f"item-{i}",
+                name=_random_name(rng),
+                quantity=1.0,
+                created_at=now,
+                location="unknown",
+                storage_guidance="",
+                category="unknown",
+                is_staple=False,
+                opened=False,
+                expiration_date_estimated=estimated if rng.random() > 0.1 else None,
+                expiration_date_user_override=override,
+                expired_flag=False,
+            )
+        )
+    return items
+
+
+def _random_recipes(rng: random.Random) -> list[RecipeCandidate]:
+    return [
+        RecipeCandidate(
+            recipe_id=f"r{i}",
+            title=f"Recipe {i}",
+            servings=2,
+            ingredients=[
+                Ingredient(name=_random_name(rng), amount=1, unit="cup")
+                for _ in range(rng.randint(0, 5))
+            ],
+            instructions=["Cook."],
+        )
+        for i in range(rng.randint(0, 20))
+    ]
+
+
+def test_score_recipes_matches_two_pass_scoring_on_random_inputs() -> None:
+    rng = random.Random(196)
+    now = datetime(2024, 3, 1, 18, 30, 0)
+
+    for _ in range(300):
+        inventory = _random_inventory(rng, now)
+        recipes = _random_recipes(rng)
+
+        eligible = filter_ineligible(recipes, inventory, now)
+        expected = [(r.recipe_id, waste_score(r, inventory, now)) for r in eligible]
+
+        fused = score_recipes(recipes, inventory, now)
+        assert [(r.recipe_id, score) for r, score in fused] == expected
+
+        fused_indexed = score_recipes(recipes, InventoryMatchIndex(inventory), now)
+        assert [(r.recipe_id, score) for r, score in fused_indexed] == expected
+
+
+def test_score_recipes_excludes_recipe_using_expired_item() -> None:
+    now = datetime(2024, 1, 10, 12, 0, 0)
+    inventory = [
+        InventoryItem(
+            item_id="old",
+            name="oat milk",
+            expiration_date_estimated=date(2024, 1, 9),
+            expiration_date_user_override=None,
+        ),
+        InventoryItem(
+            item_id="fresh",
+            name="pasta",
+            expiration_date_estimated=date(2024, 1, 11),
+            expiration_date_user_override=None,
+        ),
+    ]
+    recipes = [
+        RecipeCandidate(
+            recipe_id="latte",
+            title="Latte",
+            servings=1,
+            ingredients=[Ingredient(name="oat milk", amount=1, unit="cup")],
+            instructions=["Steam."],
+        ),
+        RecipeCandidate(
+            recipe_id="pasta",
+            title="Pasta",
+            servings=2,
+            ingredients=[
+                Ingredient(name="pasta", amount=200, unit="g"),
+                Ingredient(name="pasta", amount=100, unit="g"),
+            ],
+            instructions=["Boil."],
+        ),
+    ]
+
+    scored = score_recipes(recipes, inventory, now)
+
+    assert [(r.recipe_id, score) for r, score in scored] == [("pasta", 10)]
@@ -0,0 +1,63 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.db.models import InventoryItem
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.scoring import score_recipes, urgency_points
+from app.services.scoring_numpy import urgency_points_array
+
+
+_WORDS = ["oat", "milk", "pasta", "rice", "tomato", "sauce", "peas", "eggs", "to"]
+
+
+def _name(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 2)))
+
+
+def test_urgency_points_array_matches_scalar_buckets() -> None:
+    days = list(range(0, 30))
+    assert urgency_points_array(np.asarray(days)).tolist() == [urgency_points(d) for d in days]
+
+
+def test_numpy_engine_matches_python_engine_rankings() -> None:
+    rng = random.Random(3)
+    now = datetime(2024, 5, 5, 9, 0, 0)
+
+    for _ in range(200):
+        inventory = [
+            InventoryItem(
+                item_id=f"item-{i}",
+                name=_name(rng),
+                expiration_date_estimated=now.date() + timedelta(days=rng.randint(-2, 10)),
+                expiration_date_user_override=(
+                    now.date() + timedelta(days=rng.randint(-2, 10)) if rng.random() < 0.2 else None
+                ),
+            )
+            for i in range(rng.randint(0, 10))
+        ]
+        recipes = [
+            RecipeCandidate(
+                recipe_id=f"r{i}",
+                title=f"Recipe {i}",
+                servings=2,
+                ingredients=[
+                    Ingredient(name=_name(rng), amount=1, unit="cup")
+                    for _ in range(rng.randint(0, 4))
+                ],
+                instructions=["Cook."],
+            )
+            for i in range(rng.randint(0, 25))
+        ]
+
+        expected = score_recipes(recipes, inventory, now, engine="python")
+        actual = score_recipes(recipes, inventory, now, engine="numpy")
+        assert [(r.recipe_id, s) for r, s in actual] == [(r.recipe_id, s) for r, s in expected]
+
+
+def test_score_recipes_rejects_unknown_engine() -> None:
+    with pytest.raises(ValueError):
+        score_recipes([], [], datetime(2024, 1, 1), engine="gpu")
@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.models import InventoryItem
+from app.schemas.recipe import Ingredient, RecipeCandidate
+from app.services.scoring import RecipeScorer, score_recipes, select_top_k
+
+
+_WORDS = ["oat", "milk", "pasta", "rice", "tomato", "sauce", "peas", "eggs"]
+
+
+def _pool(rng: random.Random, now: datetime) -> tuple[list[InventoryItem], list[RecipeCandidate]]:
+    inventory = [
+        InventoryItem(
+            item_id=f"item-{i}",
+            name=rng.choice(_WORDS),
+            expiration_date_estimated=now.date() + timedelta(days=rng.randint(-1, 9)),
+            expiration_date_user_override=None,
+        )
+        for i in range(rng.randint(0, 8))
+    ]
+    recipes = [
+        RecipeCandidate(
+            recipe_id=f"r{i}",
+            title=f"Recipe {i}",
+            servings=2,
+            ingredients=[
+                Ingredient(name=rng.choice(_WORDS), amount=1, unit="cup")
+                for _ in range(rng.randint(0, 4))
+            ],
+            instructions=["Cook."],
+        )
+        for i in range(rng.randint(0, 40))
+    ]
+    return inventory, recipes
+
+
+@pytest.mark.parametrize("k", [1, 5, 50])
+def test_select_top_k_matches_stable_sort(k: int) -> None:
+    rng = random.Random(k)
+    now = datetime(2024, 2, 2, 8, 0, 0)
+
+    for _ in range(200):
+        inventory, recipes = _pool(rng, now)
+
+        scored = score_recipes(recipes, inventory, now)
+        scored.sort(key=lambda x: -x[1])
+        expected = [(r.recipe_id, s) for r, s in scored[:k]]
+
+        actual = select_top_k(recipes, inventory, now, k=k)
+        assert [(r.recipe_id, s) for r, s in actual] == expected
+
+
+def test_select_top_k_skips_recipes_that_cannot_beat_kth_best(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime(2024, 2, 2, 8, 0, 0)
+    inventory = [
+        InventoryItem(
+            item_id="milk",
+            name="milk",
+            expiration_date_estimated=now.date(),
+            expiration_date_user_override=None,
+        )
+    ]
+    strong = RecipeCandidate(
+        recipe_id="strong",
+        title="Strong",
+        servings=1,
+        ingredients=[Ingredient(name="milk", amount=1, unit="cup")] * 2,
+        instructions=["Pour."],
+    )
+    weak = [
+        RecipeCandidate(
+            recipe_id=f"weak-{i}",
+            title="Weak",
+            servings=1,
+            ingredients=[Ingredient(name="milk", amount=1, unit="cup")],
+            instructions=["Pour."],
+        )
+        for i in range(10)
+    ]
+
+    scored: list[str] = []
+    original = RecipeScorer.score_names
+
+    def spy(self, names):
+        names = list(names)
+        scored.append(len(names))
+        return original(self, names)
+
+    monkeypatch.setattr(RecipeScorer, "score_names", spy)
+
+    result = select_top_k([strong] + weak, inventory, now, k=1)
+
+    assert [(r.recipe_id, s) for r, s in result] == [("strong", 10)]
+    assert scored == [2]